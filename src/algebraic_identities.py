@@ -1,16 +1,60 @@
 from manim import *
 
 
+# ========== GEOMETRY ==========
+def sum_square_geometry(lengths):
+    """
+    Pieces of the (a + b)² square for every (a, b) pair in ``lengths``, computed at once.
+
+    The big square is centred at the origin. Returns a dict of arrays with
+    one row per pair: ``side`` (a + b), ``outer`` (n, 2, 2) with the lower
+    left and upper right corners of the big square, and for the pieces a²,
+    b², the ab rectangle on the right and the ab rectangle on top:
+    ``boxes`` (n, 4, 2, 2) with their corners, ``centers`` (n, 4, 3) and
+    ``sizes`` (n, 4, 2) with their widths and heights.
+    """
+    lengths = np.asarray(lengths, dtype=float).reshape(-1, 2)
+    if len(lengths) == 0 or not np.all(lengths > 0):
+        raise ValueError(f"Side lengths must be positive, got {lengths.tolist()}")
+    a, b = lengths[:, 0], lengths[:, 1]
+    sizes = np.stack([
+        np.stack([a, a], axis=1),  # a²
+        np.stack([b, b], axis=1),  # b²
+        np.stack([b, a], axis=1),  # ab, right
+        np.stack([a, b], axis=1),  # ab, top
+    ], axis=1)
+    # a² sits in the lower left corner, b² in the upper right one
+    centers = np.zeros((len(lengths), 4, 3))
+    centers[:, :, :2] = np.stack([
+        np.stack([-b, -b], axis=1),
+        np.stack([a, a], axis=1),
+        np.stack([a, -b], axis=1),
+        np.stack([-b, a], axis=1),
+    ], axis=1) / 2
+    boxes = np.stack([centers[..., :2] - sizes / 2, centers[..., :2] + sizes / 2], axis=2)
+    half_side = (a + b)[:, None] / 2
+    return {
+        "side": a + b,
+        "outer": np.stack([-half_side.repeat(2, axis=1), half_side.repeat(2, axis=1)], axis=1),
+        "boxes": boxes,
+        "centers": centers,
+        "sizes": sizes,
+    }
+
+
 class SumSquare(Scene):
     """
     Geometric demonstration of the square of a sum formula: (a + b)² = a² + 2ab + b²
     Uses area decomposition of a square into smaller squares and rectangles.
     """
 
+    # Lengths (a, b) of the sides of the square, also checked by
+    # `python -m tools.verify_geometry`
+    LENGTHS = (2.0, 1.0)
+
     def construct(self):
         # ========== PARAMETERS INITIALIZATION ==========
-        LENGTH_A = 2.0  # Length of side a
-        LENGTH_B = 1.0  # Length of side b
+        LENGTH_A, LENGTH_B = self.LENGTHS  # Lengths of sides a and b
 
         # ========== TITLE AND INTRODUCTION ==========
         title = MathTex(r"\text{Square of a Sum: } (a+b)^2").to_edge(UP)
@@ -24,41 +68,43 @@ class SumSquare(Scene):
         # ========== GEOMETRIC CONSTRUCTION ==========
         # Position the large square at origin
         square_origin = ORIGIN
+        geometry = sum_square_geometry([(LENGTH_A, LENGTH_B)])
+        centers, sizes = geometry["centers"][0], geometry["sizes"][0]
 
         # Construct the four components of the large square
         # Large square representing a²
         square_a2 = Square(
-            side_length=LENGTH_A,
+            side_length=sizes[0, 0],
             color=WHITE,
             fill_color=COLOR_A_SQUARE,
             fill_opacity=0.7
-        ).move_to(square_origin + LEFT * LENGTH_B / 2 + DOWN * LENGTH_B / 2)
+        ).move_to(square_origin + centers[0])
 
         # Small square representing b²
         square_b2 = Square(
-            side_length=LENGTH_B,
+            side_length=sizes[1, 0],
             color=WHITE,
             fill_color=COLOR_B_SQUARE,
             fill_opacity=0.7
-        ).move_to(square_origin + RIGHT * LENGTH_A / 2 + UP * LENGTH_A / 2)
+        ).move_to(square_origin + centers[1])
 
         # First rectangle representing ab
         rectangle_ab1 = Rectangle(
-            width=LENGTH_B,
-            height=LENGTH_A,
+            width=sizes[2, 0],
+            height=sizes[2, 1],
             color=WHITE,
             fill_color=COLOR_AB_RECTANGLE,
             fill_opacity=0.7
-        ).move_to(square_origin + RIGHT * LENGTH_A / 2 + DOWN * LENGTH_B / 2)
+        ).move_to(square_origin + centers[2])
 
         # Second rectangle representing ab
         rectangle_ab2 = Rectangle(
-            width=LENGTH_A,
-            height=LENGTH_B,
+            width=sizes[3, 0],
+            height=sizes[3, 1],
             color=WHITE,
             fill_color=COLOR_AB_RECTANGLE,
             fill_opacity=0.7
-        ).move_to(square_origin + LEFT * LENGTH_B / 2 + UP * LENGTH_A / 2)
+        ).move_to(square_origin + centers[3])
 
         # ========== AREA LABELS ==========
         label_a2 = MathTex("a^2").move_to(square_a2.get_center())
@@ -1,21 +1,162 @@
 from manim import *
-import math
+
+
+# ========== GEOMETRY ==========
+# Corner of the outer square holding each triangle, as signs of (x, y):
+# bottom-left, bottom-right, top-right and top-left
+CORNER_SIGNS = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]])
+# Whether the horizontal leg of each triangle is b (otherwise it is a)
+HORIZONTAL_LEG_IS_B = np.array([True, False, True, False])
+# Largest outer square that fits between the title and the formulas
+MAX_OUTER_SQUARE_SIDE = 4.0
+# Distance of the c label from its brace, along the normal of the hypotenuse
+HYPOTENUSE_LABEL_OFFSET = 0.5
+
+
+def checked_legs(legs):
+    """``legs`` as an (n, 2) array; raises ValueError unless there is a pair and every leg is positive."""
+    legs = np.asarray(legs, dtype=float).reshape(-1, 2)
+    if len(legs) == 0 or not np.all(legs > 0):
+        raise ValueError(f"Leg lengths must be positive, got {legs.tolist()}")
+    return legs
+
+
+def pythagorean_geometry(legs):
+    """
+    Geometry of the proof for every (a, b) pair in ``legs``, computed at once.
+
+    Returns a dict of arrays with one row per configuration:
+    ``outer_side``, ``hypotenuse`` and ``rotation`` (the angle of the central
+    square), ``triangles`` (n, 4, 3, 3) with the vertices of the four
+    triangles, right angle first, ``outer_square`` and ``central_square``
+    (n, 4, 3) with the corners the squares are drawn through, and ``braces``
+    (n, 3, 2, 3) with the end points of the sides a, b and c of the
+    bottom-left triangle.
+    """
+    legs = checked_legs(legs)
+    a, b = legs[:, 0], legs[:, 1]
+    horizontal = np.where(HORIZONTAL_LEG_IS_B, b[:, None], a[:, None])  # (n, 4)
+    vertical = np.where(HORIZONTAL_LEG_IS_B, a[:, None], b[:, None])
+    corners = CORNER_SIGNS * ((a + b) / 2)[:, None, None]  # (n, 4, 2)
+
+    # Every triangle starts at its corner and its legs run inwards
+    triangles = np.zeros((len(legs), 4, 3, 3))
+    triangles[..., :2] = corners[:, :, None, :]
+    triangles[:, :, 1, 0] -= CORNER_SIGNS[:, 0] * horizontal
+    triangles[:, :, 2, 1] -= CORNER_SIGNS[:, 1] * vertical
+
+    # The right angles are the corners of the outer square; the other
+    # vertices meet at the corners of the central square
+    outer_square = triangles[:, :, 0]
+    central_square = triangles[:, np.arange(4), [1, 2, 1, 2]]
+
+    bottom_left = triangles[:, 0]
+    braces = np.stack([
+        bottom_left[:, [0, 2]],  # a: vertical leg
+        bottom_left[:, [0, 1]],  # b: horizontal leg
+        bottom_left[:, [2, 1]],  # c: hypotenuse
+    ], axis=1)
+    return {
+        "outer_side": a + b,
+        "hypotenuse": np.hypot(a, b),
+        "rotation": np.arctan2(b, a),
+        "triangles": triangles,
+        "outer_square": outer_square,
+        "central_square": central_square,
+        "braces": braces,
+        # Unit normal of the hypotenuse of the bottom-left triangle, pointing
+        # into the central square
+        "normal": np.stack([a, b, np.zeros_like(a)], axis=1) / np.hypot(a, b)[:, None],
+    }
+
+
+def corner_points(corners, points_per_curve):
+    """Bézier points of the closed polygon through ``corners``, as ``Polygon`` sets them."""
+    closed = np.concatenate([corners, corners[:1]])
+    alphas = np.linspace(0, 1, points_per_curve)[None, :, None]
+    return (closed[:-1, None] + alphas * (closed[1:] - closed[:-1])[:, None]).reshape(-1, 3)
+
+
+def write_points(mobject, points):
+    """Overwrite the points of ``mobject`` in place, without building a new mobject."""
+    if points.shape == mobject.points.shape and not hasattr(mobject, "refresh_triangulation"):
+        mobject.points[:] = points
+    else:
+        # OpenGL copies in place as well, and updates its fill triangulation
+        mobject.set_points(points)
+
+
+class BraceShape:
+    """
+    Points of a ``Brace`` of any length, without building a new one.
+
+    Above its minimum length a brace only lengthens its two straight parts,
+    so its points are an affine function of the length, taken from two
+    braces built once. Shorter braces are the shortest one compressed.
+    """
+
+    # manim draws braces from a path at least this wide (default_min_width)
+    MIN_PATH_WIDTH = 0.90552
+
+    def __init__(self, buff=0.15, sharpness=2):
+        self.min_length = self.MIN_PATH_WIDTH / sharpness
+        self.reference_lengths = (1.0, 2.0)
+        self.reference_points = [
+            Brace(Line(ORIGIN, length * RIGHT), DOWN, buff=buff, sharpness=sharpness).points.copy()
+            for length in self.reference_lengths
+        ]
+
+    def points(self, start, end, direction):
+        """Points of the brace of the segment from ``start`` to ``end``, on its ``direction`` side."""
+        length = np.linalg.norm(end - start)
+        unit = (end - start) / length
+        # The reference braces lie clockwise from their segment
+        if np.dot(direction[:2], [unit[1], -unit[0]]) < 0:
+            start, unit = end, -unit
+        (first, second), (first_length, second_length) = self.reference_points, self.reference_lengths
+        alpha = (max(length, self.min_length) - first_length) / (second_length - first_length)
+        points = first + alpha * (second - first)
+        if length < self.min_length:
+            points = points * [length / self.min_length, 1, 1]
+        perpendicular = np.array([-unit[1], unit[0], 0.0])
+        return start + points[:, :1] * unit + points[:, 1:2] * perpendicular
 
 
 class PythagoreanTheorem(Scene):
+    # Leg lengths (a, b) of each configuration: the proof is built on the
+    # first one and the generality demonstration moves through the others.
+    # Other configurations are rendered with `python -m tools.variants`.
+    LEGS = [(2.0, 1.2), (1.5, 2.5)]
+
+    def measurement_braces(self, brace_ends):
+        """Braces and labels of the sides a, b and c from their end points."""
+        vertical_side, horizontal_side, hypotenuse_side = (Line(*ends) for ends in brace_ends)
+        brace_vertical = Brace(vertical_side, LEFT, buff=0.15)
+        brace_horizontal = Brace(horizontal_side, DOWN, buff=0.15)
+        # The hypotenuse brace points into the central square
+        normal = hypotenuse_side.copy().rotate(PI / 2).get_unit_vector()
+        brace_hypotenuse = Brace(hypotenuse_side, direction=normal, buff=0.15)
+        brace_hypotenuse_label = brace_hypotenuse.get_tex("c")
+        # Move the label clear of the brace tip for better visibility
+        brace_hypotenuse_label.move_to(brace_hypotenuse.get_center() + normal * HYPOTENUSE_LABEL_OFFSET)
+        return (
+            brace_vertical, brace_vertical.get_tex("a"),
+            brace_horizontal, brace_horizontal.get_tex("b"),
+            brace_hypotenuse, brace_hypotenuse_label,
+        )
+
     def construct(self):
-        # ========== INITIAL PARAMETERS ==========
-        # Initial triangle dimensions for the first demonstration
-        LEG_A = 2.0  # Length of first leg
-        LEG_B = 1.2  # Length of second leg
-        OUTER_SQUARE_SIDE = LEG_A + LEG_B  # Side length of large containing square
-        HYPOTENUSE = math.sqrt(LEG_A ** 2 + LEG_B ** 2)  # Calculated hypotenuse length
-        ROTATION_ANGLE = math.atan2(LEG_B, LEG_A)  # Angle to align central square
+        # Fail on invalid legs before rendering anything. They are read
+        # through the class: the section cache keys a section on the
+        # parameters it reads as self.<NAME>, and the preface, which does
+        # not depend on the legs, stays shared between variants
+        checked_legs(type(self).LEGS)
 
         # ==========================================================
         # GEOMETRIC–ALGEBRAIC PREFACE (logical context explanation)
         # ==========================================================
         # Introduce the geometric and algebraic interpretation of the theorem
+        self.next_section("preface")
 
         preface_title = Tex(
             "Mathematical Context of the Pythagorean Theorem", font_size=40
@@ -85,60 +226,32 @@ class PythagoreanTheorem(Scene):
         )
 
         # ========== GEOMETRIC CONSTRUCTION ==========
-        # Create the outer square that frames the entire proof
-        outer_square = Square(side_length=OUTER_SQUARE_SIDE)
-        outer_square.set_stroke(width=3).set_fill(opacity=0)
-        outer_square.move_to(ORIGIN)  # Center for visual symmetry
+        self.next_section("construction")
 
-        # Calculate precise vertex coordinates for triangle placement
-        HALF_SIDE = OUTER_SQUARE_SIDE / 2
-        VERTEX_BOTTOM_LEFT = np.array([-HALF_SIDE, -HALF_SIDE, 0])
-        VERTEX_BOTTOM_RIGHT = np.array([HALF_SIDE, -HALF_SIDE, 0])
-        VERTEX_TOP_RIGHT = np.array([HALF_SIDE, HALF_SIDE, 0])
-        VERTEX_TOP_LEFT = np.array([-HALF_SIDE, HALF_SIDE, 0])
+        # ========== INITIAL PARAMETERS ==========
+        # Geometry of every configuration in one vectorised step, scaled
+        # down together if the largest outer square would not fit
+        legs = checked_legs(self.LEGS)
+        legs *= min(1.0, MAX_OUTER_SQUARE_SIDE / legs.sum(axis=1).max())
+        geometry = pythagorean_geometry(legs)
+
+        # Create the outer square that frames the entire proof, centred at
+        # the origin for visual symmetry; its corners are the right angles
+        outer_square = Polygon(*geometry["outer_square"][0], color=WHITE)
+        outer_square.set_stroke(width=3).set_fill(opacity=0)
 
         # Construct four congruent right triangles at each corner
-        # Each triangle has legs of lengths LEG_A and LEG_B in different orientations
-
-        # Bottom-left triangle (blue)
-        triangle_bottom_left = Polygon(
-            VERTEX_BOTTOM_LEFT,
-            VERTEX_BOTTOM_LEFT + np.array([LEG_B, 0, 0]),  # Horizontal leg
-            VERTEX_BOTTOM_LEFT + np.array([0, LEG_A, 0]),  # Vertical leg
-            stroke_width=2,
-            fill_opacity=0.5,
-        ).set_fill(BLUE)
-
-        # Bottom-right triangle (purple)
-        triangle_bottom_right = Polygon(
-            VERTEX_BOTTOM_RIGHT,
-            VERTEX_BOTTOM_RIGHT + np.array([-LEG_A, 0, 0]),  # Horizontal leg left
-            VERTEX_BOTTOM_RIGHT + np.array([0, LEG_B, 0]),  # Vertical leg up
-            stroke_width=2,
-            fill_opacity=0.5,
-        ).set_fill(PURPLE)
-
-        # Top-right triangle (green)
-        triangle_top_right = Polygon(
-            VERTEX_TOP_RIGHT,
-            VERTEX_TOP_RIGHT + np.array([-LEG_B, 0, 0]),  # Horizontal leg left
-            VERTEX_TOP_RIGHT + np.array([0, -LEG_A, 0]),  # Vertical leg down
-            stroke_width=2,
-            fill_opacity=0.5,
-        ).set_fill(GREEN)
-
-        # Top-left triangle (light pink)
-        triangle_top_left = Polygon(
-            VERTEX_TOP_LEFT,
-            VERTEX_TOP_LEFT + np.array([LEG_A, 0, 0]),  # Horizontal leg right
-            VERTEX_TOP_LEFT + np.array([0, -LEG_B, 0]),  # Vertical leg down
-            stroke_width=2,
-            fill_opacity=0.5,
-        ).set_fill(LIGHT_PINK)
+        # Each triangle has legs of lengths a and b in different orientations:
+        # bottom-left (blue), bottom-right (purple), top-right (green) and
+        # top-left (light pink)
+        triangles = [
+            Polygon(*vertices, stroke_width=2, fill_opacity=0.5).set_fill(color)
+            for vertices, color in zip(geometry["triangles"][0], [BLUE, PURPLE, GREEN, LIGHT_PINK])
+        ]
+        triangle_bottom_left, triangle_bottom_right, triangle_top_right, triangle_top_left = triangles
 
         # Central square formed by the hypotenuses
-        central_square = Square(side_length=HYPOTENUSE)
-        central_square.rotate(ROTATION_ANGLE).move_to(ORIGIN)
+        central_square = Polygon(*geometry["central_square"][0], color=WHITE)
         central_square.set_stroke(width=3).set_fill(TEAL, opacity=0.6)
 
         # ========== LABELS AND ANNOTATIONS ==========
@@ -146,31 +259,11 @@ class PythagoreanTheorem(Scene):
         title = Tex("Geometric Proof: Pythagorean Theorem", font_size=40).to_edge(UP)
 
         # Measurement braces for the bottom-left triangle
-        brace_vertical = Brace(
-            Line(VERTEX_BOTTOM_LEFT, VERTEX_BOTTOM_LEFT + np.array([0, LEG_A, 0])),
-            LEFT, buff=0.15
-        )
-        brace_vertical_label = brace_vertical.get_tex("a")
-
-        brace_horizontal = Brace(
-            Line(VERTEX_BOTTOM_LEFT, VERTEX_BOTTOM_LEFT + np.array([LEG_B, 0, 0])),
-            DOWN, buff=0.15
-        )
-        brace_horizontal_label = brace_horizontal.get_tex("b")
-
-        # Hypotenuse brace with careful positioning
-        hypotenuse_segment = Line(
-            VERTEX_BOTTOM_LEFT + np.array([0, LEG_A, 0]),
-            VERTEX_BOTTOM_LEFT + np.array([LEG_B, 0, 0])
-        )
-        brace_hypotenuse = Brace(
-            hypotenuse_segment,
-            direction=hypotenuse_segment.copy().rotate(PI / 2).get_unit_vector(),
-            buff=0.15
-        )
-        brace_hypotenuse_label = brace_hypotenuse.get_tex("c")
-        # Adjust label position for better visibility
-        brace_hypotenuse_label.move_to(brace_hypotenuse.get_center() + UP * 0.3 + RIGHT * 0.375)
+        (
+            brace_vertical, brace_vertical_label,
+            brace_horizontal, brace_horizontal_label,
+            brace_hypotenuse, brace_hypotenuse_label,
+        ) = self.measurement_braces(geometry["braces"][0])
 
         # ========== PROOF DEMONSTRATION SEQUENCE ==========
         # Begin with title presentation
@@ -222,6 +315,8 @@ class PythagoreanTheorem(Scene):
         self.wait(0.5)
 
         # ========== ALGEBRAIC DERIVATION ==========
+        self.next_section("algebraic_derivation")
+
         # Step 1: Area equivalence equation
         area_equation = MathTex(
             r"(a+b)^2 = 4\cdot\left(\tfrac{1}{2}ab\right) + c^2",
@@ -255,149 +350,101 @@ class PythagoreanTheorem(Scene):
         self.wait(2.0)
 
         # ========== GENERALITY DEMONSTRATION ==========
-        # Show that the theorem holds for different triangle dimensions
-        dimension_change_announcement = Tex(
-            "Now we change the dimensions of $a$ and $b$",
-            font_size=30
-        ).to_edge(UP, buff=1.0)
-        self.play(Write(dimension_change_announcement))
-        self.wait(1.0)
-
-        # New triangle dimensions for generality demonstration
-        NEW_LEG_A = 1.5
-        NEW_LEG_B = 2.5
-
-        # Recalculate geometric properties with new dimensions
-        NEW_OUTER_SQUARE_SIDE = NEW_LEG_A + NEW_LEG_B
-        NEW_HYPOTENUSE = math.sqrt(NEW_LEG_A ** 2 + NEW_LEG_B ** 2)
-        NEW_ROTATION_ANGLE = math.atan2(NEW_LEG_B, NEW_LEG_A)
-
-        # Update vertex coordinates for new configuration
-        NEW_HALF_SIDE = NEW_OUTER_SQUARE_SIDE / 2
-        NEW_BOTTOM_LEFT = np.array([-NEW_HALF_SIDE, -NEW_HALF_SIDE, 0])
-        NEW_BOTTOM_RIGHT = np.array([NEW_HALF_SIDE, -NEW_HALF_SIDE, 0])
-        NEW_TOP_RIGHT = np.array([NEW_HALF_SIDE, NEW_HALF_SIDE, 0])
-        NEW_TOP_LEFT = np.array([-NEW_HALF_SIDE, NEW_HALF_SIDE, 0])
-
-        # Update all triangle positions for new dimensions
-        triangle_bottom_left.generate_target()
-        triangle_bottom_left.target.set_points_as_corners([
-            NEW_BOTTOM_LEFT,
-            NEW_BOTTOM_LEFT + np.array([NEW_LEG_B, 0, 0]),
-            NEW_BOTTOM_LEFT + np.array([0, NEW_LEG_A, 0])
-        ])
-
-        triangle_bottom_right.generate_target()
-        triangle_bottom_right.target.set_points_as_corners([
-            NEW_BOTTOM_RIGHT,
-            NEW_BOTTOM_RIGHT + np.array([-NEW_LEG_A, 0, 0]),
-            NEW_BOTTOM_RIGHT + np.array([0, NEW_LEG_B, 0])
-        ])
-
-        triangle_top_right.generate_target()
-        triangle_top_right.target.set_points_as_corners([
-            NEW_TOP_RIGHT,
-            NEW_TOP_RIGHT + np.array([-NEW_LEG_B, 0, 0]),
-            NEW_TOP_RIGHT + np.array([0, -NEW_LEG_A, 0])
-        ])
-
-        triangle_top_left.generate_target()
-        triangle_top_left.target.set_points_as_corners([
-            NEW_TOP_LEFT,
-            NEW_TOP_LEFT + np.array([NEW_LEG_A, 0, 0]),
-            NEW_TOP_LEFT + np.array([0, -NEW_LEG_B, 0])
-        ])
-
-        # Remove old measurement annotations
-        self.play(
-            FadeOut(brace_vertical), FadeOut(brace_vertical_label),
-            FadeOut(brace_horizontal), FadeOut(brace_horizontal_label),
-            FadeOut(brace_hypotenuse), FadeOut(brace_hypotenuse_label)
-        )
-        self.wait(0.3)
+        self.next_section("generality")
 
-        # Create new measurement braces for updated configuration
-        new_brace_vertical = Brace(
-            Line(NEW_BOTTOM_LEFT, NEW_BOTTOM_LEFT + np.array([0, NEW_LEG_A, 0])),
-            LEFT, buff=0.15
-        )
-        new_brace_vertical_label = new_brace_vertical.get_tex("a")
-
-        new_brace_horizontal = Brace(
-            Line(NEW_BOTTOM_LEFT, NEW_BOTTOM_LEFT + np.array([NEW_LEG_B, 0, 0])),
-            DOWN, buff=0.15
-        )
-        new_brace_horizontal_label = new_brace_horizontal.get_tex("b")
-
-        new_hypotenuse_segment = Line(
-            NEW_BOTTOM_LEFT + np.array([0, NEW_LEG_A, 0]),
-            NEW_BOTTOM_LEFT + np.array([NEW_LEG_B, 0, 0])
-        )
-        new_brace_hypotenuse = Brace(
-            new_hypotenuse_segment,
-            direction=new_hypotenuse_segment.copy().rotate(PI / 2).get_unit_vector(),
-            buff=0.15
-        )
-        new_brace_hypotenuse_label = new_brace_hypotenuse.get_tex("c")
-        new_brace_hypotenuse_label.move_to(new_brace_hypotenuse.get_center() + UP * 0.45 + RIGHT * 0.25)
-
-        # Update central and outer squares
-        central_square.generate_target()
-        central_square.target.become(
-            Square(side_length=NEW_HYPOTENUSE)
-            .rotate(NEW_ROTATION_ANGLE)
-            .move_to(ORIGIN)
-            .set_fill(TEAL, opacity=0.6)
-        )
-
-        outer_square.generate_target()
-        outer_square.target.become(
-            Square(side_length=NEW_OUTER_SQUARE_SIDE)
-            .set_stroke(width=3)
-            .move_to(ORIGIN)
-        )
-
-        # Adjust area formula position
-        self.play(area_outer_formula.animate.shift(UP * 0.35))
-
-        # Animate transformation to new configuration
-        self.play(
-            MoveToTarget(triangle_bottom_left),
-            MoveToTarget(triangle_bottom_right),
-            MoveToTarget(triangle_top_right),
-            MoveToTarget(triangle_top_left),
-            MoveToTarget(central_square),
-            MoveToTarget(outer_square),
-            run_time=3.0
-        )
-
-        # Emphasize the invariant nature of the theorem
-        invariance_statement = Tex(
-            "Even though the sides change, \\\\ the relationship $a^2 + b^2 = c^2$ \\\\ remains true!",
-            font_size=30
-        ).shift(LEFT * 4.5)
-
-        # Display new measurement annotations
-        self.play(
-            FadeIn(new_brace_vertical),
-            FadeIn(new_brace_vertical_label),
-            FadeIn(new_brace_horizontal),
-            FadeIn(new_brace_horizontal_label),
-            FadeIn(new_brace_hypotenuse),
-            FadeIn(new_brace_hypotenuse_label),
-            run_time=1.5
-        )
-
-        # Conclude with the universal validity statement and the final conclusion
-        self.play(Write(invariance_statement))
-        self.wait(2.0)
+        # Show that the theorem holds for different triangle dimensions
+        if len(legs) > 1:
+            dimension_change_announcement = Tex(
+                "Now we change the dimensions of $a$ and $b$",
+                font_size=30
+            ).to_edge(UP, buff=1.0)
+            self.play(Write(dimension_change_announcement))
+            self.wait(1.0)
+
+            # Emphasize the invariant nature of the theorem
+            invariance_statement = Tex(
+                "Even though the sides change, \\\\ the relationship $a^2 + b^2 = c^2$ \\\\ remains true!",
+                font_size=30
+            ).shift(LEFT * 4.5)
+
+            # A tracker runs through the configurations: at 1.5 the legs are
+            # halfway between the second and the third one
+            legs_tracker = ValueTracker(0)
+            sweep = {}
+
+            def current_geometry():
+                # One vectorised step per frame, shared by all the updaters
+                position = legs_tracker.get_value()
+                if sweep.get("position") != position:
+                    index = min(int(position), len(legs) - 2)
+                    sweep["position"] = position
+                    sweep["geometry"] = pythagorean_geometry(
+                        interpolate(legs[index], legs[index + 1], position - index)
+                    )
+                return sweep["geometry"]
+
+            def corner_updater(key, index=None):
+                def update(mob):
+                    corners = current_geometry()[key][0]
+                    if index is not None:
+                        corners = corners[index]
+                    write_points(mob, corner_points(corners, mob.n_points_per_curve))
+                return update
+
+            def brace_updater(index, direction=None):
+                def update(mob):
+                    geometry = current_geometry()
+                    side_direction = geometry["normal"][0] if direction is None else direction
+                    write_points(mob, brace_shape.points(*geometry["braces"][0, index], side_direction))
+                return update
+
+            # Every frame the shapes and braces get new points in place, and
+            # the labels and the area formula follow them
+            brace_shape = BraceShape(buff=0.15)
+            for index, triangle in enumerate(triangles):
+                triangle.add_updater(corner_updater("triangles", index))
+            central_square.add_updater(corner_updater("central_square"))
+            outer_square.add_updater(corner_updater("outer_square"))
+            brace_vertical.add_updater(brace_updater(0, LEFT))
+            brace_horizontal.add_updater(brace_updater(1, DOWN))
+            brace_hypotenuse.add_updater(brace_updater(2))
+            brace_vertical_label.add_updater(lambda mob: brace_vertical.put_at_tip(mob))
+            brace_horizontal_label.add_updater(lambda mob: brace_horizontal.put_at_tip(mob))
+            brace_hypotenuse_label.add_updater(
+                lambda mob: mob.move_to(
+                    brace_hypotenuse.get_center() + current_geometry()["normal"][0] * HYPOTENUSE_LABEL_OFFSET
+                )
+            )
+            area_outer_formula.add_updater(lambda mob: mob.next_to(outer_square, UP, buff=0.25))
+            figure = [
+                *triangles, central_square, outer_square,
+                brace_vertical, brace_horizontal, brace_hypotenuse,
+                brace_vertical_label, brace_horizontal_label, brace_hypotenuse_label,
+                area_outer_formula,
+            ]
+
+            for index in range(1, len(legs)):
+                # Sweep a and b continuously to the next configuration
+                self.play(legs_tracker.animate.set_value(index), run_time=3.0)
+
+                # Conclude the first change with the universal validity statement
+                if index == 1:
+                    self.play(Write(invariance_statement))
+                    self.wait(2.0)
+                else:
+                    self.wait(1.0)
+
+            for mob in figure:
+                mob.clear_updaters()
 
         self.play(
             *[FadeOut(mob) for mob in self.mobjects],
             run_time=1.5
         )
 
-        # Final conclusion
+        # ========== FINAL CONCLUSION ==========
+        self.next_section("conclusion")
+
         final_conclusion = Tex(
             "Therefore, in any right triangle:\\\\"
             r"$c^2 = a^2 + b^2$",
@@ -1,8 +1,78 @@
 from manim import *
 
 
+# ========== GEOMETRY ==========
+# Room for the construction, on the left of the derivation
+MAX_FIGURE_WIDTH = 3.0
+MAX_FIGURE_HEIGHT = 3.0
+# Largest side of the x² square, for small values of p
+MAX_UNIT = 1.2
+
+
+def completing_square_geometry(a, b, c):
+    """
+    Sizes and layout of the completing-the-square construction for a x² + b x + c = 0.
+
+    Returns the normalized coefficients ``p`` and ``q`` and, in scene units,
+    the side of the x² square (``unit``, the length drawn for x), the width
+    of the p·x rectangle, of each of its halves, and the side of the (p/2)²
+    square. The unit is the largest that fits the construction in its part
+    of the frame. ``boxes`` holds the lower left and upper right corners of
+    every piece, relative to the lower left corner of the x² square.
+
+    The coefficients may also be arrays, for many equations at once; every
+    value then has one row per equation.
+    """
+    a, b, c = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (a, b, c)))
+    if not np.all(np.isfinite([a, b, c])):
+        raise ValueError(f"The coefficients must be finite numbers, got a={a}, b={b}, c={c}")
+    if not (np.all(a > 0) and np.all(b > 0)):
+        raise ValueError(f"The geometric construction needs a > 0 and b > 0, got a={a}, b={b}")
+    p, q = b / a, c / a
+    # The construction is 1 + p units wide, then 1 + p/2 units high
+    unit = np.minimum.reduce([np.full_like(p, MAX_UNIT), MAX_FIGURE_WIDTH / (1 + p), MAX_FIGURE_HEIGHT / (1 + p / 2)])
+    half_width = p / 2 * unit
+    zero = np.zeros_like(unit)
+
+    def box(x_min, y_min, x_max, y_max):
+        return np.stack([np.stack([x_min, y_min], axis=-1), np.stack([x_max, y_max], axis=-1)], axis=-2)
+
+    return {
+        "p": p,
+        "q": q,
+        "unit": unit,
+        "rectangle_width": p * unit,
+        "half_width": half_width,
+        "completing_side": half_width,
+        "boxes": {
+            "x_squared": box(zero, zero, unit, unit),
+            "px_rectangle": box(unit, zero, unit + p * unit, unit),
+            # The half that stays, and the one moved on top of the x² square
+            "right_half": box(unit, zero, unit + half_width, unit),
+            "moved_half": box(unit + half_width, zero, unit + p * unit, unit),
+            "top_half": box(zero, unit, unit, unit + half_width),
+            "completing_square": box(unit, unit, unit + half_width, unit + half_width),
+            "completed_square": box(zero, zero, unit + half_width, unit + half_width),
+        },
+    }
+
+
+def box_center(box):
+    """Centre of a box from :func:`completing_square_geometry`, as a point."""
+    x, y = box.mean(axis=-2)
+    return np.array([x, y, 0.0])
+
+
 class QuadraticFormula(Scene):
+    # Coefficients (a, b, c) of the equation drawn; the construction needs
+    # a > 0 and b > 0. Other equations are rendered with `python -m tools.variants`.
+    COEFFICIENTS = (1.0, 4.0, 3.0)
+
     def construct(self):
+        # The assumptions and the normalization do not depend on the
+        # coefficients, so variants share this section
+        self.next_section("prelude")
+
         # ========== TITLE AND INTRODUCTION ==========
         title = Tex("Quadratic Formula: Geometric Proof", font_size=36).to_edge(UP)
         self.play(Write(title))
@@ -51,41 +121,48 @@ class QuadraticFormula(Scene):
         self.wait(0.25)
 
         # ========== GEOMETRIC CONSTRUCTION PARAMETERS ==========
-        # Define specific coefficient values for the geometric demonstration
-        # These values are chosen to create clear visual representations
-        COEFFICIENT_A = 1.0
-        COEFFICIENT_B = 4.0
-        COEFFICIENT_C = 3.0
+        self.next_section("construction")
 
-        # Convert to normalized form coefficients for geometric interpretation
-        COEFFICIENT_P = COEFFICIENT_B / COEFFICIENT_A
-        COEFFICIENT_Q = COEFFICIENT_C / COEFFICIENT_A
+        # Coefficients of the equation drawn, converted to the normalized
+        # form and to sizes that fit the frame
+        COEFFICIENT_A, COEFFICIENT_B, COEFFICIENT_C = self.COEFFICIENTS
+        geometry = completing_square_geometry(COEFFICIENT_A, COEFFICIENT_B, COEFFICIENT_C)
+        COEFFICIENT_P = geometry["p"]
+        COEFFICIENT_Q = geometry["q"]
 
         # ========== VISUALIZATION SCALING PARAMETERS ==========
-        VISUALIZATION_SCALE = 0.6  # Base unit for geometric representation
-        X_VISUAL_SIZE = 1.0  # Representative size for variable x
-        BASE_SQUARE_SIDE = X_VISUAL_SIZE * VISUALIZATION_SCALE  # x² square side length
+        VISUALIZATION_SCALE = geometry["unit"]  # Base unit for geometric representation
+        BASE_SQUARE_SIDE = VISUALIZATION_SCALE  # x² square side length, x drawn as one unit
 
         # ========== GEOMETRIC ELEMENTS CONSTRUCTION ==========
         # Create the main square representing x² term (visual foundation)
         x_squared_square = Square(side_length=BASE_SQUARE_SIDE, stroke_width=3)
         x_squared_square.set_fill(RED, opacity=0.5)
         x_squared_square.to_edge(LEFT, buff=1.5)
+        # Every other piece is placed from the layout of the construction
+        construction_origin = x_squared_square.get_corner(DL)
+        boxes = geometry["boxes"]
         x_squared_label = MathTex("x^2").move_to(x_squared_square.get_center())
 
         # Create rectangle representing the linear term p·x
         px_rectangle = Rectangle(
-            width=COEFFICIENT_P * VISUALIZATION_SCALE,
+            width=geometry["rectangle_width"],
             height=BASE_SQUARE_SIDE,
             stroke_width=2
         )
         px_rectangle.set_fill(GREEN, opacity=0.25)
-        px_rectangle.next_to(x_squared_square, RIGHT, buff=0)
+        px_rectangle.move_to(construction_origin + box_center(boxes["px_rectangle"]))
         px_label = MathTex("p x").move_to(px_rectangle)
 
+        # The equation being drawn, under the construction
+        coefficients_label = MathTex(
+            rf"a = {COEFFICIENT_A:g},\ b = {COEFFICIENT_B:g},\ c = {COEFFICIENT_C:g}"
+            rf"\ \Rightarrow\ p = {COEFFICIENT_P:.3g},\ q = {COEFFICIENT_Q:.3g}"
+        ).scale(0.5).next_to(VGroup(x_squared_square, px_rectangle), DOWN, buff=0.5, aligned_edge=LEFT)
+
         # ========== INITIAL GEOMETRIC CONSTRUCTION ANIMATION ==========
         # Display the foundational x² square
-        self.play(Create(x_squared_square), Write(x_squared_label), run_time=1.0)
+        self.play(Create(x_squared_square), Write(x_squared_label), Write(coefficients_label), run_time=1.0)
         self.wait(0.75)
 
         # Add the linear term rectangle
@@ -98,22 +175,22 @@ class QuadraticFormula(Scene):
 
         # First half of the p·x rectangle (remains in position)
         px_half_rect1 = Rectangle(
-            width=(COEFFICIENT_P / 2) * VISUALIZATION_SCALE,
+            width=geometry["half_width"],
             height=BASE_SQUARE_SIDE,
             stroke_width=2
         )
         px_half_rect1.set_fill(GREEN, opacity=0.5)
-        px_half_rect1.next_to(x_squared_square, RIGHT, buff=0)
+        px_half_rect1.move_to(construction_origin + box_center(boxes["right_half"]))
         px_half_label1 = MathTex(r"\frac{p x}{2}").scale(0.5).move_to(px_half_rect1)
 
         # Second half of the p·x rectangle (will be repositioned)
         px_half_rect2 = Rectangle(
-            width=(COEFFICIENT_P / 2) * VISUALIZATION_SCALE,
+            width=geometry["half_width"],
             height=BASE_SQUARE_SIDE,
             stroke_width=2
         )
         px_half_rect2.set_fill(GREEN, opacity=0.5)
-        px_half_rect2.next_to(px_half_rect1, RIGHT, buff=0)
+        px_half_rect2.move_to(construction_origin + box_center(boxes["moved_half"]))
         px_half_label2 = MathTex(r"\frac{p x}{2}").scale(0.5).move_to(px_half_rect2)
 
         # Animate the division into two equal parts
@@ -133,11 +210,11 @@ class QuadraticFormula(Scene):
         # Reposition second half to top to form L-shape (key geometric insight)
         top_half_rectangle = Rectangle(
             width=BASE_SQUARE_SIDE,
-            height=(COEFFICIENT_P / 2) * VISUALIZATION_SCALE,
+            height=geometry["half_width"],
             stroke_width=2
         )
         top_half_rectangle.set_fill(GREEN, opacity=0.5)
-        top_half_rectangle.next_to(x_squared_square, UP, buff=0)
+        top_half_rectangle.move_to(construction_origin + box_center(boxes["top_half"]))
 
         # Transform right rectangle to top position
         self.play(
@@ -152,12 +229,11 @@ class QuadraticFormula(Scene):
         # ========== ADDING THE COMPLETING SQUARE ==========
         # The small square that completes the perfect square: represents (p/2)²
         completing_square = Square(
-            side_length=(COEFFICIENT_P / 2) * VISUALIZATION_SCALE,
+            side_length=geometry["completing_side"],
             stroke_width=2
         )
         completing_square.set_fill(BLUE, opacity=0.5)
-        completing_square.align_to(px_half_rect1, RIGHT)
-        completing_square.next_to(px_half_rect1, UP, buff=0)
+        completing_square.move_to(construction_origin + box_center(boxes["completing_square"]))
         completing_square_label = MathTex(r"\left(\frac{p}{2}\right)^2").move_to(completing_square)
 
         # Display the completing square
@@ -173,6 +249,8 @@ class QuadraticFormula(Scene):
         self.wait(0.75)
 
         # ========== ALGEBRAIC DERIVATION FROM GEOMETRIC INSIGHT ==========
+        self.next_section("derivation")
+
         # Connect the geometric construction to algebraic identity
         completion_identity = MathTex(
             r"x^2 + p x + \left(\frac{p}{2}\right)^2 = \left(x + \frac{p}{2}\right)^2"
@@ -236,6 +314,8 @@ class QuadraticFormula(Scene):
         self.wait(1.5)
 
         # ========== CRITICAL ANALYSIS AND LIMITATIONS ==========
+        self.next_section("limitations")
+
         # Important academic discussion of method limitations
         # Demonstrates research maturity and critical thinking
         self.play(
@@ -248,7 +328,7 @@ class QuadraticFormula(Scene):
             Tex("Limitations of geometric approach:", font_size=30),
             MathTex(r"\bullet\ \text{Only valid for } a > 0, b > 0").scale(0.5),
             MathTex(r"\bullet\ \text{Real domain only}").scale(0.5),
-            MathTex(r"\bullet\ \text{Specific coefficient values}").scale(0.5),
+            MathTex(r"\bullet\ \text{One drawing per choice of coefficients}").scale(0.5),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.25)
 
         limitations_text.set_color(RED)
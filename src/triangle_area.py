@@ -1,6 +1,76 @@
 from manim import *
 
 
+# ========== GEOMETRY ==========
+# A foot closer than this to a base vertex (as a fraction of the base) is on it
+RIGHT_ANGLE_TOLERANCE = 1e-9
+# Box on the left of the frame the figure is scaled into, leaving the right for the formulas
+FIGURE_CENTER = np.array([-4.0, 0.0, 0.0])
+FIGURE_WIDTH = 4.5
+FIGURE_HEIGHT = 4.5
+
+
+def triangle_altitudes(vertices):
+    """
+    Altitude from A onto the base BC of triangles ABC, for any number at once.
+
+    ``vertices`` has shape (..., 3, 2) or (..., 3, 3): A, B and C of each
+    triangle. B and C are swapped where the foot D falls beyond B, so that an
+    exterior foot always lies beyond C. Returns a dict of arrays:
+
+    - ``vertices``: A, B, C (reordered) and D, with shape (..., 4, 3);
+    - ``position``: where D is along the base, 0 at C and 1 at B;
+    - ``case``: ``"interior"``, ``"exterior"`` or ``"right"`` (D on C);
+    - ``base``, ``height`` and ``area``.
+
+    Raises ``ValueError`` if a triangle is degenerate.
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    if vertices.shape[-1] == 2:
+        vertices = np.concatenate([vertices, np.zeros(vertices.shape[:-1] + (1,))], axis=-1)
+    apex, base_b, base_c = vertices[..., 0, :], vertices[..., 1, :], vertices[..., 2, :]
+    base_vector = base_b - base_c
+    base_squared = np.sum(base_vector ** 2, axis=-1)
+    cross = np.cross(base_vector, apex - base_c)[..., 2]
+    degenerate = np.abs(cross) <= RIGHT_ANGLE_TOLERANCE * np.maximum(base_squared, 1)
+    if np.any(degenerate):
+        raise ValueError(f"Degenerate triangles (no area): {vertices[degenerate].tolist()}")
+
+    position = np.sum((apex - base_c) * base_vector, axis=-1) / base_squared
+    # Mirror the base where the foot is beyond B
+    beyond_b = position > 1 - RIGHT_ANGLE_TOLERANCE
+    base_b, base_c = (
+        np.where(beyond_b[..., None], base_c, base_b),
+        np.where(beyond_b[..., None], base_b, base_c),
+    )
+    position = np.where(beyond_b, 1 - position, position)
+    foot = base_c + position[..., None] * (base_b - base_c)
+
+    case = np.select(
+        [np.abs(position) <= RIGHT_ANGLE_TOLERANCE, position > 0],
+        ["right", "interior"],
+        "exterior",
+    )
+    base = np.sqrt(base_squared)
+    height = np.abs(cross) / base
+    return {
+        "vertices": np.stack([apex, base_b, base_c, foot], axis=-2),
+        "position": position,
+        "case": case,
+        "base": base,
+        "height": height,
+        "area": base * height / 2,
+    }
+
+
+def fit_to_box(points, center=FIGURE_CENTER, width=FIGURE_WIDTH, height=FIGURE_HEIGHT):
+    """Scale and move each set of ``points`` (..., k, 3) to fill the box at ``center``."""
+    lower, upper = points.min(axis=-2, keepdims=True), points.max(axis=-2, keepdims=True)
+    size = upper - lower
+    scale = np.minimum(width / size[..., :1], height / size[..., 1:2])
+    return center + (points - (lower + upper) / 2) * scale
+
+
 class TriangleAreaRectangle(Scene):
     """
     Geometric proof that triangle area is half the area of its bounding rectangle.
@@ -90,44 +160,39 @@ class TriangleAreaRectangle(Scene):
         self.wait(3)
 
 
-class TriangleAreaInteriorAltitude(Scene):
+class TriangleAreaAltitude(Scene):
+    """
+    Geometric demonstration of the triangle area formula with the altitude AD on the base BC.
+    Whether the foot D lies inside the base, outside it or on C (a right triangle) is computed
+    from the vertices, and the area is derived as a sum, a difference or directly.
+    """
+
+    # Vertices A (apex), B and C (base) of the triangle. Problem sets of
+    # other triangles are rendered with `python -m tools.variants`.
+    VERTICES = ((-2.0, 2.0), (2.0, 0.0), (-2.0, 0.0))
+
     def construct(self):
         # ========== VERTEX COORDINATES DEFINITION ==========
-        # Define triangle vertices for the case with interior altitude
-        vertex_A = np.array([-2, 2, 0])  # Apex vertex
-        vertex_B = np.array([2, 0, 0])  # Right base vertex
-        vertex_C = np.array([-2, 0, 0])  # Left base vertex (foot of altitude)
-        vertex_D = np.array([-3, 0, 0])  # Extension point for altitude visualization
+        # Altitude foot and case from the vertices, then the figure scaled
+        # into the left part of the frame
+        altitude = triangle_altitudes(self.VERTICES)
+        case = str(altitude["case"])
+        vertex_A, vertex_B, vertex_C, vertex_D = fit_to_box(altitude["vertices"])
 
         # ========== GEOMETRIC ELEMENTS CONSTRUCTION ==========
         # Main triangle ABC
         main_triangle = Polygon(vertex_A, vertex_B, vertex_C, color=BLUE, stroke_width=3)
 
-        # Altitude from A to line BC (extended to point D for clarity)
+        # Altitude from A to the line BC, and the extension of the base up to its foot
         altitude_line = DashedLine(vertex_A, vertex_D, color=YELLOW, stroke_width=2)
+        base_extension = DashedLine(vertex_C, vertex_D, color=YELLOW, stroke_width=2)
 
-        # Base line from C to B CD
-        extentended_base_line = DashedLine(vertex_C, vertex_D, color=YELLOW, stroke_width=2)
-
-        # Vertex labels
-        label_A = MathTex("A").next_to(vertex_A, UP)
-        label_B = MathTex("B").next_to(vertex_B, DOWN)
-        label_C = MathTex("C").next_to(vertex_C, DOWN)
-        label_D = MathTex("D").next_to(vertex_D, DOWN)
-
-        # Two right triangles formed by the altitude
-        right_triangle_ACD = Polygon(vertex_A, vertex_C, vertex_D, color=GREEN,
-                                     fill_opacity=0.4, stroke_width=2)
-        right_triangle_ABD = Polygon(vertex_A, vertex_B, vertex_D, color=RED,
-                                     fill_opacity=0.4, stroke_width=2)
-
-        # Group all elements for positioning
-        all_elements = VGroup(
-            main_triangle, altitude_line, extentended_base_line,
-            right_triangle_ACD, right_triangle_ABD,
-            label_A, label_B, label_C, label_D
-        )
-        all_elements.shift(LEFT * 3.5)  # Shift left to make space for formulas
+        # Vertex labels, away from the triangle
+        centroid = (vertex_A + vertex_B + vertex_C) / 3
+        label_A = MathTex("A").next_to(vertex_A, normalize(vertex_A - centroid))
+        label_B = MathTex("B").next_to(vertex_B, normalize(vertex_B - centroid))
+        label_C = MathTex("C").next_to(vertex_C, normalize(vertex_C - centroid))
+        label_D = MathTex("D").next_to(vertex_D, normalize(vertex_D - vertex_A))
 
         # ========== ANIMATION SEQUENCE ==========
         # Display main triangle and vertex labels
@@ -135,160 +200,113 @@ class TriangleAreaInteriorAltitude(Scene):
         self.play(Write(label_A), Write(label_B), Write(label_C))
         self.wait(1)
 
-        # Show altitude and its foot label
-        self.play(Create(altitude_line), Write(label_D))
-        self.play(Create(extentended_base_line))
-        self.wait(1)
-
-        # Reveal the two component right triangles
-        self.play(FadeIn(right_triangle_ACD), FadeIn(right_triangle_ABD))
-        self.wait(1)
+        if case == "right":
+            # The altitude is the side AC itself
+            self.play(Create(altitude_line))
+            self.wait(1)
+            derivation = [
+                MathTex(r"D = C:\ AC \perp CB"),
+                MathTex(r"\text{Area}_{ABC} = \frac{1}{2} \cdot CB \cdot AC"),
+            ]
+        elif case == "interior":
+            # Show altitude and its foot label
+            self.play(Create(altitude_line), Write(label_D))
+            self.wait(1)
+
+            # Reveal the two component right triangles
+            right_triangle_ACD = Polygon(vertex_A, vertex_C, vertex_D, color=GREEN,
+                                         fill_opacity=0.4, stroke_width=2)
+            right_triangle_ABD = Polygon(vertex_A, vertex_B, vertex_D, color=RED,
+                                         fill_opacity=0.4, stroke_width=2)
+            self.play(FadeIn(right_triangle_ACD), FadeIn(right_triangle_ABD))
+            self.wait(1)
+
+            # Total area equals sum of two right triangle areas, factored
+            # using segment addition (CD + DB = CB)
+            derivation = [
+                MathTex(r"\text{Area}_{ABC} = \text{Area}_{ACD} + \text{Area}_{ABD}"),
+                MathTex(r"= \frac{1}{2} \cdot CD \cdot AD + \frac{1}{2} \cdot DB \cdot AD"),
+                MathTex(r"= \frac{1}{2} \cdot AD \cdot (CD + DB)"),
+                MathTex(r"= \frac{1}{2} \cdot AD \cdot CB"),
+            ]
+        else:
+            # Show altitude construction and extension point
+            self.play(Create(altitude_line), Create(base_extension), Write(label_D))
+            self.wait(1)
+
+            # Reveal component triangles in logical order
+            triangle_ACB = Polygon(vertex_A, vertex_C, vertex_B, color=BLUE,
+                                   fill_opacity=0.4, stroke_width=2)
+            triangle_ACD = Polygon(vertex_A, vertex_C, vertex_D, color=YELLOW,
+                                   fill_opacity=0.4, stroke_width=2)
+            triangle_ABD = Polygon(vertex_A, vertex_B, vertex_D, color=RED,
+                                   fill_opacity=0.4, stroke_width=2)
+            self.play(FadeIn(triangle_ACB))  # Main triangle area
+            self.wait(1)
+            self.play(FadeIn(triangle_ACD))  # External triangle to be subtracted
+            self.wait(1)
+            self.play(FadeIn(triangle_ABD))  # Large enclosing triangle
+            self.wait(1)
+
+            # Area as difference of two larger triangles, factored using
+            # segment subtraction (DB - DC = CB)
+            derivation = [
+                MathTex(r"\text{Area}_{ABC} = \text{Area}_{ABD} - \text{Area}_{ACD}"),
+                MathTex(r"= \frac{1}{2} \cdot DB \cdot AD - \frac{1}{2} \cdot DC \cdot AD"),
+                MathTex(r"= \frac{1}{2} \cdot AD \cdot (DB - DC)"),
+                MathTex(r"= \frac{1}{2} \cdot AD \cdot CB"),
+            ]
 
         # ========== AREA FORMULA DERIVATION ==========
-        # Step 1: Total area equals sum of two right triangle areas
-        area_decomposition = MathTex(
-            r"\text{Area}_{ABC} = \text{Area}_{ACD} + \text{Area}_{ABD}"
-        ).to_edge(UP).shift(RIGHT * 2)
-        self.play(Write(area_decomposition))
-        self.wait(1)
-
-        # Step 2: Apply area formula for right triangles
-        area_formulas = MathTex(
-            r"= \frac{1}{2} \cdot CD \cdot AD + \frac{1}{2} \cdot DB \cdot AD"
-        ).next_to(area_decomposition, DOWN * 1.5)
-        self.play(Write(area_formulas))
-        self.wait(1)
-
-        # Step 3: Factor out common terms
-        factored_expression = MathTex(
-            r"= \frac{1}{2} \cdot AD \cdot (CD + DB)"
-        ).next_to(area_formulas, DOWN * 1.5)
-        self.play(Write(factored_expression))
-        self.wait(1)
-
-        # Step 4: Simplify using segment addition (CD + DB = CB)
-        simplified_expression = MathTex(
-            r"= \frac{1}{2} \cdot AD \cdot CB"
-        ).next_to(factored_expression, DOWN * 1.5)
-        self.play(Write(simplified_expression))
+        derivation[0].to_edge(UP).shift(RIGHT * 2)
+        for previous, step in zip(derivation, derivation[1:]):
+            step.next_to(previous, DOWN * 1.5)
+        for step in derivation:
+            self.play(Write(step))
+            self.wait(1)
+
+        # The values of this triangle, in the units of its vertices: after the
+        # last derivation line, or under it if they would leave the frame
+        values = MathTex(
+            rf"= \frac{{1}}{{2}} \cdot {altitude['height']:.3g} \cdot {altitude['base']:.3g}"
+            rf" = {altitude['area']:.3g}"
+        ).next_to(derivation[-1], RIGHT)
+        last_line = derivation[-1]
+        if values.get_right()[0] > config.frame_width / 2 - DEFAULT_MOBJECT_TO_EDGE_BUFFER:
+            values.next_to(derivation[-1], DOWN * 1.5)
+            last_line = values
+        self.play(Write(values))
         self.wait(1)
 
         # Final triangle area formula
         final_formula = MathTex(
             r"\text{Area}_{ABC} = \frac{1}{2} \cdot \text{base} \cdot \text{height}"
-        ).next_to(simplified_expression, DOWN * 1.5).set_color(YELLOW)
+        ).next_to(last_line, DOWN * 1.5).set_color(YELLOW)
         self.play(Write(final_formula))
         self.wait(2)
 
         # Conclusion statement
-        conclusion_text = Tex(
-            "The area formula remains valid when the altitude lies inside the triangle."
-        ).next_to(final_formula, DOWN * 1.5).shift(LEFT * 1.5).set_color(GREEN).scale(0.75)
+        conclusion = {
+            "right": "The area formula remains valid when the altitude is a side of the triangle.",
+            "interior": "The area formula remains valid when the altitude lies inside the triangle.",
+            "exterior": "The area formula remains valid when the altitude falls outside the triangle.",
+        }[case]
+        conclusion_text = Tex(conclusion).next_to(final_formula, DOWN * 1.5).shift(LEFT * 1.5) \
+            .set_color(GREEN).scale(0.75)
         self.play(Write(conclusion_text))
         self.wait(3)
 
 
-class TriangleAreaExteriorAltitude(Scene):
+class TriangleAreaInteriorAltitude(TriangleAreaAltitude):
+    """The altitude falls inside the base: the triangle is the sum of two right triangles."""
+
+    VERTICES = ((-1.0, 2.0), (2.0, 0.0), (-2.0, 0.0))
+
+
+class TriangleAreaExteriorAltitude(TriangleAreaAltitude):
     """
     Geometric demonstration of triangle area formula when the altitude falls outside the triangle.
     Shows how the area can be expressed as the difference of two right triangles.
     """
 
-    def construct(self):
-        # ========== VERTEX COORDINATES DEFINITION ==========
-        # Define triangle vertices for the case with exterior altitude
-        vertex_A = np.array([-2, 2, 0])  # Apex vertex
-        vertex_B = np.array([2, -1, 0])  # Right base vertex
-        vertex_C = np.array([0, -1, 0])  # Left base vertex
-        vertex_D = np.array([-2, -1, 0])  # Foot of altitude (outside triangle)
-
-        # ========== GEOMETRIC ELEMENTS CONSTRUCTION ==========
-        # Main triangle ABC
-        main_triangle = Polygon(vertex_A, vertex_B, vertex_C, color=BLUE, stroke_width=3)
-
-        # Altitude lines (dashed for extension outside triangle)
-        altitude_main = DashedLine(vertex_A, vertex_D, color=YELLOW, stroke_width=2)
-        base_extension = DashedLine(vertex_C, vertex_D, color=YELLOW, stroke_width=2)
-
-        # Vertex labels
-        label_A = MathTex("A").next_to(vertex_A, UP)
-        label_B = MathTex("B").next_to(vertex_B, DOWN)
-        label_C = MathTex("C").next_to(vertex_C, DOWN)
-        label_D = MathTex("D").next_to(vertex_D, DOWN)
-
-        # Component triangles for area decomposition
-        triangle_ACD = Polygon(vertex_A, vertex_C, vertex_D, color=YELLOW,
-                               fill_opacity=0.4, stroke_width=2)
-        triangle_ACB = Polygon(vertex_A, vertex_C, vertex_B, color=BLUE,
-                               fill_opacity=0.4, stroke_width=2)
-        triangle_ABD = Polygon(vertex_A, vertex_B, vertex_D, color=RED,
-                               fill_opacity=0.4, stroke_width=2)
-
-        # Group all elements for positioning
-        all_elements = VGroup(
-            main_triangle, altitude_main, base_extension,
-            triangle_ACD, triangle_ABD, triangle_ACB,
-            label_A, label_B, label_C, label_D
-        )
-        all_elements.shift(LEFT * 3.5)
-
-        # ========== ANIMATION SEQUENCE ==========
-        # Display main triangle and vertex labels
-        self.play(Create(main_triangle), run_time=2)
-        self.play(Write(label_A), Write(label_B), Write(label_C))
-        self.wait(1)
-
-        # Show altitude construction and extension point
-        self.play(Create(altitude_main), Create(base_extension), Write(label_D))
-        self.wait(1)
-
-        # Reveal component triangles in logical order
-        self.play(FadeIn(triangle_ACB))  # Main triangle area
-        self.wait(1)
-        self.play(FadeIn(triangle_ACD))  # External triangle to be subtracted
-        self.wait(1)
-        self.play(FadeIn(triangle_ABD))  # Large enclosing triangle
-        self.wait(1)
-
-        # ========== AREA FORMULA DERIVATION ==========
-        # Step 1: Area as difference of two larger triangles
-        area_difference = MathTex(
-            r"\text{Area}_{ABC} = \text{Area}_{ABD} - \text{Area}_{ACD}"
-        ).to_edge(UP).shift(RIGHT * 2)
-        self.play(Write(area_difference))
-        self.wait(1)
-
-        # Step 2: Apply area formula for right triangles
-        area_calculation = MathTex(
-            r"= \frac{1}{2} \cdot DB \cdot AD - \frac{1}{2} \cdot DC \cdot AD"
-        ).next_to(area_difference, DOWN * 1.5)
-        self.play(Write(area_calculation))
-        self.wait(1)
-
-        # Step 3: Factor out common terms
-        factored_difference = MathTex(
-            r"= \frac{1}{2} \cdot AD \cdot (DB - DC)"
-        ).next_to(area_calculation, DOWN * 1.5)
-        self.play(Write(factored_difference))
-        self.wait(1)
-
-        # Step 4: Simplify using segment subtraction (DB - DC = CB)
-        simplified_difference = MathTex(
-            r"= \frac{1}{2} \cdot AD \cdot CB"
-        ).next_to(factored_difference, DOWN * 1.5)
-        self.play(Write(simplified_difference))
-        self.wait(1)
-
-        # Final triangle area formula
-        final_formula = MathTex(
-            r"\text{Area}_{ABC} = \frac{1}{2} \cdot \text{base} \cdot \text{height}"
-        ).next_to(simplified_difference, DOWN * 1.5).set_color(YELLOW)
-        self.play(Write(final_formula))
-        self.wait(2)
-
-        # Conclusion statement
-        conclusion_text = Tex(
-            "The area formula remains valid when the altitude falls outside the triangle."
-        ).next_to(final_formula, DOWN * 1.5).shift(LEFT * 1.5).set_color(GREEN).scale(0.75)
-        self.play(Write(conclusion_text))
-        self.wait(3)
+    VERTICES = ((-2.0, 2.0), (2.0, -1.0), (0.0, -1.0))
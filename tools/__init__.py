@@ -0,0 +1,9 @@
+"""
+Rendering tools for the ManimCE scenes in ``src/``.
+
+The scene files stay plain ManimCE scripts that can be rendered with the
+``manim`` command; these modules add project-level entry points on top of
+them. Run them from the repository root, e.g.::
+
+    python -m tools.batch_render -q l
+"""
@@ -0,0 +1,58 @@
+"""
+Render only a range of the animations of a scene, for split rendering.
+
+A worker of :mod:`tools.split_render` renders the ``play()``/``wait()``
+calls of one range (manim skips the others) and leaves their partial movies
+in manim's partial movie directory, where the final pass of the split
+render finds them. This file writer mixin records what the worker did and
+keeps workers from getting in each other's way.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+class AnimationRangeMixin:
+    """
+    Mixin for ``manim.scene.scene_file_writer.SceneFileWriter``.
+
+    Records the duration of every call and the partial movies of the calls
+    that were rendered, and does not combine them into the scene movie: that
+    is left to the final pass. The scene must be assigned to ``scene``.
+    """
+
+    scene = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.play_durations = []
+        self.range_partial_movie_files = []
+
+    def add_partial_movie_file(self, hash_animation):
+        # Called once per play() or wait(), after its duration is known
+        self.play_durations.append(self.scene.duration)
+        super().add_partial_movie_file(hash_animation)
+        if hash_animation is not None and self.partial_movie_files:
+            self.range_partial_movie_files.append(self.partial_movie_files[-1])
+
+    def open_partial_movie_stream(self, file_path=None):
+        # Identical calls in two ranges share a hash, hence a file name: each
+        # worker writes to its own name and renames the finished file
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self._final_partial_path = Path(file_path)
+        temp_path = self._final_partial_path.with_name(
+            f"{self._final_partial_path.stem}.{os.getpid()}.partial{self._final_partial_path.suffix}"
+        )
+        super().open_partial_movie_stream(str(temp_path))
+
+    def close_partial_movie_stream(self):
+        super().close_partial_movie_stream()
+        os.replace(self.partial_movie_file_path, self._final_partial_path)
+
+    def finish(self):
+        # Other workers are still writing to the partial movie directory, so
+        # manim's cache cleaning must not run either
+        pass
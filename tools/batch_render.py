@@ -0,0 +1,318 @@
+"""
+Render every scene in ``src/`` across a pool of worker processes.
+
+Scenes are scheduled longest-first (LPT) so that the long proofs start
+immediately and the short ones fill the gaps at the end, which keeps the
+total wall time close to that of the longest scene. Each scene runs in a
+fresh process, so manim's global config never leaks between scenes and the
+reported peak memory belongs to that scene alone.
+
+Usage::
+
+    python -m tools.batch_render -q h -j 8
+    python -m tools.batch_render -q l --scenes SumSquare QuadraticFormula
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from .render import QUALITY_FLAGS, RenderJob, render_scene
+from .scenes import MEDIA_DIR, discover_scenes, select_scenes
+from .tex_cache import DEFAULT_MAX_MB
+
+HISTORY_FILE_NAME = "batch_render_history.json"
+TEX_CACHE_DIR_NAME = "tex_cache"
+SECTION_CACHE_DIR_NAME = "section_cache"
+TRACE_DIR_NAME = "traces"
+CHECKPOINT_DIR_NAME = "checkpoints"
+
+
+# ========== SCHEDULING ==========
+def load_history(media_dir):
+    """Wall times of previous batch runs, keyed by quality then scene key."""
+    path = Path(media_dir) / HISTORY_FILE_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_history(media_dir, history):
+    path = Path(media_dir) / HISTORY_FILE_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def estimate_costs(scenes, history):
+    """
+    Estimated render cost of each scene, in comparable units.
+
+    Measured wall times from earlier runs are used where available. The
+    other scenes fall back to their estimated video duration, scaled by the
+    median seconds-of-render per second-of-video seen in the history.
+    """
+    ratios = [
+        history[s.key] / s.estimated_duration
+        for s in scenes
+        if s.key in history and s.estimated_duration > 0
+    ]
+    ratio = statistics.median(ratios) if ratios else 1.0
+    return {
+        s.key: history.get(s.key, s.estimated_duration * ratio)
+        for s in scenes
+    }
+
+
+def schedule(scenes, costs):
+    """Longest-processing-time-first order."""
+    return sorted(scenes, key=lambda s: costs[s.key], reverse=True)
+
+
+# ========== REPORTING ==========
+def format_summary(results, total_wall_time, workers):
+    lines = []
+    header = f"{'Scene':<40} {'Status':<7} {'Wall (s)':>9} {'CPU (s)':>9} {'Peak RSS (MiB)':>15}  Output"
+    lines.append(header)
+    lines.append("-" * len(header))
+    for result in results:
+        status = "ok" if result.error is None else "FAILED"
+        rss = f"{result.peak_rss_mb:.0f}" if result.peak_rss_mb is not None else "n/a"
+        output = ", ".join(result.outputs) if result.outputs else "-"
+        name = f"{Path(result.file).stem}:{result.scene}"
+        if result.variant is not None:
+            name += f"_{result.variant}"
+        lines.append(
+            f"{name:<40} {status:<7} {result.wall_time:>9.1f} {result.cpu_time:>9.1f} {rss:>15}  {output}"
+        )
+    serial_time = sum(r.wall_time for r in results)
+    lines.append("-" * len(header))
+    lines.append(
+        f"{len(results)} scenes on {workers} workers: {total_wall_time:.1f} s wall, "
+        f"{serial_time:.1f} s summed ({serial_time / max(total_wall_time, 1e-9):.1f}x)"
+    )
+    cache_stats = [r.tex_cache for r in results if r.tex_cache is not None]
+    if cache_stats:
+        hits = sum(s["hits"] for s in cache_stats)
+        misses = sum(s["misses"] for s in cache_stats)
+        evictions = sum(s["evictions"] for s in cache_stats)
+        lines.append(
+            f"TeX cache: {hits} hits, {misses} misses "
+            f"({hits / max(hits + misses, 1):.0%} hit rate), {evictions} evictions"
+        )
+    cached_sections = sum(len(r.cached_sections or ()) for r in results)
+    if cached_sections:
+        lines.append(f"Section cache: {cached_sections} sections reused")
+    resumed_plays = sum(r.resumed_plays or 0 for r in results)
+    if resumed_plays:
+        lines.append(f"Checkpoints: {resumed_plays} calls resumed")
+    held_frames = [r.held_frames for r in results if r.held_frames is not None]
+    if held_frames:
+        lines.append(f"Frame holds: {sum(held_frames)} identical frames not encoded")
+    prewarm_stats = [r.tex_prewarm for r in results if r.tex_prewarm is not None]
+    if prewarm_stats:
+        compiled = sum(s["compiled"] for s in prewarm_stats)
+        batches = sum(1 for s in prewarm_stats if s["batched"])
+        seconds = sum(s["seconds"] for s in prewarm_stats)
+        lines.append(
+            f"TeX prewarm: {compiled} fragments compiled in {batches} LaTeX runs ({seconds:.1f} s)"
+        )
+    return "\n".join(lines)
+
+
+# ========== ENTRY POINT ==========
+def run_batch(jobs, workers, on_result=None):
+    """
+    Render ``jobs`` (already in scheduling order) on ``workers`` processes.
+
+    Results are returned in completion order; ``on_result`` is called as
+    each one arrives.
+    """
+    results = []
+    context = multiprocessing.get_context("spawn")
+    # chunksize=1 keeps the submission order, maxtasksperchild=1 gives
+    # each scene a fresh interpreter
+    with context.Pool(processes=workers, maxtasksperchild=1) as pool:
+        for result in pool.imap_unordered(render_scene, jobs, chunksize=1):
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.batch_render",
+        description="Render every scene in src/ in parallel.",
+    )
+    parser.add_argument(
+        "-q", "--quality", choices=sorted(QUALITY_FLAGS), default="h",
+        help="Quality flag as in `manim -q<flag>` (default: h)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--scenes", nargs="+", metavar="NAME",
+        help="Only render these scenes (class name or file:Class)",
+    )
+    parser.add_argument(
+        "--media-dir", default=str(MEDIA_DIR),
+        help="Output directory (default: media/)",
+    )
+    parser.add_argument(
+        "--disable-caching", action="store_true",
+        help="Do not reuse partial movie files from earlier renders",
+    )
+    parser.add_argument(
+        "--no-tex-cache", action="store_true",
+        help="Do not use the shared TeX SVG cache in media/tex_cache/",
+    )
+    parser.add_argument(
+        "--tex-cache-size", type=float, default=DEFAULT_MAX_MB, metavar="MB",
+        help=f"Size cap of the TeX SVG cache (default: {DEFAULT_MAX_MB} MB)",
+    )
+    parser.add_argument(
+        "--no-tex-prewarm", action="store_true",
+        help="Do not compile each scene's TeX in a single LaTeX run before rendering",
+    )
+    parser.add_argument(
+        "--no-section-cache", action="store_true",
+        help="Do not reuse unchanged sections from media/section_cache/",
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Continue interrupted renders from their checkpoint in media/checkpoints/",
+    )
+    parser.add_argument(
+        "--no-checkpoint", action="store_true",
+        help="Do not record a checkpoint after every finished call",
+    )
+    parser.add_argument(
+        "--frame-hold", action="store_true",
+        help="Encode static waits as held frames (variable frame rate output)",
+    )
+    parser.add_argument(
+        "--static-layers", action="store_true",
+        help="Rasterise the mobjects an animation does not touch once per animation",
+    )
+    parser.add_argument(
+        "--dirty-rects", action="store_true",
+        help="Only redraw the part of each frame around moving mobjects (implies --static-layers)",
+    )
+    parser.add_argument(
+        "--fast-hash", action="store_true",
+        help="Hash calls for manim's cache with tools.state_hash instead of manim's JSON hash",
+    )
+    parser.add_argument(
+        "--renderer", choices=["cairo", "opengl"], default="cairo",
+        help="manim renderer; opengl also works without display or GPU (default: cairo)",
+    )
+    parser.add_argument(
+        "--trace", action="store_true",
+        help="Write a timing trace of each scene to media/traces/ (see tools.profiling)",
+    )
+    parser.add_argument(
+        "--json", metavar="PATH",
+        help="Also write the summary to this JSON file",
+    )
+    return parser
+
+
+def make_jobs(scenes, args):
+    """One :class:`RenderJob` per scene; tools extending the batch override fields."""
+    return [
+        RenderJob(
+            file=str(scene.file),
+            scene=scene.name,
+            quality=args.quality,
+            media_dir=args.media_dir,
+            disable_caching=args.disable_caching,
+            tex_cache_dir=None if args.no_tex_cache else str(Path(args.media_dir) / TEX_CACHE_DIR_NAME),
+            tex_cache_max_mb=args.tex_cache_size,
+            tex_prewarm=not args.no_tex_prewarm,
+            frame_hold=args.frame_hold,
+            static_layers=args.static_layers,
+            dirty_rects=args.dirty_rects,
+            renderer=args.renderer,
+            fast_hash=args.fast_hash,
+            section_cache_dir=(
+                None if args.no_section_cache or args.disable_caching
+                else str(Path(args.media_dir) / SECTION_CACHE_DIR_NAME)
+            ),
+            checkpoint_dir=None if args.no_checkpoint else str(Path(args.media_dir) / CHECKPOINT_DIR_NAME),
+            resume=args.resume,
+            trace_file=(
+                str(Path(args.media_dir) / TRACE_DIR_NAME / f"{scene.file.stem}.{scene.name}.json")
+                if args.trace else None
+            ),
+        )
+        for scene in scenes
+    ]
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        scenes = select_scenes(discover_scenes(), args.scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    history = load_history(args.media_dir)
+    quality_history = history.get(args.quality, {})
+    costs = estimate_costs(scenes, quality_history)
+    ordered = schedule(scenes, costs)
+    workers = max(1, min(args.jobs, len(ordered)))
+
+    print(f"Rendering {len(ordered)} scenes at -q{args.quality} on {workers} workers")
+    for scene in ordered:
+        print(f"  {scene.key:<40} estimated cost {costs[scene.key]:.1f}")
+
+    def report(result):
+        status = "done" if result.error is None else "FAILED"
+        print(f"[{status}] {Path(result.file).stem}:{result.scene} in {result.wall_time:.1f} s", flush=True)
+
+    start = time.perf_counter()
+    results = run_batch(make_jobs(ordered, args), workers, on_result=report)
+    total_wall_time = time.perf_counter() - start
+
+    # Keep the summary in scheduling order
+    order = {(str(s.file), s.name): i for i, s in enumerate(ordered)}
+    results.sort(key=lambda r: order[(r.file, r.scene)])
+
+    for result in results:
+        if result.error is not None:
+            print(f"\n{Path(result.file).stem}:{result.scene} failed:\n{result.error}", file=sys.stderr)
+        else:
+            quality_history[f"{Path(result.file).stem}:{result.scene}"] = round(result.wall_time, 3)
+    history[args.quality] = quality_history
+    save_history(args.media_dir, history)
+
+    print()
+    print(format_summary(results, total_wall_time, workers))
+
+    if args.json:
+        summary = {
+            "quality": args.quality,
+            "workers": workers,
+            "wall_time": total_wall_time,
+            "scenes": [r.to_dict() for r in results],
+        }
+        Path(args.json).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
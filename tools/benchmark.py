@@ -0,0 +1,386 @@
+"""
+Benchmark the rendering of every scene and compare it with a baseline.
+
+Every scene is rendered at each quality preset, one scene at a time (so
+that scenes do not compete for the CPU), in a fresh temporary media folder
+(so that no partial movie or TeX SVG from an earlier run is reused) and a
+fresh worker process (so that no TeX hook, in-memory cache or memory peak
+of an earlier run carries over). For each scene the benchmark records wall
+and CPU time, frames per second, TeX, encoding and hashing time, peak
+memory and the time of every ``play()``/``wait()`` call (see
+:mod:`tools.metrics`). With ``--repeat N`` the fastest of N runs is kept.
+
+The results are written as JSON and compared with a baseline recorded on
+the same machine, normally ``benchmarks/baseline.json``; any time more than
+``--threshold`` above the baseline is reported as a regression and the exit
+status is 1.
+
+Usage::
+
+    python -m tools.benchmark                       # compare with the baseline
+    python -m tools.benchmark --save-baseline       # record a new baseline
+    python -m tools.benchmark -q l --scenes SumSquare --threshold 0.2
+    python -m tools.benchmark --compare dirty_rects  # speed-up of a feature
+    python -m tools.benchmark --compare opengl       # OpenGL against Cairo
+
+With ``--compare FEATURE`` every scene is rendered with and without the
+feature instead, and the frames per second of both are shown with the
+output parity: whether both videos last the same, and the lowest PSNR
+between frames sampled at the same times (needs ``ffprobe`` and
+``ffmpeg``). A scene whose videos differ counts as a failure.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import nullcontext
+from pathlib import Path
+
+import numpy as np
+
+from .batch_render import TEX_CACHE_DIR_NAME, run_batch
+from .render import QUALITY_FLAGS, RenderJob
+from .scenes import REPO_ROOT, discover_scenes, select_scenes
+
+BASELINE_FILE = REPO_ROOT / "benchmarks" / "baseline.json"
+DEFAULT_QUALITIES = ["l", "h"]
+DEFAULT_THRESHOLD = 0.10  # Relative slowdown reported as a regression
+# Calls and times shorter than this in the baseline are too noisy to compare
+MIN_PLAY_SECONDS = 0.25
+# Scene metrics compared with the baseline (all "lower is better")
+COMPARED_METRICS = ["wall_time", "cpu_time", "tex_time", "encode_time", "hash_time", "peak_rss_mb"]
+# Rendering features that --compare measures against the default renderer
+FEATURES = {
+    "static_layers": {"static_layers": True},
+    "dirty_rects": {"dirty_rects": True},
+    "frame_hold": {"frame_hold": True},
+    "opengl": {"renderer": "opengl"},
+    "fast_hash": {"fast_hash": True},
+}
+# Frames compared between the two videos of --compare
+PARITY_SAMPLES = 8
+# Lowest PSNR (dB) for which two renders still look the same
+MIN_PSNR = 30.0
+# Largest difference of video length for which two renders match (seconds)
+MAX_DURATION_DIFFERENCE = 0.05
+
+
+# ========== MEASUREMENT ==========
+def scene_record(result):
+    """The JSON record of one rendered scene."""
+    metrics = result.metrics or {}
+    prewarm_time = result.tex_prewarm["seconds"] if result.tex_prewarm else 0.0
+    return {
+        "wall_time": result.wall_time,
+        "cpu_time": result.cpu_time,
+        "peak_rss_mb": result.peak_rss_mb,
+        "frames": metrics.get("frames", 0),
+        "frames_per_second": metrics.get("frames_per_second", 0.0),
+        "tex_time": metrics.get("tex_time", 0.0) + prewarm_time,
+        "encode_time": metrics.get("encode_time", 0.0),
+        "hash_time": metrics.get("hash_time", 0.0),
+        "hash_calls": metrics.get("hash_calls", 0),
+        "plays": [
+            {key: play[key] for key in ("index", "animations", "duration", "wall_time", "encode_time", "frames")}
+            for play in metrics.get("plays", [])
+        ],
+    }
+
+
+def render_isolated(job):
+    """Render ``job`` in a new worker process; its hooks, caches and peak memory die with it."""
+    return run_batch([job], 1)[0]
+
+
+def benchmark_scene(scene, quality, repeat, parent_dir=None, **options):
+    """
+    Render ``scene`` ``repeat`` times from scratch and keep the fastest run.
+    ``options`` are extra :class:`tools.render.RenderJob` fields. Every run
+    uses a new temporary media folder, kept if it is made in ``parent_dir``.
+    """
+    best = None
+    for _ in range(repeat):
+        if parent_dir is None:
+            media_folder = tempfile.TemporaryDirectory(prefix="manim_benchmark_")
+        else:
+            Path(parent_dir).mkdir(parents=True, exist_ok=True)
+            media_folder = nullcontext(tempfile.mkdtemp(prefix="manim_benchmark_", dir=parent_dir))
+        with media_folder as media_dir:
+            job = RenderJob(
+                file=str(scene.file),
+                scene=scene.name,
+                quality=quality,
+                media_dir=media_dir,
+                disable_caching=True,
+                tex_cache_dir=str(Path(media_dir) / TEX_CACHE_DIR_NAME),
+                tex_prewarm=True,
+                metrics=True,
+                **options,
+            )
+            result = render_isolated(job)
+        if result.error is not None:
+            return result, None
+        if best is None or result.wall_time < best.wall_time:
+            best = result
+    return best, scene_record(best)
+
+
+def run_benchmark(scenes, qualities, repeat=1, on_record=None):
+    """``{quality: {scene key: record}}`` plus the failed results."""
+    results = {}
+    failures = []
+    for quality in qualities:
+        results[quality] = {}
+        for scene in scenes:
+            result, record = benchmark_scene(scene, quality, repeat)
+            if record is None:
+                failures.append(result)
+                continue
+            results[quality][scene.key] = record
+            if on_record is not None:
+                on_record(quality, scene.key, record)
+    return results, failures
+
+
+def environment():
+    try:
+        from importlib.metadata import version
+
+        manim_version = version("manim")
+    except Exception:
+        manim_version = None
+    return {
+        "manim": manim_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+# ========== COMPARISON ==========
+def compare(results, baseline, threshold):
+    """
+    Regressions of ``results`` against ``baseline``, as readable lines.
+
+    A scene metric or a call regresses when it is more than ``threshold``
+    (relative) above the baseline. Calls are matched by index and only
+    compared if their animations are the same.
+    """
+    regressions = []
+    for quality, scenes in results.items():
+        for key, record in scenes.items():
+            reference = baseline.get(quality, {}).get(key)
+            if reference is None:
+                continue
+            for metric in COMPARED_METRICS:
+                new, old = record.get(metric), reference.get(metric)
+                if new is None or not old or (metric.endswith("_time") and old < MIN_PLAY_SECONDS):
+                    continue
+                if new > old * (1 + threshold):
+                    regressions.append(
+                        f"-q{quality} {key} {metric}: {old:.2f} -> {new:.2f} ({new / old - 1:+.0%})"
+                    )
+            for new_play, old_play in zip(record["plays"], reference.get("plays", [])):
+                if new_play["animations"] != old_play["animations"]:
+                    break  # The scene changed from here on
+                old, new = old_play["wall_time"], new_play["wall_time"]
+                if old >= MIN_PLAY_SECONDS and new > old * (1 + threshold):
+                    animations = ", ".join(new_play["animations"])
+                    regressions.append(
+                        f"-q{quality} {key} call {new_play['index']} ({animations}): "
+                        f"{old:.2f} -> {new:.2f} s ({new / old - 1:+.0%})"
+                    )
+    return regressions
+
+
+def probe_video(path):
+    """``(width, height, duration)`` of the first video stream of ``path``."""
+    output = subprocess.run(
+        [
+            "ffprobe", "-v", "error", "-select_streams", "v:0",
+            "-show_entries", "stream=width,height:format=duration", "-of", "json", str(path),
+        ],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    info = json.loads(output)
+    stream = info["streams"][0]
+    return stream["width"], stream["height"], float(info["format"]["duration"])
+
+
+def read_frame(path, time, width, height):
+    """The frame of ``path`` shown at ``time`` seconds, as an RGB array."""
+    data = subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-ss", f"{time:.3f}", "-i", str(path),
+            "-frames:v", "1", "-f", "rawvideo", "-pix_fmt", "rgb24", "-",
+        ],
+        check=True, capture_output=True,
+    ).stdout
+    return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+
+
+def psnr(frame, reference):
+    error = np.mean((frame.astype(np.float64) - reference) ** 2)
+    return math.inf if error == 0 else 10 * math.log10(255 ** 2 / error)
+
+
+def output_parity(video, reference, samples=PARITY_SAMPLES):
+    """
+    ``{"duration": difference in seconds, "psnr": lowest PSNR}`` of
+    ``video`` against ``reference``, comparing frames at ``samples`` evenly
+    spaced times. Frame counts are not compared: held frames change them.
+    """
+    width, height, duration = probe_video(video)
+    reference_width, reference_height, reference_duration = probe_video(reference)
+    if (width, height) != (reference_width, reference_height):
+        return {"duration": duration - reference_duration, "psnr": 0.0}
+    span = min(duration, reference_duration)
+    times = [span * (i + 0.5) / samples for i in range(samples)]
+    lowest = min(
+        psnr(read_frame(video, time, width, height), read_frame(reference, time, width, height))
+        for time in times
+    )
+    return {"duration": duration - reference_duration, "psnr": lowest}
+
+
+def compare_feature(scenes, qualities, feature, repeat=1):
+    """
+    Render every scene with and without ``feature``, printing the frames per
+    second of both, the speed-up and the output parity. Returns the number
+    of scenes that failed or whose outputs differ.
+    """
+    can_compare_outputs = shutil.which("ffprobe") is not None and shutil.which("ffmpeg") is not None
+    print(
+        f"{'':<4}{'Scene':<40} {'Default (fps)':>14} {feature + ' (fps)':>20} {'Speed-up':>9} "
+        f"{'Length':>8} {'PSNR (dB)':>10}"
+    )
+    failures = 0
+    for quality in qualities:
+        for scene in scenes:
+            with tempfile.TemporaryDirectory(prefix="manim_benchmark_") as directory:
+                default, default_record = benchmark_scene(scene, quality, repeat, Path(directory) / "default")
+                variant, variant_record = benchmark_scene(
+                    scene, quality, repeat, Path(directory) / feature, **FEATURES[feature]
+                )
+                if default_record is None or variant_record is None:
+                    print(f"-q{quality} {scene.key:<40} FAILED", flush=True)
+                    failures += 1
+                    continue
+                parity = None
+                if can_compare_outputs and default.outputs and variant.outputs:
+                    parity = output_parity(variant.outputs[0], default.outputs[0])
+            length, quality_column = "-", "-"
+            if parity is not None:
+                same_length = abs(parity["duration"]) <= MAX_DURATION_DIFFERENCE
+                length = "same" if same_length else f"{parity['duration']:+.2f} s"
+                quality_column = "same" if parity["psnr"] == math.inf else f"{parity['psnr']:.1f}"
+                if not same_length or parity["psnr"] < MIN_PSNR:
+                    failures += 1
+            print(
+                f"-q{quality} {scene.key:<40} {default_record['frames_per_second']:>14.1f} "
+                f"{variant_record['frames_per_second']:>20.1f} "
+                f"{default.wall_time / max(variant.wall_time, 1e-9):>8.2f}x {length:>8} {quality_column:>10}",
+                flush=True,
+            )
+    return failures
+
+
+# ========== ENTRY POINT ==========
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.benchmark",
+        description="Benchmark the rendering of every scene in src/.",
+    )
+    parser.add_argument(
+        "-q", "--quality", nargs="+", choices=sorted(QUALITY_FLAGS), default=DEFAULT_QUALITIES,
+        help="Quality presets to benchmark (default: l h)",
+    )
+    parser.add_argument(
+        "--scenes", nargs="+", metavar="NAME",
+        help="Only benchmark these scenes (class name or file:Class)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, metavar="N",
+        help="Render each scene N times and keep the fastest (default: 1)",
+    )
+    parser.add_argument(
+        "--baseline", default=str(BASELINE_FILE), metavar="PATH",
+        help="Baseline to compare with (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Relative slowdown reported as a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="Write the results to the baseline file instead of comparing",
+    )
+    parser.add_argument(
+        "--compare", choices=sorted(FEATURES), metavar="FEATURE",
+        help=f"Only measure the speed-up and output parity of a rendering feature ({', '.join(sorted(FEATURES))})",
+    )
+    parser.add_argument(
+        "--json", metavar="PATH",
+        help="Also write the results to this JSON file",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        scenes = select_scenes(discover_scenes(), args.scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    if args.compare:
+        return 1 if compare_feature(scenes, args.quality, args.compare, args.repeat) else 0
+
+    def report(quality, key, record):
+        print(
+            f"-q{quality} {key:<40} {record['wall_time']:>7.1f} s wall {record['cpu_time']:>7.1f} s CPU "
+            f"{record['frames_per_second']:>6.1f} frames/s  TeX {record['tex_time']:>5.1f} s  "
+            f"encode {record['encode_time']:>5.1f} s  hash {record['hash_time'] * 1000:>6.0f} ms",
+            flush=True,
+        )
+
+    results, failures = run_benchmark(scenes, args.quality, args.repeat, on_record=report)
+    for result in failures:
+        print(f"\n{Path(result.file).stem}:{result.scene} failed:\n{result.error}", file=sys.stderr)
+
+    document = {"environment": environment(), "repeat": args.repeat, "results": results}
+    if args.json:
+        Path(args.json).write_text(json.dumps(document, indent=2), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        print(f"\nBaseline written to {baseline_path}")
+        return 1 if failures else 0
+    if not baseline_path.exists():
+        print(f"\nNo baseline at {baseline_path}; record one with --save-baseline")
+        return 1 if failures else 0
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    if baseline.get("environment") != document["environment"]:
+        print("\nWarning: the baseline was recorded in a different environment")
+    regressions = compare(results, baseline["results"], args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regressions above {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+    else:
+        print(f"\nNo regressions above {args.threshold:.0%}")
+    return 1 if failures or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Resume an interrupted render from the first unfinished animation.
+
+A 4K render of a long scene that is killed near the end (out of memory, a
+job time limit) used to start again from zero. ``CheckpointMixin`` writes a
+checkpoint while the scene renders: after every ``play()``/``wait()`` whose
+partial movie is complete, the movie is linked (or copied) into the
+checkpoint folder, flushed to disk, and a line with its index and a hash
+of the scene state is appended to ``checkpoint.jsonl``.
+
+When the render runs again with ``resume``, the calls found in the
+checkpoint are skipped like with ``manim -n`` (their code still runs, so
+the scene state is rebuilt, but nothing is drawn or encoded) and their
+stored movies are used in the final video. At the last skipped call the
+scene state is compared with the one in the checkpoint, so a scene that
+does not rebuild the same state is never stitched wrongly.
+
+A checkpoint belongs to one scene at one resolution, and to the source of
+its file, the output settings and the parameters of a variant (see
+:mod:`tools.variants`): if any of them changed it is discarded. It is
+removed once the scene movie is complete.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+from .section_cache import _digest, output_settings, scene_state_hash
+
+CHECKPOINT_FILE_NAME = "checkpoint.jsonl"
+
+
+def _durable_copy(source, target):
+    """Link or copy ``source`` to ``target`` and make sure it is on disk."""
+    temp_path = target.with_name(f"{target.stem}.partial{target.suffix}")
+    temp_path.unlink(missing_ok=True)
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        shutil.copyfile(source, temp_path)
+    with open(temp_path, "rb") as file:
+        os.fsync(file.fileno())
+    os.replace(temp_path, target)
+
+
+def read_checkpoint(path, key):
+    """The completed calls of the checkpoint at ``path``, if it matches ``key``."""
+    try:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return []
+    entries = []
+    try:
+        if not lines or json.loads(lines[0]).get("key") != key:
+            return []
+        for line in lines[1:]:
+            entry = json.loads(line)
+            # Only an unbroken run of calls from the first one can be resumed
+            if entry["index"] != len(entries) or not Path(entry["file"]).exists():
+                break
+            entries.append(entry)
+    except (ValueError, KeyError):
+        pass  # A line cut short by the interruption ends the checkpoint
+    return entries
+
+
+class CheckpointMixin:
+    """
+    Mixin for ``manim.scene.scene_file_writer.SceneFileWriter``.
+
+    ``checkpoint_dir``, ``resume`` and ``scene_parameters`` are set on the
+    composed class; the scene being rendered must be assigned to ``scene``
+    before ``construct`` runs. Resuming sets ``config.from_animation_number``.
+    """
+
+    checkpoint_dir = None
+    resume = False
+    scene_parameters = None
+    scene = None
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        from manim import config
+
+        source = Path(config.input_file).read_text(encoding="utf-8")
+        parameters = repr(sorted((self.scene_parameters or {}).items()))
+        self._checkpoint_key = _digest(source, scene_name, output_settings(), parameters)
+        folder_name = f"{Path(config.input_file).stem}.{scene_name}.{self.get_resolution_directory()}"
+        self._checkpoint_folder = Path(self.checkpoint_dir) / folder_name
+        self._checkpoint_file = self._checkpoint_folder / CHECKPOINT_FILE_NAME
+        self.resumed = read_checkpoint(self._checkpoint_file, self._checkpoint_key) if self.resume else []
+        if self.resumed:
+            # Drop whatever followed the resumable calls
+            self._write_lines([{"key": self._checkpoint_key}, *self.resumed])
+            config.from_animation_number = max(config.from_animation_number, len(self.resumed))
+        else:
+            shutil.rmtree(self._checkpoint_folder, ignore_errors=True)
+            self._write_lines([{"key": self._checkpoint_key}])
+
+    def _write_lines(self, records):
+        self._checkpoint_folder.mkdir(parents=True, exist_ok=True)
+        temp_path = self._checkpoint_file.with_suffix(".partial")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.writelines(json.dumps(record) + "\n" for record in records)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self._checkpoint_file)
+
+    def _append(self, record):
+        with open(self._checkpoint_file, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def add_partial_movie_file(self, hash_animation):
+        super().add_partial_movie_file(hash_animation)
+        index = self.renderer.num_plays
+        skipped = len(self.partial_movie_files) == index + 1 and self.partial_movie_files[-1] is None
+        if index < len(self.resumed) and skipped:
+            # Skipped because of the checkpoint: use the stored movie
+            stored = self.resumed[index]["file"]
+            self.partial_movie_files[-1] = stored
+            self.sections[-1].partial_movie_files[-1] = stored
+
+    def end_animation(self, allow_write=False):
+        super().end_animation(allow_write)
+        index = self.renderer.num_plays
+        if index < len(self.resumed):
+            if index == len(self.resumed) - 1 and scene_state_hash(self.scene) != self.resumed[index]["state"]:
+                shutil.rmtree(self._checkpoint_folder, ignore_errors=True)
+                raise RuntimeError(
+                    f"The scene state after call {index} differs from the checkpoint; "
+                    "the checkpoint was removed, render the scene again"
+                )
+            return
+        partial = self.partial_movie_files[index] if index < len(self.partial_movie_files) else None
+        if partial is None or not Path(partial).exists():
+            return  # Not rendered (e.g. a cached section): the checkpoint stops here
+        target = self._checkpoint_folder / f"{index:05}{Path(partial).suffix}"
+        _durable_copy(partial, target)
+        self._append({"index": index, "file": str(target), "state": scene_state_hash(self.scene)})
+
+    def finish(self):
+        super().finish()
+        shutil.rmtree(self._checkpoint_folder, ignore_errors=True)
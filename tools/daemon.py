@@ -0,0 +1,240 @@
+"""
+Keep manim imported in a long-lived process and render scenes on request.
+
+Every ``manim`` invocation pays for ``from manim import *``, the config
+parsing and the discovery of LaTeX and ffmpeg before drawing anything,
+and while a scene is being written it is rendered dozens of times an hour.
+The render daemon pays that cost once:
+
+- manim is imported when the daemon starts, and stays imported;
+- every TeX SVG the daemon has parsed stays in manim's in-memory SVG cache,
+  on top of the shared TeX cache on disk (:mod:`tools.tex_cache`);
+- before each request, only the scene modules whose file changed (and the
+  ``src/`` modules that import them) are executed again.
+
+Requests are sent over a local socket (``multiprocessing.connection``,
+listening on 127.0.0.1 and protected by a random key). The address and key
+are stored in ``media/render_daemon.json``, readable only by the user. One
+request is rendered at a time, in the daemon process itself, with the
+batch renderer options.
+
+Usage::
+
+    python -m tools.daemon serve                 # in its own terminal
+    python -m tools.daemon render --scenes src/algebraic_identities.py:SumSquare -q l
+    python -m tools.daemon status
+    python -m tools.daemon stop
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import secrets
+import sys
+import time
+from dataclasses import asdict
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+from .render import RenderJob, RenderResult, render_scene
+from .scenes import MEDIA_DIR, SRC_DIR, discover_scenes, select_scenes
+
+STATE_FILE_NAME = "render_daemon.json"
+
+
+# ========== MODULE RELOADING ==========
+def _imported_names(file):
+    """Top-level module names imported by ``file``."""
+    try:
+        tree = ast.parse(Path(file).read_text(encoding="utf-8"), filename=str(file))
+    except SyntaxError:
+        return set()  # Reported when the scene is loaded
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+class ModuleTracker:
+    """Remembers when the ``src/`` modules were loaded and forgets stale ones."""
+
+    def __init__(self, src_dir=SRC_DIR):
+        self.src_dir = Path(src_dir).resolve()
+        self.loaded = {}  # Module name -> modification time when it was loaded
+
+    def _src_modules(self):
+        for name, module in list(sys.modules.items()):
+            file = getattr(module, "__file__", None)
+            if file is not None and Path(file).resolve().parent == self.src_dir:
+                yield name, Path(file)
+
+    def forget_stale(self):
+        """
+        Remove changed ``src/`` modules, and those importing them, from
+        ``sys.modules`` so that the next render executes them again.
+        Returns the names of the removed modules.
+        """
+        modules = dict(self._src_modules())
+        stale = set()
+        for name, file in modules.items():
+            try:
+                mtime = file.stat().st_mtime
+            except FileNotFoundError:
+                mtime = None
+            if self.loaded.get(name) != mtime:
+                stale.add(name)
+        # Modules importing a stale module hold references to its old objects
+        changed = True
+        while changed:
+            changed = False
+            for name, file in modules.items():
+                if name not in stale and file.exists() and _imported_names(file) & stale:
+                    stale.add(name)
+                    changed = True
+        for name in stale:
+            del sys.modules[name]
+            self.loaded.pop(name, None)
+        return sorted(stale)
+
+    def record(self):
+        """Remember the modification time of every ``src/`` module now loaded."""
+        for name, file in self._src_modules():
+            if name not in self.loaded and file.exists():
+                self.loaded[name] = file.stat().st_mtime
+
+
+# ========== SERVER ==========
+def _patched_functions():
+    """Module attributes that render features wrap; restored after each render."""
+    import manim.mobject.text.tex_mobject as tex_mobject
+    import manim.renderer.cairo_renderer as cairo_renderer
+    import manim.utils.caching as caching
+    import manim.utils.tex_file_writing as tex_file_writing
+
+    return [
+        (tex_mobject, "tex_to_svg_file"),
+        (tex_file_writing, "tex_to_svg_file"),
+        (cairo_renderer, "get_hash_from_play_call"),
+        (caching, "get_hash_from_play_call"),
+    ]
+
+
+def render_in_process(job):
+    """Render ``job`` in this process, leaving manim as it was found."""
+    from manim import tempconfig
+
+    saved = [(module, name, getattr(module, name)) for module, name in _patched_functions()]
+    try:
+        with tempconfig({}):
+            return render_scene(job)
+    finally:
+        for module, name, function in saved:
+            setattr(module, name, function)
+
+
+def serve(media_dir=MEDIA_DIR):
+    start = time.perf_counter()
+    import manim  # noqa: F401  The whole point: import it once
+
+    state_file = Path(media_dir) / STATE_FILE_NAME
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    authkey = secrets.token_bytes(32)
+    tracker = ModuleTracker()
+    renders = 0
+    with Listener(("127.0.0.1", 0), authkey=authkey) as listener:
+        host, port = listener.address
+        fd = os.open(state_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump({"host": host, "port": port, "authkey": authkey.hex(), "pid": os.getpid()}, file)
+        print(f"Render daemon ready on {host}:{port} (manim loaded in {time.perf_counter() - start:.1f} s)")
+        try:
+            while True:
+                with listener.accept() as connection:
+                    request = connection.recv()
+                    command = request.get("command")
+                    if command == "stop":
+                        connection.send({"stopped": True})
+                        break
+                    if command == "status":
+                        connection.send({"pid": os.getpid(), "renders": renders, "modules": sorted(tracker.loaded)})
+                        continue
+                    reloaded = tracker.forget_stale()
+                    results = []
+                    for job_fields in request["jobs"]:
+                        results.append(render_in_process(RenderJob(**job_fields)).to_dict())
+                        renders += 1
+                    tracker.record()
+                    connection.send({"reloaded": reloaded, "results": results})
+        finally:
+            state_file.unlink(missing_ok=True)
+
+
+# ========== CLIENT ==========
+def connect(media_dir=MEDIA_DIR):
+    """A connection to the running daemon; raises ``ConnectionError`` if there is none."""
+    state_file = Path(media_dir) / STATE_FILE_NAME
+    try:
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+        return Client((state["host"], state["port"]), authkey=bytes.fromhex(state["authkey"]))
+    except (OSError, ValueError, KeyError) as error:
+        raise ConnectionError("No render daemon running; start one with `python -m tools.daemon serve`") from error
+
+
+def request(message, media_dir=MEDIA_DIR):
+    with connect(media_dir) as connection:
+        connection.send(message)
+        return connection.recv()
+
+
+def main(argv=None):
+    from .batch_render import build_parser, make_jobs
+
+    argv = sys.argv[1:] if argv is None else argv
+    commands = ("serve", "render", "status", "stop")
+    if not argv or argv[0] not in commands:
+        print(f"usage: python -m tools.daemon {{{','.join(commands)}}} [options]", file=sys.stderr)
+        return 2
+    command, rest = argv[0], argv[1:]
+
+    if command == "serve":
+        serve()
+        return 0
+    try:
+        if command != "render":
+            print(json.dumps(request({"command": command}), indent=2))
+            return 0
+
+        parser = build_parser()
+        parser.prog = "python -m tools.daemon render"
+        parser.description = "Render scenes in the running render daemon."
+        args = parser.parse_args(rest)
+        try:
+            scenes = select_scenes(discover_scenes(), args.scenes)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 2
+        jobs = [asdict(job) for job in make_jobs(scenes, args)]
+        reply = request({"command": "render", "jobs": jobs})
+    except ConnectionError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    if reply["reloaded"]:
+        print(f"Reloaded: {', '.join(reply['reloaded'])}")
+    results = [RenderResult(**fields) for fields in reply["results"]]
+    for result in results:
+        name = f"{Path(result.file).stem}:{result.scene}"
+        if result.error is not None:
+            print(f"[FAILED] {name}\n{result.error}", file=sys.stderr)
+        else:
+            print(f"[done] {name} in {result.wall_time:.1f} s: {', '.join(result.outputs) or '-'}")
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Redraw only the part of the frame the animating mobjects cover.
+
+Most animations of the proofs change a small part of the picture: one
+``MathTex`` step being written, an ``Indicate`` on one square. Building on
+the static layers of :mod:`tools.static_layers`, ``DirtyRectMixin`` keeps
+the previous frame and, for every new frame, only restores and redraws the
+*dirty rectangle*: the union of the pixel bounding boxes of the moving
+mobjects in the previous and the current frame (so that what they left
+behind is erased too). Inside it the background, the moving mobjects and
+the static layers are drawn in the usual order, with Cairo clipped to the
+rectangle; outside it the previous frame is kept as it is.
+
+Bounding boxes come from the mobject points, widened by the stroke (with
+room for Cairo's mitred corners) and a pixel of antialiasing. When the
+rectangle covers most of the frame the whole frame is redrawn instead.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .static_layers import composite_over
+
+# Cairo's default miter limit lets corners reach 10 half-widths out
+MITER_REACH = 5.0
+# Above this fraction of the frame, a full redraw is just as cheap
+FULL_FRAME_FRACTION = 0.6
+
+
+def _union(box, other):
+    if box is None:
+        return other
+    if other is None:
+        return box
+    return min(box[0], other[0]), max(box[1], other[1]), min(box[2], other[2]), max(box[3], other[3])
+
+
+def _intersection(box, other):
+    top, bottom = max(box[0], other[0]), min(box[1], other[1])
+    left, right = max(box[2], other[2]), min(box[3], other[3])
+    if top >= bottom or left >= right:
+        return None
+    return top, bottom, left, right
+
+
+class DirtyRectMixin:
+    """
+    Mixin for ``manim.renderer.cairo_renderer.CairoRenderer``, placed before
+    :class:`tools.static_layers.StaticLayerMixin`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._previous_valid = False  # Whether the pixel array holds the previous frame
+        self._previous_box = None  # Moving area of the previous frame
+        self.redrawn_pixels = 0
+        self.frame_pixels = 0
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self._previous_valid = False
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def pixel_bbox(self, mobjects):
+        """``(top, bottom, left, right)`` in pixels covering ``mobjects``, or None."""
+        camera = self.camera
+        lows, highs = [], []
+        margin = 0.0
+        for mobject in mobjects:
+            points = mobject.points
+            if len(points) == 0:
+                continue
+            lows.append(points.min(axis=0))
+            highs.append(points.max(axis=0))
+            if hasattr(mobject, "get_stroke_width"):
+                width = max(mobject.get_stroke_width(), mobject.get_stroke_width(background=True))
+                margin = max(margin, width * camera.cairo_line_width_multiple * MITER_REACH)
+        if not lows:
+            return None
+        low, high = np.min(lows, axis=0), np.max(highs, axis=0)
+        x_scale = camera.pixel_width / camera.frame_width
+        y_scale = camera.pixel_height / camera.frame_height
+        center = camera.frame_center
+        left = (low[0] - margin - center[0]) * x_scale + camera.pixel_width / 2
+        right = (high[0] + margin - center[0]) * x_scale + camera.pixel_width / 2
+        top = (center[1] - high[1] - margin) * y_scale + camera.pixel_height / 2
+        bottom = (center[1] - low[1] + margin) * y_scale + camera.pixel_height / 2
+        return _intersection(
+            (int(np.floor(top)) - 1, int(np.ceil(bottom)) + 1, int(np.floor(left)) - 1, int(np.ceil(right)) + 1),
+            (0, camera.pixel_height, 0, camera.pixel_width),
+        )
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        if mobjects is None or mobjects is not self._layered_for:
+            self._previous_valid = False
+            return super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        if self.skip_animations and not ignore_skipping:
+            return
+
+        moving = [mobject for run, layer, _ in self._runs if layer is None for mobject in run]
+        current_box = self.pixel_bbox(moving)
+        box = _union(self._previous_box, current_box)
+        full_redraw = not self._previous_valid
+        self._previous_box = current_box
+        self._previous_valid = True
+
+        frame_area = self.camera.pixel_width * self.camera.pixel_height
+        self.frame_pixels += frame_area
+        too_large = box is not None and (box[1] - box[0]) * (box[3] - box[2]) > FULL_FRAME_FRACTION * frame_area
+        if full_redraw or too_large:
+            self.redrawn_pixels += frame_area
+            return super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        if box is None:
+            return  # Nothing moving on screen: the previous frame is still right
+
+        top, bottom, left, right = box
+        self.redrawn_pixels += (bottom - top) * (right - left)
+        pixel_array = self.camera.pixel_array
+        background = self.static_image if self.static_image is not None else self.camera.background
+        pixel_array[top:bottom, left:right] = background[top:bottom, left:right]
+
+        ctx = self.camera.get_cairo_context(pixel_array)
+        ctx.save()
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        ctx.rectangle(left, top, right - left, bottom - top)
+        ctx.clip()
+        ctx.set_matrix(matrix)
+        try:
+            for run, layer, layer_box in self._runs:
+                if layer is None:
+                    self.camera.capture_mobjects(run, include_submobjects=False, **kwargs)
+                else:
+                    overlap = _intersection(layer_box, box)
+                    if overlap is not None:
+                        composite_over(pixel_array, layer, overlap)
+        finally:
+            ctx.restore()
@@ -0,0 +1,127 @@
+"""
+Check that every scene still builds, without rendering it.
+
+Each scene runs its ``construct`` with the null renderer
+(:mod:`tools.null_renderer`): every brace, polygon and formula is created
+and every ``play()``/``wait()`` call is checked by manim, but nothing is
+drawn or encoded. The report gives the duration of the video each scene
+would produce and, with ``-v``, every call with its animations and the
+number of mobjects on screen. Meant for CI; the exit status is 1 if any
+scene fails.
+
+Usage::
+
+    python -m tools.dry_run
+    python -m tools.dry_run --no-latex -v --scenes PythagoreanTheorem
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from .batch_render import TEX_CACHE_DIR_NAME, run_batch
+from .render import RenderJob
+from .scenes import MEDIA_DIR, discover_scenes, select_scenes
+
+
+# ========== REPORTING ==========
+def format_report(results, verbose=False):
+    lines = []
+    header = f"{'Scene':<40} {'Status':<7} {'Calls':>6} {'Video (s)':>10} {'Max mobjects':>13} {'Wall (s)':>9}"
+    lines.append(header)
+    lines.append("-" * len(header))
+    for result in results:
+        name = f"{Path(result.file).stem}:{result.scene}"
+        status = "ok" if result.error is None else "FAILED"
+        timeline = result.timeline or []
+        duration = sum(call["duration"] for call in timeline)
+        max_mobjects = max((call["family_members"] for call in timeline), default=0)
+        lines.append(
+            f"{name:<40} {status:<7} {len(timeline):>6} {duration:>10.1f} "
+            f"{max_mobjects:>13} {result.wall_time:>9.1f}"
+        )
+        if verbose:
+            for call in timeline:
+                animations = ", ".join(call["animations"])
+                lines.append(
+                    f"    {call['index']:>4}  {call['duration']:>5.1f} s  "
+                    f"{call['mobjects']:>3} mobjects ({call['family_members']:>4} with submobjects)  {animations}"
+                )
+    return "\n".join(lines)
+
+
+# ========== ENTRY POINT ==========
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.dry_run",
+        description="Run every scene in src/ without rendering it.",
+    )
+    parser.add_argument(
+        "--scenes", nargs="+", metavar="NAME",
+        help="Only check these scenes (class name or file:Class)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--no-latex", action="store_true",
+        help="Replace LaTeX by placeholder glyphs (no TeX distribution needed)",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true",
+        help="List every play()/wait() call",
+    )
+    parser.add_argument(
+        "--json", metavar="PATH",
+        help="Also write the report to this JSON file",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        scenes = select_scenes(discover_scenes(), args.scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    jobs = [
+        RenderJob(
+            file=str(scene.file),
+            scene=scene.name,
+            quality="l",  # Only sizes the unused pixel buffer
+            dry_run=True,
+            placeholder_tex=args.no_latex,
+            tex_cache_dir=None if args.no_latex else str(MEDIA_DIR / TEX_CACHE_DIR_NAME),
+        )
+        for scene in scenes
+    ]
+    workers = max(1, min(args.jobs, len(jobs)))
+    start = time.perf_counter()
+    results = run_batch(jobs, workers)
+    total_wall_time = time.perf_counter() - start
+
+    order = {(str(s.file), s.name): i for i, s in enumerate(scenes)}
+    results.sort(key=lambda r: order[(r.file, r.scene)])
+    for result in results:
+        if result.error is not None:
+            print(f"{Path(result.file).stem}:{result.scene} failed:\n{result.error}", file=sys.stderr)
+    print(format_report(results, verbose=args.verbose))
+    print(f"\n{len(results)} scenes checked in {total_wall_time:.1f} s")
+
+    if args.json:
+        report = {"wall_time": total_wall_time, "scenes": [r.to_dict() for r in results]}
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
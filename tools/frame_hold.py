@@ -0,0 +1,55 @@
+"""
+Encode static waits as held frames instead of repeated frames.
+
+During a ``self.wait()`` with nothing moving, manim already rasterises the
+frame only once, but the file writer still converts and encodes it once per
+output frame: 60 identical frames per second at high quality. With this
+mixin a run of identical frames is encoded as just two frames, the first
+and the last one, with explicit timestamps, so the partial movie becomes a
+variable-frame-rate segment of the same duration. Players and the final
+concatenation keep the timing; encoding work and file size drop to almost
+nothing for the wait.
+
+GIF output is left unchanged, because manim re-times GIF frames when it
+combines the partial movies.
+"""
+
+from __future__ import annotations
+
+# Shorter runs are written frame by frame: a hold needs two frames anyway
+MIN_HELD_FRAMES = 3
+
+
+class FrameHoldMixin:
+    """Mixin for ``manim.scene.scene_file_writer.SceneFileWriter``."""
+
+    held_frames = 0  # Frames that were not encoded thanks to holds
+
+    def open_partial_movie_stream(self, file_path=None):
+        # Set before the writer thread is started by the parent class
+        self._next_pts = 0
+        super().open_partial_movie_stream(file_path)
+
+    def _encode_frame_at(self, frame, pts):
+        import av
+
+        av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+        av_frame.pts = pts
+        av_frame.time_base = self.video_stream.codec_context.time_base
+        for packet in self.video_stream.encode(av_frame):
+            self.video_container.mux(packet)
+
+    def encode_and_write_frame(self, frame, num_frames):
+        from manim.utils.file_ops import is_gif_format
+
+        if is_gif_format():
+            return super().encode_and_write_frame(frame, num_frames)
+        if num_frames < MIN_HELD_FRAMES:
+            for offset in range(num_frames):
+                self._encode_frame_at(frame, self._next_pts + offset)
+        else:
+            # The last frame gives the segment its full duration
+            self._encode_frame_at(frame, self._next_pts)
+            self._encode_frame_at(frame, self._next_pts + num_frames - 1)
+            self.held_frames += num_frames - 2
+        self._next_pts += num_frames
@@ -0,0 +1,120 @@
+"""
+Write printable handouts: a vector still of the end of every step.
+
+Teachers hand out the steps of a proof on paper. Instead of screenshots of
+the video, this tool runs each scene without rendering it (see
+:mod:`tools.null_renderer`) and draws the shapes on screen at the end of
+every ``play()`` call, or only at the end of every section, straight from
+their geometry (see :mod:`tools.still_renderer`). Nothing is rasterised:
+the formulas stay sharp at any print size.
+
+Each scene is written as ``<Scene>.pdf``, with one page per still, or as
+``<Scene>/<call>_<section>.svg`` files. By default every scene runs in
+this process, one after the other, as the render daemon runs them (see
+:func:`tools.daemon.render_in_process`: the manim config and the TeX hooks
+are restored after each scene): manim is imported once and every formula
+after the first run comes from the TeX cache, so the whole set takes
+seconds. ``-j`` spreads the scenes over worker processes instead.
+
+Usage::
+
+    python -m tools.handouts
+    python -m tools.handouts --scenes PythagoreanTheorem --every section
+    python -m tools.handouts --format svg --output-dir site/handouts
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from .batch_render import TEX_CACHE_DIR_NAME, run_batch
+from .daemon import render_in_process
+from .render import RenderJob
+from .scenes import MEDIA_DIR, discover_scenes, select_scenes
+from .still_renderer import STILL_EVERY, STILL_FORMATS
+
+HANDOUT_DIR_NAME = "handouts"
+
+
+# ========== REPORTING ==========
+def count_stills(timeline, every):
+    """Stills taken of a dry-run timeline, as :class:`~tools.still_renderer.StillRenderer` takes them."""
+    calls = [call for call in timeline if any(name != "Wait" for name in call["animations"])]
+    return len(calls) if every == "play" else len({call["section"] for call in calls})
+
+
+# ========== ENTRY POINT ==========
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.handouts",
+        description="Write a vector still of every step of the scenes, for printed handouts.",
+    )
+    parser.add_argument(
+        "--scenes", nargs="+", metavar="NAME",
+        help="Only these scenes (class name or file:Class)",
+    )
+    parser.add_argument(
+        "--every", choices=STILL_EVERY, default="play",
+        help="A still at the end of every play() call or of every section (default: play)",
+    )
+    parser.add_argument(
+        "--format", choices=STILL_FORMATS, default="pdf",
+        help="One PDF per scene with a page per still, or one SVG per still (default: pdf)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="Number of worker processes; 1 runs every scene in this process (default: 1)",
+    )
+    parser.add_argument(
+        "--output-dir", metavar="PATH", default=str(MEDIA_DIR / HANDOUT_DIR_NAME),
+        help="Folder of the handouts (default: media/handouts/)",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        scenes = select_scenes(discover_scenes(), args.scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    jobs = [
+        RenderJob(
+            file=str(scene.file),
+            scene=scene.name,
+            quality="l",  # Only sizes the unused pixel buffer; the stills are vectors
+            dry_run=True,
+            tex_cache_dir=str(MEDIA_DIR / TEX_CACHE_DIR_NAME),
+            stills_dir=args.output_dir,
+            stills_format=args.format,
+            stills_every=args.every,
+        )
+        for scene in scenes
+    ]
+    workers = max(1, min(args.jobs, len(jobs)))
+    start = time.perf_counter()
+    if workers == 1:
+        results = [render_in_process(job) for job in jobs]
+    else:
+        results = run_batch(jobs, workers)
+    total_wall_time = time.perf_counter() - start
+
+    order = {(str(s.file), s.name): i for i, s in enumerate(scenes)}
+    results.sort(key=lambda r: order[(r.file, r.scene)])
+    for result in results:
+        if result.error is not None:
+            print(f"{Path(result.file).stem}:{result.scene} failed:\n{result.error}", file=sys.stderr)
+            continue
+        written = result.outputs[-1] if args.format == "pdf" else str(Path(args.output_dir) / result.scene)
+        print(f"{result.scene:<32} {count_stills(result.timeline, args.every):>4} stills  -> {written}")
+    print(f"\n{len(results)} handouts written in {total_wall_time:.1f} s")
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
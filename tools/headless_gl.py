@@ -0,0 +1,65 @@
+"""
+Render with manim's OpenGL renderer on a machine without a display or GPU.
+
+When it writes a video, manim's ``OpenGLRenderer`` opens no window: it asks
+moderngl for a standalone context, first through X11 and then through EGL.
+On a Linux server without a display the X11 attempt fails and EGL is used;
+:func:`prepare_headless` makes sure that EGL needs neither a display
+(``EGL_PLATFORM=surfaceless``) nor a GPU (``LIBGL_ALWAYS_SOFTWARE=1``, so
+that Mesa rasterises on the CPU with llvmpipe). Variables already set in the
+environment are left alone, so a GPU can still be used by exporting them.
+
+``python -m tools.headless_gl`` creates a context the same way and prints
+which OpenGL implementation it got, to check a machine before rendering.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+# Mesa settings for an OpenGL context without display or GPU
+SOFTWARE_ENVIRONMENT = {
+    "EGL_PLATFORM": "surfaceless",
+    "LIBGL_ALWAYS_SOFTWARE": "1",
+}
+
+
+def has_display():
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def prepare_headless():
+    """Set up the environment for a headless context; call before creating it."""
+    if sys.platform.startswith("linux") and not has_display():
+        for name, value in SOFTWARE_ENVIRONMENT.items():
+            os.environ.setdefault(name, value)
+
+
+def create_context():
+    """A standalone moderngl context, created like manim's ``OpenGLRenderer`` does."""
+    import moderngl
+
+    prepare_headless()
+    try:
+        return moderngl.create_context(standalone=True)
+    except Exception:
+        return moderngl.create_context(standalone=True, backend="egl")
+
+
+def main():
+    try:
+        context = create_context()
+    except Exception as error:
+        print(f"No OpenGL context: {error}", file=sys.stderr)
+        return 1
+    info = context.info
+    print(f"OpenGL {context.version_code // 100}.{context.version_code % 100 // 10}")
+    for key in ("GL_VENDOR", "GL_RENDERER", "GL_VERSION"):
+        print(f"{key}: {info.get(key)}")
+    context.release()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
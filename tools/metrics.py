@@ -0,0 +1,152 @@
+"""
+Measure where the render time of a scene goes.
+
+Four small pieces of instrumentation, enabled with ``RenderJob.metrics``:
+
+- ``PlayTimingMixin`` (renderer): wall and CPU time of every
+  ``play()``/``wait()`` call, with the frames it encoded;
+- ``EncodeTimingMixin`` (file writer): time spent converting and encoding
+  frames, which happens on manim's writer thread;
+- ``TexTimer``: time spent producing TeX SVGs (compilation or cache
+  lookup), which happens while mobjects are created, outside the calls;
+- ``HashTimer``: time spent hashing calls and scene states to decide what
+  can be reused (manim's partial movie cache, the section cache and the
+  checkpoints).
+
+Timing a call includes the encoding of its frames, because manim waits for
+the writer thread at the end of every call.
+"""
+
+from __future__ import annotations
+
+import time
+
+
+# ========== RENDERER ==========
+class PlayTimingMixin:
+    """Mixin for manim's ``CairoRenderer`` or ``OpenGLRenderer``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.play_timings = []
+
+    def play(self, scene, *args, **kwargs):
+        file_writer = self.file_writer
+        encode_time = getattr(file_writer, "encode_time", 0.0)
+        encoded_frames = getattr(file_writer, "encoded_frames", 0)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        super().play(scene, *args, **kwargs)
+        self.play_timings.append({
+            "index": self.num_plays - 1,
+            "animations": [type(animation).__name__ for animation in scene.animations or []],
+            "duration": scene.duration,
+            "skipped": self.skip_animations,
+            "wall_time": time.perf_counter() - wall_start,
+            "cpu_time": time.process_time() - cpu_start,
+            "encode_time": getattr(file_writer, "encode_time", 0.0) - encode_time,
+            "frames": getattr(file_writer, "encoded_frames", 0) - encoded_frames,
+        })
+
+
+# ========== FILE WRITER ==========
+class EncodeTimingMixin:
+    """Mixin for ``manim.scene.scene_file_writer.SceneFileWriter``."""
+
+    encode_time = 0.0  # Seconds spent in encode_and_write_frame
+    encoded_frames = 0  # Frames of video written (held frames included)
+
+    def encode_and_write_frame(self, frame, num_frames):
+        start = time.perf_counter()
+        super().encode_and_write_frame(frame, num_frames)
+        self.encode_time += time.perf_counter() - start
+        self.encoded_frames += num_frames
+
+
+# ========== TEX ==========
+class TexTimer:
+    """Time every call of ``tex_to_svg_file``, whatever is installed behind it."""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.calls = 0
+        self._wrapped = None
+
+    def tex_to_svg_file(self, expression, environment=None, tex_template=None):
+        start = time.perf_counter()
+        try:
+            return self._wrapped(expression, environment, tex_template)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.calls += 1
+
+    def install(self):
+        """Wrap the current ``tex_to_svg_file`` (install the TeX cache first)."""
+        import manim.mobject.text.tex_mobject as tex_mobject
+        import manim.utils.tex_file_writing as tex_file_writing
+
+        self._wrapped = tex_mobject.tex_to_svg_file
+        tex_mobject.tex_to_svg_file = self.tex_to_svg_file
+        tex_file_writing.tex_to_svg_file = self.tex_to_svg_file
+
+
+# ========== HASHING ==========
+class HashTimer:
+    """Time every call and scene state hash, whichever hash is installed."""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.calls = 0
+        self._originals = []
+
+    def _targets(self):
+        import manim.renderer.cairo_renderer as cairo_renderer
+        import manim.utils.caching as caching
+
+        from . import checkpoint, section_cache
+
+        return [
+            (cairo_renderer, "get_hash_from_play_call"),
+            (caching, "get_hash_from_play_call"),
+            (section_cache, "scene_state_hash"),
+            (checkpoint, "scene_state_hash"),
+        ]
+
+    def _timed(self, function):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.seconds += time.perf_counter() - start
+                self.calls += 1
+
+        return timed
+
+    def install(self):
+        """Wrap the current hash functions (install the fast hash first)."""
+        for module, name in self._targets():
+            function = getattr(module, name)
+            self._originals.append((module, name, function))
+            setattr(module, name, self._timed(function))
+
+    def uninstall(self):
+        for module, name, function in self._originals:
+            setattr(module, name, function)
+        self._originals = []
+
+
+def summarize(renderer, tex_timer, wall_time, hash_timer=None):
+    """The ``metrics`` dict of a :class:`tools.render.RenderResult`."""
+    file_writer = renderer.file_writer
+    frames = getattr(file_writer, "encoded_frames", 0)
+    return {
+        "frames": frames,
+        "frames_per_second": frames / wall_time if wall_time > 0 else 0.0,
+        "tex_time": tex_timer.seconds,
+        "tex_calls": tex_timer.calls,
+        "encode_time": getattr(file_writer, "encode_time", 0.0),
+        "hash_time": hash_timer.seconds if hash_timer is not None else 0.0,
+        "hash_calls": hash_timer.calls if hash_timer is not None else 0,
+        "plays": renderer.play_timings,
+    }
@@ -0,0 +1,155 @@
+"""
+A renderer that runs scenes without drawing or encoding anything.
+
+``NullRenderer`` is manim's Cairo renderer with every animation skipped and
+every frame operation turned into a no-op: ``construct`` runs completely,
+so mobjects are built, positioned and animated to their final state, but no
+pixel is drawn and no video is written. Each ``play()``/``wait()`` call is
+recorded in :attr:`NullRenderer.timeline`, with its section, the text of
+the mobjects it animates and the number of frames it would take in the
+video (see :mod:`tools.timeline`).
+
+:func:`install_placeholder_tex` additionally replaces the LaTeX compilation
+with placeholder glyphs, one box per non-blank character, for machines
+without a TeX distribution.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from manim import config
+from manim.renderer.cairo_renderer import CairoRenderer
+
+# Size of a placeholder glyph, in the points dvisvgm uses
+GLYPH_WIDTH = 5.0
+GLYPH_HEIGHT = 7.0
+# Transforms into a mobject given by the scene; the others transform a copy
+# of the mobject they animate
+EXPLICIT_TRANSFORMS = {"Transform", "ReplacementTransform", "ClockwiseTransform", "CounterclockwiseTransform"}
+
+
+def mobject_texts(mobject):
+    """The strings of the ``Tex``, ``MathTex`` and ``Text`` mobjects in the family of ``mobject``."""
+    for attribute in ("tex_string", "original_text"):
+        value = getattr(mobject, attribute, None)
+        if isinstance(value, str):
+            return [value]
+    return [text for submobject in mobject.submobjects for text in mobject_texts(submobject)]
+
+
+def animation_target(animation, shown_texts=None):
+    """
+    Type of ``animation`` and the text it animates (and turns into, for
+    transforms). ``shown_texts`` maps ``id()`` of mobjects that earlier
+    transforms turned into other formulas to ``(mobject, text shown)``:
+    a ``Transform`` keeps the ``tex_string`` of the mobject it animates,
+    not the one displayed.
+    """
+    shown_texts = {} if shown_texts is None else shown_texts
+    target = {"type": type(animation).__name__, "text": None}
+    mobject = getattr(animation, "mobject", None)
+    own_text = None
+    if mobject is not None:
+        own_text = " ".join(mobject_texts(mobject)) or None
+        target["text"] = shown_texts[id(mobject)][1] if id(mobject) in shown_texts else own_text
+    target_mobject = getattr(animation, "target_mobject", None)
+    if target_mobject is not None and target_mobject is not mobject:
+        text = " ".join(mobject_texts(target_mobject)) or None
+        if text == own_text and type(animation).__name__ not in EXPLICIT_TRANSFORMS:
+            # A copy of the mobject (Indicate, .animate...): the formula shown stays
+            text = target["text"]
+        if text != target["text"]:
+            target["target_text"] = text
+    return target
+
+
+def video_frames(duration, frozen):
+    """Frames manim writes for a call of ``duration`` seconds, as its Cairo renderer counts them."""
+    if frozen:  # A static wait, see CairoRenderer.freeze_current_frame
+        return int(duration / (1 / config.frame_rate))
+    return len(np.arange(0, duration, 1 / config.frame_rate))
+
+
+class NullRenderer(CairoRenderer):
+    def __init__(self, **kwargs):
+        super().__init__(skip_animations=True, **kwargs)
+        self.timeline = []
+        self._frozen = False
+        self._shown_texts = {}  # See animation_target
+
+    def play(self, scene, *args, **kwargs):
+        self._frozen = False
+        super().play(scene, *args, **kwargs)
+        animations = scene.animations or []
+        sections = self.file_writer.sections
+        targets = [animation_target(animation, self._shown_texts) for animation in animations]
+        for animation, target in zip(animations, targets):
+            if "target_text" in target:
+                self._shown_texts[id(animation.mobject)] = (animation.mobject, target["target_text"])
+        self.timeline.append({
+            "index": self.num_plays - 1,
+            "animations": [type(animation).__name__ for animation in animations],
+            "targets": targets,
+            "section": sections[-1].name if sections else None,
+            "duration": scene.duration,
+            "frames": video_frames(scene.duration, self._frozen),
+            "mobjects": len(scene.mobjects),
+            "family_members": len(scene.get_mobject_family_members()),
+        })
+
+    # ========== NOTHING TO DRAW ==========
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def render(self, scene, time, moving_mobjects):
+        pass
+
+    def add_frame(self, frame, num_frames=1):
+        pass
+
+    def freeze_current_frame(self, duration):
+        self._frozen = True
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None
+        return None
+
+
+# ========== PLACEHOLDER TEX ==========
+def placeholder_svg(expression):
+    """An SVG with one box per non-blank character of ``expression``."""
+    glyphs = [char for char in expression if not char.isspace()]
+    width = max(len(glyphs), 1) * GLYPH_WIDTH
+    paths = "".join(
+        f'<path d="M {i * GLYPH_WIDTH:g} 0 h {GLYPH_WIDTH * 0.8:g} v {GLYPH_HEIGHT:g} '
+        f'h {-GLYPH_WIDTH * 0.8:g} z"/>'
+        for i in range(len(glyphs))
+    )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}pt" height="{GLYPH_HEIGHT:g}pt" '
+        f'viewBox="0 0 {width:g} {GLYPH_HEIGHT:g}">{paths}</svg>'
+    )
+
+
+def install_placeholder_tex(directory=None):
+    """Route every TeX compilation of this process to :func:`placeholder_svg`."""
+    import manim.mobject.text.tex_mobject as tex_mobject
+    import manim.utils.tex_file_writing as tex_file_writing
+
+    directory = Path(directory or tempfile.mkdtemp(prefix="manim_placeholder_tex_"))
+    directory.mkdir(parents=True, exist_ok=True)
+
+    def tex_to_svg_file(expression, environment=None, tex_template=None):
+        name = hashlib.sha256(expression.encode("utf-8")).hexdigest()[:16]
+        path = directory / f"{name}.svg"
+        if not path.exists():
+            path.write_text(placeholder_svg(expression), encoding="utf-8")
+        return path
+
+    tex_mobject.tex_to_svg_file = tex_to_svg_file
+    tex_file_writing.tex_to_svg_file = tex_to_svg_file
+    return directory
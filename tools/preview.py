@@ -0,0 +1,216 @@
+"""
+Re-render a scene every time its source is saved and show the new video.
+
+``python -m tools.preview`` watches ``src/`` with watchdog. When a file is
+saved, the scenes it defines (and the scenes of every ``src/`` module that
+imports it) are rendered again, in the preview process itself, where manim
+stays imported between renders (see :mod:`tools.daemon`). Renders are low
+quality by default and always use the section cache
+(:mod:`tools.section_cache`) and manim's partial movie cache, so editing
+the algebraic derivation of ``PythagoreanTheorem`` re-renders that section
+only: the sections before it are stitched from the cache, and the
+animations after it whose hash did not change are taken from their
+partial movie files. The preview then reports which section changed.
+
+The video is shown in an ``ffplay`` window, looping, which is replaced by
+the new video after every render. Without ``ffplay``, the video is opened
+with the system viewer instead, like ``manim -p``.
+
+Usage::
+
+    python -m tools.preview --scenes PythagoreanTheorem   # render it, then watch
+    python -m tools.preview                               # only render what changes
+"""
+
+from __future__ import annotations
+
+import queue
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .daemon import ModuleTracker, _imported_names, render_in_process
+from .scenes import SRC_DIR, discover_scenes, select_scenes
+from .section_cache import split_sections
+
+# Editors save in bursts of events (temporary file, rename, metadata)
+DEBOUNCE_SECONDS = 0.2
+# Events of a file being written. watchdog 4 and later also reports files
+# being opened and closed without writing, which the preview itself does
+# every time it reads the sources.
+WRITE_EVENTS = ("modified", "created", "moved", "closed")
+
+
+# ========== CHANGE DETECTION ==========
+class SourceEvents:
+    """watchdog event handler queueing the Python files changed in ``src/``."""
+
+    def __init__(self, changes):
+        self.changes = changes
+
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in WRITE_EVENTS:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            path = Path(path)
+            if path.suffix == ".py" and path.resolve().parent == SRC_DIR.resolve():
+                self.changes.put(path.resolve())
+
+
+def wait_for_changes(changes):
+    """Block until files change, then return them once they stop changing."""
+    files = {changes.get()}
+    while True:
+        try:
+            files.add(changes.get(timeout=DEBOUNCE_SECONDS))
+        except queue.Empty:
+            return files
+
+
+def affected_scenes(scenes, files):
+    """The scenes defined in ``files`` or in a ``src/`` module importing them."""
+    stale = {Path(file).stem for file in files}
+    sources = {scene.file for scene in scenes}
+    changed = True
+    while changed:
+        changed = False
+        for source in sources:
+            if source.stem not in stale and source.exists() and _imported_names(source) & stale:
+                stale.add(source.stem)
+                changed = True
+    return [scene for scene in scenes if scene.file.stem in stale]
+
+
+def section_snapshot(scene):
+    """The section sources of ``scene``, or None if its file cannot be parsed."""
+    try:
+        return split_sections(scene.file, scene.name)
+    except (OSError, SyntaxError):
+        return None
+
+
+def describe_change(before, after):
+    """Which part of a scene changed between two :func:`section_snapshot`."""
+    if before is None or after is None or before[0] != after[0] or before[2] != after[2]:
+        return "whole scene"
+    names, old_sources, new_sources = after[0], before[1], after[1]
+    for index, (old, new) in enumerate(zip(old_sources, new_sources)):
+        if old != new:
+            return f"section '{names[index]}'" if names[index] else f"section {index + 1}"
+    return "imported code"
+
+
+# ========== PREVIEW WINDOW ==========
+class PreviewWindow:
+    """A looping ``ffplay`` window, replaced every time a video is shown."""
+
+    def __init__(self):
+        self.player = shutil.which("ffplay")
+        self.process = None
+
+    def show(self, video, title):
+        self.close()
+        if self.player is None:
+            from manim.utils.file_ops import open_file
+
+            open_file(video)
+            return
+        self.process = subprocess.Popen(
+            [self.player, "-loglevel", "error", "-loop", "0", "-window_title", title, str(video)],
+            stdin=subprocess.DEVNULL,
+        )
+
+    def close(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            self.process.wait()
+        self.process = None
+
+
+# ========== ENTRY POINT ==========
+def main(argv=None):
+    from .batch_render import build_parser, make_jobs
+
+    parser = build_parser()
+    parser.prog = "python -m tools.preview"
+    parser.description = "Re-render scenes when their source is saved and show the new video."
+    parser.set_defaults(quality="l")
+    for action in parser._actions:
+        if action.dest == "quality":
+            action.help = "Quality, as in manim -q<flag> (default: l)"
+        elif action.dest == "scenes":
+            action.help = "Render these scenes at start and only preview them"
+    parser.add_argument(
+        "--no-window", action="store_true",
+        help="Only render, do not show the videos",
+    )
+    args = parser.parse_args(argv)
+    try:
+        from watchdog.observers import Observer
+    except ImportError:
+        print("The preview needs watchdog (pip install -r requirements.txt)", file=sys.stderr)
+        return 2
+    try:
+        watched = select_scenes(discover_scenes(), args.scenes) if args.scenes else None
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    import manim  # noqa: F401  Imported once, before the first save
+
+    tracker = ModuleTracker()
+    window = None if args.no_window else PreviewWindow()
+    snapshots = {}
+
+    def render(scenes, reason):
+        tracker.forget_stale()
+        for job, scene in zip(make_jobs(scenes, args), scenes):
+            print(f"[render] {scene.key}: {reason(scene)}", flush=True)
+            result = render_in_process(job)
+            snapshots[scene.key] = section_snapshot(scene)
+            if result.error is not None:
+                print(f"[FAILED] {scene.key}\n{result.error}", file=sys.stderr, flush=True)
+                continue
+            cached = f", {len(result.cached_sections)} sections from the cache" if result.cached_sections else ""
+            print(f"[done] {scene.key} in {result.wall_time:.1f} s{cached}", flush=True)
+            videos = [path for path in result.outputs if Path(path).suffix != ".json"]
+            if window is not None and videos:
+                window.show(videos[0], scene.key)
+        tracker.record()
+
+    for scene in discover_scenes():
+        snapshots[scene.key] = section_snapshot(scene)
+    if watched:
+        render(watched, lambda scene: "first render")
+
+    changes = queue.Queue()
+    observer = Observer()
+    observer.schedule(SourceEvents(changes), str(SRC_DIR), recursive=False)
+    observer.start()
+    print(f"Watching {SRC_DIR} (Ctrl+C to stop)", flush=True)
+    try:
+        while True:
+            files = wait_for_changes(changes)
+            start = time.perf_counter()
+            scenes = affected_scenes(discover_scenes(), files)
+            if watched is not None:
+                keys = {scene.key for scene in watched}
+                scenes = [scene for scene in scenes if scene.key in keys]
+            if not scenes:
+                continue
+            render(scenes, lambda scene: describe_change(snapshots.get(scene.key), section_snapshot(scene)) + " changed")
+            print(f"Updated in {time.perf_counter() - start:.1f} s after saving", flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        observer.stop()
+        observer.join()
+        if window is not None:
+            window.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Record a timing trace of a scene render, viewable in Perfetto or Chrome.
+
+When enabled (``RenderJob.trace_file``, ``--trace`` in the batch renderer),
+the methods manim runs for every ``play()``/``wait()`` call are wrapped so
+that each run becomes a trace event:
+
+- ``play``: the whole call, named after its animations;
+- ``setup``: ``compile_animation_data`` and ``begin_animations``;
+- ``hash``: hashing the call for manim's partial movie cache;
+- ``interpolate``: moving the mobjects to the time of each frame;
+- ``rasterise``: drawing each frame with Cairo;
+- ``encode``: converting and encoding frames (on manim's writer thread)
+  and joining the partial movies at the end;
+- ``tex``: producing each TeX SVG, including the batched prewarm.
+
+The trace is written in the Chrome trace event format: open it at
+https://ui.perfetto.dev or in ``chrome://tracing``. Run this module on a
+trace to print the time per category and the slowest calls::
+
+    python -m tools.profiling media/traces/pythagorean_theorem.PythagoreanTheorem.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# ========== RECORDING ==========
+class TraceRecorder:
+    """Collects complete ("X") trace events from any thread."""
+
+    def __init__(self):
+        self.events = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._threads = {}
+
+    def _thread_id(self):
+        ident = threading.get_ident()
+        if ident not in self._threads:
+            self._threads[ident] = (len(self._threads), threading.current_thread().name)
+        return self._threads[ident][0]
+
+    def add(self, name, category, start, end, args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": self._thread_id(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name, category, args=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, category, start, time.perf_counter(), args)
+
+    def wrap(self, function, name, category):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.span(name, category):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    def write(self, path):
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+            for tid, name in self._threads.values()
+        ]
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}),
+            encoding="utf-8",
+        )
+
+
+# ========== MANIM HOOKS ==========
+def restore_patches(patched):
+    """Put back the module attributes returned by the ``instrument_*`` functions."""
+    for module, name, original in reversed(patched):
+        setattr(module, name, original)
+
+
+def instrument_tex(recorder):
+    """
+    Record every ``tex_to_svg_file`` call (install the TeX cache first).
+    Returns the patched module attributes, see :func:`restore_patches`.
+    """
+    import manim.mobject.text.tex_mobject as tex_mobject
+    import manim.utils.tex_file_writing as tex_file_writing
+
+    original = tex_mobject.tex_to_svg_file
+
+    def tex_to_svg_file(expression, environment=None, tex_template=None):
+        with recorder.span("tex_to_svg_file", "tex", {"expression": expression}):
+            return original(expression, environment, tex_template)
+
+    patched = [
+        (tex_mobject, "tex_to_svg_file", tex_mobject.tex_to_svg_file),
+        (tex_file_writing, "tex_to_svg_file", tex_file_writing.tex_to_svg_file),
+    ]
+    tex_mobject.tex_to_svg_file = tex_to_svg_file
+    tex_file_writing.tex_to_svg_file = tex_to_svg_file
+    return patched
+
+
+def instrument_scene(scene, recorder):
+    """
+    Wrap the methods manim calls on ``scene`` and its renderer while
+    rendering. Returns the patched module attributes, see
+    :func:`restore_patches`.
+    """
+    import manim.renderer.cairo_renderer as cairo_renderer
+
+    renderer = scene.renderer
+    file_writer = renderer.file_writer
+
+    for name in ("compile_animation_data", "begin_animations"):
+        setattr(scene, name, recorder.wrap(getattr(scene, name), name, "setup"))
+    scene.update_to_time = recorder.wrap(scene.update_to_time, "update_to_time", "interpolate")
+    renderer.update_frame = recorder.wrap(renderer.update_frame, "update_frame", "rasterise")
+    file_writer.encode_and_write_frame = recorder.wrap(
+        file_writer.encode_and_write_frame, "encode_and_write_frame", "encode"
+    )
+    file_writer.combine_to_movie = recorder.wrap(file_writer.combine_to_movie, "combine_to_movie", "encode")
+    patched = [(cairo_renderer, "get_hash_from_play_call", cairo_renderer.get_hash_from_play_call)]
+    cairo_renderer.get_hash_from_play_call = recorder.wrap(
+        cairo_renderer.get_hash_from_play_call, "get_hash_from_play_call", "hash"
+    )
+
+    play = renderer.play
+
+    def traced_play(scene, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return play(scene, *args, **kwargs)
+        finally:
+            animations = [type(animation).__name__ for animation in scene.animations or []]
+            recorder.add(
+                f"play {renderer.num_plays - 1}: {', '.join(animations)}", "play",
+                start, time.perf_counter(),
+                {"duration": scene.duration, "skipped": renderer.skip_animations},
+            )
+
+    renderer.play = traced_play
+    return patched
+
+
+# ========== SUMMARY ==========
+def summarize_trace(trace, top=10):
+    """Seconds per category and the ``top`` slowest calls of a trace."""
+    totals = defaultdict(float)
+    plays = []
+    for event in trace["traceEvents"]:
+        if event.get("ph") != "X":
+            continue
+        totals[event["cat"]] += event["dur"] / 1e6
+        if event["cat"] == "play":
+            plays.append((event["dur"] / 1e6, event["name"]))
+    plays.sort(reverse=True)
+    return dict(totals), plays[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.profiling",
+        description="Summarise a trace written with --trace.",
+    )
+    parser.add_argument("trace", help="Trace JSON file")
+    parser.add_argument("--top", type=int, default=10, help="Number of calls to list (default: 10)")
+    args = parser.parse_args(argv)
+
+    totals, plays = summarize_trace(json.loads(Path(args.trace).read_text(encoding="utf-8")), args.top)
+    print("Seconds per category (nested categories are included in 'play'):")
+    for category, seconds in sorted(totals.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {category:<12} {seconds:>8.2f}")
+    print(f"\nSlowest {len(plays)} calls:")
+    for seconds, name in plays:
+        print(f"  {seconds:>8.2f}  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
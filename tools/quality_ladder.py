@@ -0,0 +1,147 @@
+"""
+Render each scene once and derive every lower quality from that video.
+
+Publishing a proof at 480p, 720p, 1080p and 4K used to take one full
+render per quality, each with its own TeX and Cairo work. Here each scene
+is rendered once at the top quality (``-q``, 4K by default) with the batch
+renderer, and as soon as it finishes the lower renditions are produced by
+a single ffmpeg run: the video is decoded once, split, and each branch is
+scaled (Lanczos) and resampled to its frame rate before encoding. Every
+rendition is written where ``manim -q<flag>`` would write it, e.g.
+``media/videos/<file>/720p30/<Scene>.mp4``.
+
+Requires the ``ffmpeg`` command on the PATH.
+
+Usage::
+
+    python -m tools.quality_ladder                      # 4K + 480p, 720p, 1080p
+    python -m tools.quality_ladder -q h --renditions l  # 1080p + 480p
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .batch_render import (
+    build_parser, estimate_costs, format_summary, load_history, make_jobs, run_batch, schedule,
+)
+from .render import QUALITY_FLAGS
+from .scenes import discover_scenes, select_scenes
+
+# Same values as manim.constants.QUALITIES: (width, height, frame rate)
+QUALITY_FORMATS = {
+    "l": (854, 480, 15),
+    "m": (1280, 720, 30),
+    "h": (1920, 1080, 60),
+    "p": (2560, 1440, 60),
+    "k": (3840, 2160, 60),
+}
+DEFAULT_RENDITIONS = ["l", "m", "h"]
+# Encoder settings of manim's partial movie files
+ENCODER_OPTIONS = ["-c:v", "libx264", "-crf", "23", "-pix_fmt", "yuv420p", "-movflags", "+faststart"]
+
+
+def rendition_path(media_dir, file, scene, quality):
+    """Where ``manim -q<quality>`` writes the video of ``scene``."""
+    _, height, frame_rate = QUALITY_FORMATS[quality]
+    return Path(media_dir) / "videos" / Path(file).stem / f"{height}p{frame_rate}" / f"{scene}.mp4"
+
+
+def ladder_command(source, targets):
+    """
+    One ffmpeg command producing every ``(quality, path)`` of ``targets``
+    from ``source``, decoding it only once.
+    """
+    labels = [f"v{i}" for i in range(len(targets))]
+    branches = [f"[0:v]split={len(targets)}" + "".join(f"[{label}in]" for label in labels)]
+    outputs = []
+    for label, (quality, path) in zip(labels, targets):
+        width, height, frame_rate = QUALITY_FORMATS[quality]
+        branches.append(f"[{label}in]scale={width}:{height}:flags=lanczos,fps={frame_rate}[{label}]")
+        outputs += ["-map", f"[{label}]", *ENCODER_OPTIONS, str(path)]
+    return [
+        "ffmpeg", "-y", "-loglevel", "error", "-i", str(source),
+        "-filter_complex", ";".join(branches), *outputs,
+    ]
+
+
+def derive_renditions(source, targets):
+    """Run :func:`ladder_command`; raises ``subprocess.CalledProcessError`` on failure."""
+    if not targets:
+        return
+    for _, path in targets:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    subprocess.run(ladder_command(source, targets), check=True)
+
+
+# ========== ENTRY POINT ==========
+def main(argv=None):
+    parser = build_parser()
+    parser.prog = "python -m tools.quality_ladder"
+    parser.description = "Render every scene once at the top quality and derive the lower ones."
+    parser.set_defaults(quality="k")
+    for action in parser._actions:
+        if action.dest == "quality":
+            action.help = "Top quality, the only one rendered by manim (default: k)"
+    parser.add_argument(
+        "--renditions", nargs="+", choices=sorted(QUALITY_FLAGS), default=DEFAULT_RENDITIONS,
+        help="Lower qualities derived from the top one (default: l m h)",
+    )
+    args = parser.parse_args(argv)
+    if shutil.which("ffmpeg") is None:
+        print("The quality ladder needs the ffmpeg command on the PATH", file=sys.stderr)
+        return 2
+    top_height = QUALITY_FORMATS[args.quality][1]
+    renditions = [q for q in args.renditions if QUALITY_FORMATS[q][1] < top_height]
+    try:
+        scenes = select_scenes(discover_scenes(), args.scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    ordered = schedule(scenes, estimate_costs(scenes, load_history(args.media_dir).get(args.quality, {})))
+    workers = max(1, min(args.jobs, len(ordered)))
+    print(
+        f"Rendering {len(ordered)} scenes at -q{args.quality} on {workers} workers, "
+        f"deriving -q{' -q'.join(renditions) if renditions else ' nothing'}"
+    )
+    failures = []
+
+    def derive(result):
+        name = f"{Path(result.file).stem}:{result.scene}"
+        source = rendition_path(args.media_dir, result.file, result.scene, args.quality)
+        if result.error is not None or not source.exists():
+            print(f"[FAILED] {name} in {result.wall_time:.1f} s", flush=True)
+            failures.append(name)
+            return
+        start = time.perf_counter()
+        targets = [(q, rendition_path(args.media_dir, result.file, result.scene, q)) for q in renditions]
+        try:
+            derive_renditions(source, targets)
+        except subprocess.CalledProcessError:
+            print(f"[FAILED] {name}: ffmpeg could not derive the renditions", flush=True)
+            failures.append(name)
+            return
+        result.outputs += [str(path) for _, path in targets]
+        print(
+            f"[done] {name} in {result.wall_time:.1f} s + {time.perf_counter() - start:.1f} s of downscaling",
+            flush=True,
+        )
+
+    start = time.perf_counter()
+    results = run_batch(make_jobs(ordered, args), workers, on_result=derive)
+    total_wall_time = time.perf_counter() - start
+    for result in results:
+        if result.error is not None:
+            print(f"\n{Path(result.file).stem}:{result.scene} failed:\n{result.error}", file=sys.stderr)
+    print()
+    print(format_summary(results, total_wall_time, workers))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
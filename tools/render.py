@@ -0,0 +1,308 @@
+"""
+Render a single scene in the current process.
+
+This is the common entry point used by the batch renderer and the other
+tools: it configures manim for one scene, renders it and measures the cost.
+manim is imported lazily so that the parent process of a batch does not
+pay for it.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .animation_range import AnimationRangeMixin
+from .checkpoint import CheckpointMixin
+from .dirty_rects import DirtyRectMixin
+from .frame_hold import FrameHoldMixin
+from .headless_gl import prepare_headless
+from .metrics import EncodeTimingMixin, HashTimer, PlayTimingMixin, TexTimer, summarize
+from .profiling import TraceRecorder, instrument_scene, instrument_tex, restore_patches
+from .scenes import MEDIA_DIR, load_scene_class, variant_class
+from .section_cache import SectionCacheMixin
+from .state_hash import use_fast_hash
+from .static_layers import StaticLayerMixin
+from .tex_batch import prewarm_scene
+from .tex_cache import DEFAULT_MAX_MB, TexCache
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Same flags as ``manim -q<flag>``
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+@dataclass
+class RenderJob:
+    """Everything a worker needs to render one scene."""
+
+    file: str
+    scene: str
+    quality: str = "h"
+    media_dir: str = str(MEDIA_DIR)
+    disable_caching: bool = False
+    verbosity: str = "WARNING"
+    tex_cache_dir: str | None = None  # Shared TeX SVG cache, see tools.tex_cache
+    tex_cache_max_mb: float = DEFAULT_MAX_MB
+    tex_prewarm: bool = False  # Compile all static TeX in one run, see tools.tex_batch
+    frame_hold: bool = False  # Encode static waits as held frames, see tools.frame_hold
+    section_cache_dir: str | None = None  # Reuse rendered sections, see tools.section_cache
+    animation_range: tuple | None = None  # (start, stop) of the calls to render, see tools.animation_range
+    dry_run: bool = False  # Run construct() without drawing anything, see tools.null_renderer
+    placeholder_tex: bool = False  # Replace LaTeX by placeholder glyphs (dry runs)
+    metrics: bool = False  # Time every call, TeX and encoding, see tools.metrics
+    trace_file: str | None = None  # Write a Chrome/Perfetto trace here, see tools.profiling
+    static_layers: bool = False  # Rasterise untouched mobjects once per animation, see tools.static_layers
+    dirty_rects: bool = False  # Redraw only around moving mobjects (implies static_layers), see tools.dirty_rects
+    renderer: str = "cairo"  # "cairo" or "opengl" (headless), see tools.headless_gl
+    checkpoint_dir: str | None = None  # Record every finished call here, see tools.checkpoint
+    resume: bool = False  # Skip the calls recorded in the checkpoint
+    fast_hash: bool = False  # Hash calls with tools.state_hash instead of manim's JSON hash
+    variant: str | None = None  # Render <scene>_<variant> with the class attributes in parameters
+    parameters: dict | None = None  # See tools.variants
+    vector_animation: str | None = None  # Dry runs: write a vector animation here, see tools.vector_export
+    stills_dir: str | None = None  # Dry runs: write vector stills of the steps here, see tools.handouts
+    stills_format: str = "pdf"  # "pdf" (one page per still) or "svg"
+    stills_every: str = "play"  # A still after every "play" call or at the end of every "section"
+
+
+@dataclass
+class RenderResult:
+    """Measurements and outputs of one rendered scene."""
+
+    file: str
+    scene: str
+    variant: str | None = None
+    wall_time: float = 0.0  # Seconds
+    cpu_time: float = 0.0  # Seconds of CPU used by the worker process
+    peak_rss_mb: float | None = None  # Peak resident memory of the worker
+    num_plays: int = 0
+    outputs: list = field(default_factory=list)
+    tex_cache: dict | None = None  # Hit/miss counters of the TeX cache
+    tex_prewarm: dict | None = None  # Statistics of the batched TeX compilation
+    held_frames: int | None = None  # Frames skipped by the encoder thanks to frame holds
+    cached_sections: list | None = None  # Sections stitched from the section cache
+    resumed_plays: int | None = None  # Calls taken from a checkpoint
+    animation_range: tuple | None = None  # Range rendered by a split worker
+    play_durations: list | None = None  # Duration of every play()/wait() of a split worker
+    timeline: list | None = None  # Every play()/wait() call of a dry run
+    metrics: dict | None = None  # Detailed timings, see tools.metrics
+    error: str | None = None
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def peak_rss_mb():
+    """Peak resident set size of the current process in MiB (None on Windows)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def configure_manim(job):
+    """Apply the job settings to the global manim config."""
+    from manim import config
+
+    config.quality = QUALITY_FLAGS[job.quality]
+    config.media_dir = job.media_dir
+    # Makes the output land in media/videos/<module>/<quality>/ like the CLI
+    config.input_file = job.file
+    config.disable_caching = job.disable_caching
+    config.progress_bar = "none"
+    config.verbosity = job.verbosity
+    config.preview = False
+    config.dry_run = job.dry_run
+    # Also swaps the base classes of the mobjects, see manim's ConvertToOpenGL
+    config.renderer = job.renderer
+    if job.renderer == "opengl":
+        prepare_headless()
+    start, stop = job.animation_range or (0, None)
+    config.from_animation_number = start
+    config.upto_animation_number = -1 if stop is None else stop - 1
+    return config
+
+
+def file_writer_mixins(job):
+    """
+    Mixins to combine with manim's ``SceneFileWriter`` for this job, and the
+    class attributes that configure them.
+    """
+    mixins = []
+    attributes = {}
+    if job.animation_range is not None:
+        # First, so that its finish() replaces the others'
+        mixins.append(AnimationRangeMixin)
+    if job.metrics:
+        mixins.append(EncodeTimingMixin)
+    if job.section_cache_dir is not None:
+        mixins.append(SectionCacheMixin)
+        attributes["section_cache_dir"] = job.section_cache_dir
+    if job.checkpoint_dir is not None and job.animation_range is None:
+        mixins.append(CheckpointMixin)
+        attributes["checkpoint_dir"] = job.checkpoint_dir
+        attributes["resume"] = job.resume
+        attributes["scene_parameters"] = job.parameters
+    if job.frame_hold:
+        mixins.append(FrameHoldMixin)
+    return mixins, attributes
+
+
+def make_renderer(job):
+    """A renderer whose file writer includes the features enabled in ``job``."""
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    if job.dry_run:
+        if job.vector_animation is not None:
+            from .vector_animation import VectorAnimationRenderer
+
+            return VectorAnimationRenderer()
+        if job.stills_dir is not None:
+            from .still_renderer import StillRenderer
+
+            return StillRenderer(every=job.stills_every)
+        from .null_renderer import NullRenderer
+
+        return NullRenderer()
+    mixins, attributes = file_writer_mixins(job)
+    file_writer_class = SceneFileWriter
+    if mixins:
+        file_writer_class = type("SceneFileWriter", (*mixins, SceneFileWriter), attributes)
+    renderer_mixins = []
+    if job.metrics:
+        renderer_mixins.append(PlayTimingMixin)
+    if job.renderer == "opengl":
+        from manim.renderer.opengl_renderer import OpenGLRenderer
+
+        if job.static_layers or job.dirty_rects:
+            raise ValueError("Static layers and dirty rectangles need the Cairo renderer")
+        renderer_class = OpenGLRenderer
+        if renderer_mixins:
+            renderer_class = type("OpenGLRenderer", (*renderer_mixins, OpenGLRenderer), {})
+        return renderer_class(file_writer_class=file_writer_class)
+    if job.dirty_rects:
+        renderer_mixins.append(DirtyRectMixin)
+    if job.static_layers or job.dirty_rects:
+        renderer_mixins.append(StaticLayerMixin)
+    renderer_class = CairoRenderer
+    if renderer_mixins:
+        renderer_class = type("CairoRenderer", (*renderer_mixins, CairoRenderer), {})
+    return renderer_class(file_writer_class=file_writer_class)
+
+
+def collect_outputs(scene):
+    """Paths of the files written for ``scene``."""
+    file_writer = scene.renderer.file_writer
+    outputs = []
+    for attribute in ("movie_file_path", "image_file_path"):
+        path = getattr(file_writer, attribute, None)
+        if path is not None and Path(path).exists():
+            outputs.append(str(path))
+    return outputs
+
+
+def render_scene(job):
+    """Render ``job`` and return a :class:`RenderResult`; errors are captured."""
+    result = RenderResult(
+        file=job.file, scene=job.scene, variant=job.variant, animation_range=job.animation_range
+    )
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    tex_cache = None
+    tex_timer = None
+    hash_timer = None
+    recorder = TraceRecorder() if job.trace_file is not None else None
+    patched = []  # Module attributes wrapped by the trace recorder
+    private_tex_dir = None
+    scene = None
+    try:
+        config = configure_manim(job)
+        if job.placeholder_tex:
+            from .null_renderer import install_placeholder_tex
+
+            private_tex_dir = str(install_placeholder_tex())
+        elif job.tex_cache_dir is not None:
+            tex_cache = TexCache(job.tex_cache_dir, max_bytes=job.tex_cache_max_mb * 1024 * 1024)
+            tex_cache.install()
+            # manim deletes the intermediate files of its Tex folder after each
+            # compilation; a private folder keeps parallel workers apart
+            private_tex_dir = tempfile.mkdtemp(prefix="manim_tex_")
+            config.tex_dir = private_tex_dir
+        # Set for every job: an earlier job in this process may have changed it
+        use_fast_hash(job.fast_hash)
+        if job.metrics:
+            tex_timer = TexTimer()
+            tex_timer.install()
+            hash_timer = HashTimer()
+            hash_timer.install()
+        if recorder is not None:
+            patched += instrument_tex(recorder)
+        if job.tex_prewarm and not job.placeholder_tex:
+            span = recorder.span("prewarm_scene", "tex") if recorder is not None else nullcontext()
+            with span:
+                result.tex_prewarm = prewarm_scene(job.file, job.scene, tex_cache)
+        scene_class = load_scene_class(job.file, job.scene)
+        if job.parameters is not None:
+            scene_class = variant_class(scene_class, job.variant, job.parameters)
+        scene = scene_class(renderer=make_renderer(job))
+        # Mixins that look at the scene state (e.g. the section cache) need it
+        scene.renderer.file_writer.scene = scene
+        if recorder is not None:
+            patched += instrument_scene(scene, recorder)
+        scene.render()
+        result.num_plays = scene.renderer.num_plays
+        result.outputs = collect_outputs(scene)
+        if job.dry_run:
+            result.timeline = scene.renderer.timeline
+        if job.dry_run and job.vector_animation is not None:
+            result.outputs.append(scene.renderer.write(job.vector_animation, type(scene).__name__))
+        if job.dry_run and job.stills_dir is not None:
+            result.outputs += scene.renderer.write(job.stills_dir, type(scene).__name__, job.stills_format)
+        if job.animation_range is not None:
+            result.outputs = list(scene.renderer.file_writer.range_partial_movie_files)
+            result.play_durations = list(scene.renderer.file_writer.play_durations)
+        if job.frame_hold:
+            result.held_frames = scene.renderer.file_writer.held_frames
+        if job.section_cache_dir is not None:
+            result.cached_sections = list(scene.renderer.file_writer.cached_sections)
+        if job.checkpoint_dir is not None and job.animation_range is None:
+            result.resumed_plays = len(scene.renderer.file_writer.resumed)
+    except Exception:
+        result.error = traceback.format_exc()
+    # Later renders in this process (daemon, preview) must not feed this recorder
+    restore_patches(patched)
+    if tex_cache is not None:
+        result.tex_cache = tex_cache.stats()
+    if private_tex_dir is not None:
+        shutil.rmtree(private_tex_dir, ignore_errors=True)
+    result.wall_time = time.perf_counter() - wall_start
+    result.cpu_time = time.process_time() - cpu_start
+    result.peak_rss_mb = peak_rss_mb()
+    if recorder is not None:
+        recorder.write(job.trace_file)
+        result.outputs.append(job.trace_file)
+    if hash_timer is not None:
+        hash_timer.uninstall()
+    if tex_timer is not None and scene is not None:
+        result.metrics = summarize(scene.renderer, tex_timer, result.wall_time, hash_timer)
+    return result
@@ -0,0 +1,193 @@
+"""
+Discovery and loading of the scenes defined in ``src/``.
+
+Scenes are found by parsing the source files, so listing them (and
+estimating how long they run) does not require importing manim.
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib.util
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# ========== PROJECT PATHS ==========
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = REPO_ROOT / "src"
+MEDIA_DIR = REPO_ROOT / "media"
+
+# ManimCE defaults used when a call does not pass an explicit duration
+DEFAULT_RUN_TIME = 1.0  # manim.constants.DEFAULT_ANIMATION_RUN_TIME
+DEFAULT_WAIT_TIME = 1.0  # manim.constants.DEFAULT_WAIT_TIME
+
+# Base classes that make a class a renderable scene
+SCENE_BASE_NAMES = {
+    "Scene", "MovingCameraScene", "ThreeDScene", "ZoomedScene",
+    "VectorScene", "LinearTransformationScene", "SpecialThreeDScene",
+}
+
+
+@dataclass
+class SceneInfo:
+    """A scene class found in a source file."""
+
+    file: Path
+    name: str
+    estimated_duration: float  # Seconds of video, estimated from the source
+    num_plays: int  # Number of play()/wait() calls in construct()
+
+    @property
+    def key(self):
+        return f"{self.file.stem}:{self.name}"
+
+
+def _literal_number(node):
+    """Return the value of a numeric literal node, or None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return float(node.value)
+    return None
+
+
+def _is_self_call(node, method_name):
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == method_name
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "self"
+    )
+
+
+def estimate_timeline(construct_node):
+    """
+    Estimate the video duration of a ``construct`` method from its source.
+
+    Every ``self.play`` call counts its literal ``run_time`` (or the ManimCE
+    default) and every ``self.wait`` its literal duration. Calls inside loops
+    are counted once, so the result is a lower bound used for scheduling.
+    """
+    duration = 0.0
+    num_plays = 0
+    for node in ast.walk(construct_node):
+        if _is_self_call(node, "play"):
+            run_time = None
+            for keyword in node.keywords:
+                if keyword.arg == "run_time":
+                    run_time = _literal_number(keyword.value)
+            duration += run_time if run_time is not None else DEFAULT_RUN_TIME
+            num_plays += 1
+        elif _is_self_call(node, "wait"):
+            wait_time = _literal_number(node.args[0]) if node.args else None
+            for keyword in node.keywords:
+                if keyword.arg == "duration":
+                    wait_time = _literal_number(keyword.value)
+            duration += wait_time if wait_time is not None else DEFAULT_WAIT_TIME
+            num_plays += 1
+    return duration, num_plays
+
+
+def _find_construct(class_node):
+    for item in class_node.body:
+        if isinstance(item, ast.FunctionDef) and item.name == "construct":
+            return item
+    return None
+
+
+def discover_scenes(src_dir=SRC_DIR):
+    """
+    Find every ``Scene`` subclass defined in ``src_dir/*.py``.
+
+    Subclasses of scenes defined earlier in the same file are included as
+    well, also when they only change class attributes and inherit
+    ``construct``. Files are visited in name order and classes in source
+    order.
+    """
+    scenes = []
+    for file in sorted(Path(src_dir).glob("*.py")):
+        tree = ast.parse(file.read_text(encoding="utf-8"), filename=str(file))
+        scene_names = set(SCENE_BASE_NAMES)
+        constructs = {}  # Class name -> construct() it defines or inherits
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            base_names = {
+                base.id if isinstance(base, ast.Name) else getattr(base, "attr", None)
+                for base in node.bases
+            }
+            if not base_names & scene_names:
+                continue
+            scene_names.add(node.name)
+            construct = _find_construct(node) or next(
+                (constructs[name] for name in base_names if name in constructs), None
+            )
+            if construct is None:
+                continue
+            constructs[node.name] = construct
+            duration, num_plays = estimate_timeline(construct)
+            scenes.append(SceneInfo(file.resolve(), node.name, duration, num_plays))
+    return scenes
+
+
+def select_scenes(scenes, names):
+    """
+    Keep only the scenes named in ``names``.
+
+    A name is either a class name (``SumSquare``), ``<file stem>:<class>``
+    (``algebraic_identities:SumSquare``) or ``<path>:<class>``
+    (``src/algebraic_identities.py:SumSquare``). Unknown names raise
+    ``ValueError``.
+    """
+    if not names:
+        return list(scenes)
+    selected = []
+    for name in names:
+        file, separator, class_name = name.rpartition(":")
+        if separator and file.endswith(".py"):
+            name = f"{Path(file).stem}:{class_name}"
+        matches = [s for s in scenes if name in (s.name, s.key)]
+        if not matches:
+            raise ValueError(f"Unknown scene: {name}")
+        selected.extend(m for m in matches if m not in selected)
+    return selected
+
+
+def load_module(file):
+    """Import a scene file the same way the ``manim`` command does."""
+    file = Path(file).resolve()
+    module_name = file.stem
+    if module_name in sys.modules and getattr(sys.modules[module_name], "__file__", None) == str(file):
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    # Allow scene files to import helpers living next to them
+    if str(file.parent) not in sys.path:
+        sys.path.insert(0, str(file.parent))
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_scene_class(file, name):
+    """Return the scene class ``name`` defined in ``file``."""
+    module = load_module(file)
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        raise ValueError(f"{name} is not defined in {file}") from None
+
+
+def variant_class(scene_class, name, parameters):
+    """
+    A subclass of ``scene_class`` with the class attributes in ``parameters``
+    replaced, named ``<Scene>_<name>`` (which names its video).
+
+    Only attributes the scene defines can be replaced, so that a misspelt
+    parameter is an error rather than ignored.
+    """
+    unknown = sorted(key for key in parameters if not hasattr(scene_class, key))
+    if unknown:
+        raise ValueError(f"{scene_class.__name__} has no parameter {', '.join(unknown)}")
+    attributes = dict(parameters, __module__=scene_class.__module__)
+    return type(f"{scene_class.__name__}_{name}", (scene_class,), attributes)
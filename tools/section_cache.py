@@ -0,0 +1,228 @@
+"""
+Reuse whole rendered sections of a scene between renders.
+
+A scene divided with ``self.next_section("name")`` (see
+``PythagoreanTheorem``) gets one cache key per section, computed when the
+section starts from:
+
+- the key of the previous section (so a change anywhere earlier, including
+  a parameter that later code reads from a local variable, invalidates
+  every following section);
+- the source code of the section, i.e. the lines of ``construct`` from its
+  ``next_section`` call up to the next one;
+- a hash of the scene state (the mobjects on screen) at that moment;
+- the output settings (renderer, resolution, frame rate, format, background);
+- for a variant of the scene (see :mod:`tools.variants`), the parameters
+  the section reads as ``self.<NAME>``, or all of them if code outside
+  ``construct`` reads them.
+
+Variants share the cache folder of their scene, so a section that does not
+depend on the parameters (an introduction) is rendered once for all of them.
+
+If a video for the key is stored, the section is played with
+``skip_animations`` (the code still runs, so the scene state stays correct,
+but nothing is rasterised or encoded) and the stored video is stitched in
+its place. After rendering, every freshly rendered section is stored.
+Editing the algebraic derivation therefore re-renders only that section and
+the ones after it.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import inspect
+import os
+import re
+from pathlib import Path
+
+from .state_hash import hash_mobjects
+
+
+# ========== SOURCE AND STATE HASHING ==========
+def _is_next_section_call(node):
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Call)
+        and isinstance(node.value.func, ast.Attribute)
+        and node.value.func.attr == "next_section"
+    )
+
+
+def construct_owner(scene_class):
+    """The class defining the ``construct`` of ``scene_class``; variants inherit it."""
+    return next(cls for cls in scene_class.__mro__ if "construct" in vars(cls))
+
+
+def variant_parameters(scene_class):
+    """The class attributes a variant subclass (see :mod:`tools.variants`) replaces."""
+    parameters = {}
+    for cls in reversed(scene_class.__mro__[:scene_class.__mro__.index(construct_owner(scene_class))]):
+        parameters.update((name, value) for name, value in vars(cls).items() if not name.startswith("__"))
+    return parameters
+
+
+def _parameters_read(parameters, source):
+    """``repr`` of the parameters that ``source`` reads as ``self.<NAME>``."""
+    return repr(sorted(
+        (name, repr(value)) for name, value in parameters.items()
+        if re.search(rf"\bself\.{re.escape(name)}\b", source)
+    ))
+
+
+def section_sources(scene_class):
+    """
+    Split the source of ``scene_class.construct`` at its ``next_section`` calls.
+
+    Returns ``(names, sources, outside)``: the literal name of each call (or
+    None), the source of each section, and the rest of the module source,
+    which belongs to every section. The code before the first call is part
+    of the first section.
+    """
+    owner = construct_owner(scene_class)
+    return split_sections(inspect.getsourcefile(owner), owner.__name__)
+
+
+def split_sections(file, class_name):
+    """:func:`section_sources` of the class ``class_name`` defined in ``file``."""
+    lines = Path(file).read_text(encoding="utf-8").splitlines(keepends=True)
+    tree = ast.parse("".join(lines))
+    construct = None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            construct = next(
+                (n for n in node.body if isinstance(n, ast.FunctionDef) and n.name == "construct"),
+                None,
+            )
+    if construct is None:
+        return [], [], "".join(lines)
+
+    calls = [node for node in construct.body if _is_next_section_call(node)]
+    names = []
+    for call in calls:
+        args = call.value.args
+        literal = args and isinstance(args[0], ast.Constant) and isinstance(args[0].value, str)
+        names.append(args[0].value if literal else None)
+
+    # Line numbers are 1-based and inclusive
+    first_line = construct.body[0].lineno
+    boundaries = [first_line] + [call.lineno for call in calls[1:]] + [construct.end_lineno + 1]
+    sources = [
+        "".join(lines[start - 1:end - 1])
+        for start, end in zip(boundaries, boundaries[1:])
+    ]
+    outside = "".join(lines[:first_line - 1] + lines[construct.end_lineno:])
+    return names, sources, outside
+
+
+def scene_state_hash(scene):
+    """Hash of the mobjects currently in ``scene``, see :mod:`tools.state_hash`."""
+    return hash_mobjects(scene.mobjects)
+
+
+def output_settings():
+    from manim import config
+
+    return repr((
+        str(config.renderer), config.pixel_width, config.pixel_height, config.frame_rate,
+        config.movie_file_extension, str(config.background_color),
+        config.background_opacity,
+    ))
+
+
+def _digest(*parts):
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()[:32]
+
+
+# ========== FILE WRITER ==========
+class SectionCacheMixin:
+    """
+    Mixin for ``manim.scene.scene_file_writer.SceneFileWriter``.
+
+    ``section_cache_dir`` is set on the composed class; the scene being
+    rendered must be assigned to ``scene`` before ``construct`` runs.
+    """
+
+    section_cache_dir = None
+    scene = None
+    cached_sections = ()  # Names of the sections taken from the cache
+    rendered_sections = ()  # Names of the sections rendered and stored
+    _section_index = 0
+
+    def _section_cache_setup(self):
+        names, sources, outside = section_sources(type(self.scene))
+        self._section_names = names
+        self._section_sources = sources
+        self._parameters = variant_parameters(type(self.scene))
+        self._previous_key = _digest(outside, output_settings(), _parameters_read(self._parameters, outside))
+        self._section_index = 0
+        self.cached_sections = []
+        self.rendered_sections = []
+
+    def _section_cache_path(self, key):
+        from manim import config
+
+        directory = Path(self.section_cache_dir) / construct_owner(type(self.scene)).__name__
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f"{key}{config.movie_file_extension}"
+
+    def next_section(self, name, type_, skip_animations):
+        if self.scene is None or self.section_cache_dir is None:
+            # The automatic first section, created before the scene exists
+            return super().next_section(name, type_, skip_animations)
+        if self._section_index == 0:
+            self._section_cache_setup()
+
+        index = self._section_index
+        self._section_index += 1
+        key = cached = None
+        if index < len(self._section_sources) and self._section_names[index] in (name, None):
+            source = self._section_sources[index]
+            key = _digest(
+                self._previous_key, source, scene_state_hash(self.scene),
+                _parameters_read(self._parameters, source),
+            )
+            self._previous_key = key
+            path = self._section_cache_path(key)
+            if path.exists():
+                cached = path
+                skip_animations = True
+
+        super().next_section(name, type_, skip_animations)
+        section = self.sections[-1]
+        section.cache_key = key
+        section.cached_video = cached
+        if cached is not None:
+            self.cached_sections.append(name)
+
+    def _store_rendered_sections(self):
+        for section in self.sections:
+            key = getattr(section, "cache_key", None)
+            if key is None or section.cached_video is not None or section.is_empty():
+                continue
+            if None in section.partial_movie_files:
+                continue  # Partly skipped for another reason: not a complete video
+            path = self._section_cache_path(key)
+            # Variants of a scene may store the same section at the same time
+            temp_path = path.with_name(f"{key}.{os.getpid()}.partial{path.suffix}")
+            self.combine_files(section.partial_movie_files, temp_path)
+            os.replace(temp_path, path)
+            self.rendered_sections.append(section.name)
+
+    def finish(self):
+        from manim.utils.file_ops import write_to_movie
+
+        if write_to_movie() and self.section_cache_dir is not None and self.scene is not None:
+            self._store_rendered_sections()
+            # Stitch stored sections in place of their skipped animations
+            for section in self.sections:
+                if getattr(section, "cached_video", None) is not None:
+                    section.partial_movie_files = [str(section.cached_video)]
+            self.partial_movie_files = [
+                path for section in self.sections for path in section.partial_movie_files
+            ]
+        super().finish()
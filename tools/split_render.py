@@ -0,0 +1,157 @@
+"""
+Render a single scene on several processes by splitting its animations.
+
+manim numbers every ``play()``/``wait()`` call of a scene and can skip the
+ones outside a range (``manim -n START,END``): skipped calls still run, so
+the scene reaches the same state, but they are neither rasterised nor
+encoded. A long scene is rendered in three steps:
+
+1. a counting pass runs ``construct`` with every animation skipped, which
+   gives the number of calls and their durations (and compiles all TeX);
+2. the calls are cut into ranges of roughly equal video duration and each
+   range is rendered by its own worker, which writes the usual partial
+   movie files (named by the hash of each call) and stops there, see
+   :mod:`tools.animation_range`;
+3. a final pass replays the scene with every partial movie already in
+   manim's cache and concatenates them without re-encoding.
+
+Every pass runs in a fresh worker process, so that no TeX or hash hook of
+one pass is left installed for the next. Because the final pass relies on
+manim's partial movie cache, splitting is not available with
+``--disable-caching``. With ``--trace``, each pass writes its own trace
+next to the scene's (``<file>.<Scene>.counting.json``,
+``<file>.<Scene>.calls-0-11.json``, ``<file>.<Scene>.joining.json``...).
+
+Usage::
+
+    python -m tools.split_render --scenes PythagoreanTheorem -q h -j 8
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+from .render import render_scene
+
+# Counting pass: start after any real scene so that every call is skipped
+SKIP_ALL = 10**9
+
+
+# ========== SPLITTING ==========
+def pass_job(job, name, **changes):
+    """``job`` for one pass of the split render, with its own trace file if it is traced."""
+    if job.trace_file is not None:
+        trace = Path(job.trace_file)
+        changes["trace_file"] = str(trace.with_name(f"{trace.stem}.{name}{trace.suffix}"))
+    return dataclasses.replace(job, **changes)
+
+
+def split_ranges(durations, parts):
+    """
+    Cut the calls into at most ``parts`` contiguous ``(start, stop)`` ranges
+    of roughly equal total duration. The last range is left open
+    (``stop=None``) so that it also covers any call the counting missed.
+    """
+    total = sum(durations)
+    if not durations or parts <= 1 or total <= 0:
+        return [(0, None)]
+    ranges = []
+    start = 0
+    elapsed = 0.0
+    for index, duration in enumerate(durations):
+        elapsed += duration
+        target = total * (len(ranges) + 1) / parts
+        if elapsed >= target and len(ranges) < parts - 1 and index + 1 < len(durations):
+            ranges.append((start, index + 1))
+            start = index + 1
+    ranges.append((start, None))
+    return ranges
+
+
+def split_render(job, workers, on_result=None):
+    """
+    Render ``job`` with its animations split across ``workers`` processes.
+
+    Returns the result of the final pass, whose ``outputs`` is the scene
+    movie, with the wall and CPU time of the three steps added up.
+    """
+    if job.disable_caching:
+        raise ValueError("Splitting a scene needs manim's partial movie cache")
+
+    start = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    # maxtasksperchild=1: every pass, not only the ranges, gets a fresh interpreter
+    with context.Pool(processes=max(1, workers), maxtasksperchild=1) as pool:
+        counting = pool.apply(render_scene, (pass_job(job, "counting", animation_range=(SKIP_ALL, None)),))
+        if counting.error is not None:
+            return counting
+        ranges = split_ranges(counting.play_durations, workers)
+
+        range_jobs = [
+            pass_job(
+                job, f"calls-{first}-{'end' if stop is None else stop - 1}",
+                animation_range=(first, stop), tex_prewarm=False,
+            )
+            for first, stop in ranges
+        ]
+        cpu_time = counting.cpu_time
+        held_frames = 0
+        for result in pool.imap_unordered(render_scene, range_jobs, chunksize=1):
+            cpu_time += result.cpu_time
+            held_frames += result.held_frames or 0
+            if on_result is not None:
+                on_result(result)
+            if result.error is not None:
+                return result
+
+        final = pool.apply(render_scene, (pass_job(job, "joining", tex_prewarm=False),))
+    final.tex_prewarm = counting.tex_prewarm
+    final.cpu_time += cpu_time
+    if final.held_frames is not None:
+        final.held_frames += held_frames
+    final.wall_time = time.perf_counter() - start
+    return final
+
+
+# ========== ENTRY POINT ==========
+def main(argv=None):
+    from .batch_render import build_parser, format_summary, make_jobs
+    from .scenes import discover_scenes, select_scenes
+
+    parser = build_parser()
+    parser.prog = "python -m tools.split_render"
+    parser.description = "Render scenes one at a time, each split across several processes."
+    args = parser.parse_args(argv)
+    if args.disable_caching:
+        parser.error("--disable-caching cannot be used when splitting scenes")
+    try:
+        scenes = select_scenes(discover_scenes(), args.scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    def report(result):
+        first, stop = result.animation_range
+        last = "end" if stop is None else stop - 1
+        status = "done" if result.error is None else "FAILED"
+        print(f"  [{status}] animations {first}-{last} in {result.wall_time:.1f} s", flush=True)
+
+    results = []
+    start = time.perf_counter()
+    for job in make_jobs(scenes, args):
+        print(f"Rendering {job.scene} at -q{args.quality} on {args.jobs} workers", flush=True)
+        result = split_render(job, args.jobs, on_result=report)
+        results.append(result)
+        if result.error is not None:
+            print(f"\n{job.scene} failed:\n{result.error}", file=sys.stderr)
+    print()
+    print(format_summary(results, time.perf_counter() - start, args.jobs))
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
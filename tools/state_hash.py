@@ -0,0 +1,187 @@
+"""
+Hash the state of a scene quickly enough to do it at every call.
+
+manim decides whether a ``play()``/``wait()`` can reuse a partial movie by
+hashing the call: ``get_hash_from_play_call`` converts the camera, the
+animations and every mobject on screen to JSON (arrays become lists of
+Python floats, functions their source code) and takes a CRC of the text.
+In ``PythagoreanTheorem``, with its braces, polygons and the preface
+formulas kept on screen, that costs more than many of the animations it is
+meant to skip. The section cache and the checkpoints hash the scene state
+too.
+
+``StateHasher`` hashes the same information structurally with BLAKE2:
+
+- numpy arrays (points, colours, stroke widths) are fed as raw buffers;
+- other attributes are fed compactly: numbers and strings by ``repr``,
+  colours by their RGBA array, functions by their bytecode, constants and
+  captured values;
+- every submobject is hashed once per call and its digest reused, also
+  when it appears in several families (a ``VGroup`` and its members added
+  to the scene separately, the mobject of an animation that is on screen);
+- for mobjects, references to other mobjects that are not submobjects
+  (``target``, ``saved_state``) are left out, like the objects manim
+  filters out of its hash (the pixel array of the camera).
+
+:func:`use_fast_hash` makes manim use :func:`hash_play_call` instead of
+its own hash, for the Cairo and the OpenGL renderer. The partial movie
+files get new names, so the first render after switching does not reuse
+the old ones. The section cache and the checkpoints always use
+:func:`hash_mobjects`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import types
+
+import numpy as np
+
+DIGEST_SIZE = 16
+# Attributes that are structure (walked separately), references back up the
+# family, or run-dependent
+SKIPPED_ATTRIBUTES = {
+    "submobjects", "family", "parents", "original_id",
+    "background", "pixel_array", "pixel_array_to_cairo_context",
+}
+# Nesting deeper than this (lists of lists of ...) is only hashed by type
+MAX_DEPTH = 6
+
+
+def _is_mobject(value):
+    return hasattr(value, "submobjects") and hasattr(value, "get_family")
+
+
+def _is_animation(value):
+    return hasattr(value, "interpolate_mobject") and hasattr(value, "run_time")
+
+
+class StateHasher:
+    """Digests of mobjects and animations, each computed once per hasher."""
+
+    def __init__(self):
+        self._digests = {}  # id() -> digest; the objects outlive the hasher
+
+    def mobject(self, mobject):
+        """Digest of ``mobject`` and its submobjects."""
+        key = id(mobject)
+        digest = self._digests.get(key)
+        if digest is None:
+            self._digests[key] = b"cycle"  # In case a submobject refers back
+            hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+            hasher.update(type(mobject).__qualname__.encode())
+            self._update_attributes(hasher, vars(mobject), follow_mobjects=False)
+            for submobject in mobject.submobjects:
+                hasher.update(self.mobject(submobject))
+            digest = self._digests[key] = hasher.digest()
+        return digest
+
+    def animation(self, animation):
+        """Digest of ``animation``, including the mobjects it refers to."""
+        key = id(animation)
+        digest = self._digests.get(key)
+        if digest is None:
+            self._digests[key] = b"cycle"
+            hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+            hasher.update(type(animation).__qualname__.encode())
+            self._update_attributes(hasher, vars(animation), follow_mobjects=True)
+            digest = self._digests[key] = hasher.digest()
+        return digest
+
+    def _update_attributes(self, hasher, attributes, follow_mobjects):
+        for name, value in attributes.items():
+            if name in SKIPPED_ATTRIBUTES:
+                continue
+            hasher.update(name.encode())
+            self._update(hasher, value, follow_mobjects, 0)
+
+    def _update(self, hasher, value, follow_mobjects, depth):
+        if value is None or isinstance(value, (bool, int, float, complex, str, np.generic)):
+            hasher.update(repr(value).encode())
+        elif isinstance(value, np.ndarray):
+            if value.dtype == object:
+                self._update(hasher, value.tolist(), follow_mobjects, depth + 1)
+                return
+            hasher.update(f"{value.dtype.str}{value.shape}".encode())
+            hasher.update(value.data if value.flags.c_contiguous else value.tobytes())
+        elif depth >= MAX_DEPTH:
+            hasher.update(type(value).__qualname__.encode())
+        elif isinstance(value, (list, tuple)):
+            hasher.update(f"[{len(value)}".encode())
+            for item in value:
+                self._update(hasher, item, follow_mobjects, depth + 1)
+        elif isinstance(value, dict):
+            hasher.update(f"{{{len(value)}".encode())
+            for key, item in value.items():
+                hasher.update(repr(key).encode())
+                self._update(hasher, item, follow_mobjects, depth + 1)
+        elif _is_mobject(value):
+            hasher.update(self.mobject(value) if follow_mobjects else b"mobject")
+        elif _is_animation(value):
+            hasher.update(self.animation(value))
+        elif isinstance(value, types.MethodType):
+            self._update(hasher, value.__func__, follow_mobjects, depth + 1)
+        elif isinstance(value, types.FunctionType):
+            code = value.__code__
+            hasher.update(f"{value.__module__}.{value.__qualname__}".encode())
+            hasher.update(code.co_code)
+            self._update(hasher, [c for c in code.co_consts if not isinstance(c, types.CodeType)],
+                         follow_mobjects, depth + 1)
+            if value.__closure__:
+                cells = []
+                for cell in value.__closure__:
+                    try:
+                        cells.append(cell.cell_contents)
+                    except ValueError:  # Cell not filled yet
+                        cells.append(None)
+                self._update(hasher, cells, follow_mobjects, depth + 1)
+        elif hasattr(value, "_internal_value"):  # ManimColor
+            self._update(hasher, value._internal_value, follow_mobjects, depth + 1)
+        else:
+            hasher.update(type(value).__qualname__.encode())
+
+
+def _hexdigest(parts):
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for part in parts:
+        hasher.update(part)
+    return hasher.hexdigest()
+
+
+def hash_mobjects(mobjects):
+    """Hex digest of a list of mobjects, in order."""
+    hasher = StateHasher()
+    return _hexdigest(hasher.mobject(mobject) for mobject in mobjects)
+
+
+def camera_settings(camera):
+    """What the camera contributes to a frame, without its pixel array."""
+    from manim import config
+
+    frame_center = getattr(camera, "frame_center", None)
+    return repr((
+        type(camera).__qualname__, str(config.renderer), config.pixel_width, config.pixel_height,
+        config.frame_width, config.frame_height, str(config.background_color), config.background_opacity,
+        getattr(camera, "use_z_index", None),
+        frame_center.tolist() if isinstance(frame_center, np.ndarray) else None,
+    )).encode()
+
+
+def hash_play_call(scene, camera, animations, mobjects):
+    """Drop-in replacement of ``manim.utils.hashing.get_hash_from_play_call``."""
+    hasher = StateHasher()
+    hash_camera = _hexdigest([camera_settings(camera)])
+    hash_animations = _hexdigest(hasher.animation(animation) for animation in animations)
+    hash_mobjects = _hexdigest(hasher.mobject(mobject) for mobject in mobjects)
+    return f"{hash_camera}_{hash_animations}_{hash_mobjects}"
+
+
+def use_fast_hash(enabled=True):
+    """Make manim hash its calls with :func:`hash_play_call`, or its own hash again."""
+    import manim.renderer.cairo_renderer as cairo_renderer
+    import manim.utils.caching as caching
+    from manim.utils.hashing import get_hash_from_play_call
+
+    function = hash_play_call if enabled else get_hash_from_play_call
+    cairo_renderer.get_hash_from_play_call = function
+    caching.get_hash_from_play_call = function
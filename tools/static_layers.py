@@ -0,0 +1,124 @@
+"""
+Rasterise the mobjects an animation does not touch once, not once per frame.
+
+manim already draws the static mobjects of an animation into a background
+image, but only those *below* the first moving one: everything from the
+first moving mobject onwards (in drawing order) is redrawn on every frame,
+moving or not. In ``SumSquare`` the squares, labels and braces sit above
+the first formula being transformed, so they are redrawn at every frame of
+every formula step.
+
+``StaticLayerMixin`` splits the drawing order into runs of moving and
+static mobjects. The bottom static run becomes manim's background image as
+before; every static run above a moving one is rasterised once per
+animation onto a transparent layer. Each frame then draws the moving runs
+with Cairo and composites the cached layers over them in order, so the
+picture (including which object covers which) is unchanged. A mobject is
+moving if it belongs to the family of an animated mobject, has an updater
+or is in the foreground, like in manim.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def alpha_bbox(layer):
+    """``(top, bottom, left, right)`` of the non-transparent pixels, or None."""
+    rows = np.flatnonzero(layer[:, :, 3].any(axis=1))
+    if rows.size == 0:
+        return None
+    columns = np.flatnonzero(layer[:, :, 3].any(axis=0))
+    return rows[0], rows[-1] + 1, columns[0], columns[-1] + 1
+
+
+def composite_over(frame, layer, bbox):
+    """Composite premultiplied RGBA ``layer`` over ``frame`` in place, within ``bbox``."""
+    top, bottom, left, right = bbox
+    source = layer[top:bottom, left:right].astype(np.uint16)
+    target = frame[top:bottom, left:right]
+    transparency = 255 - source[:, :, 3:4]
+    target[...] = source + (target * transparency + 127) // 255
+
+
+class StaticLayerMixin:
+    """Mixin for ``manim.renderer.cairo_renderer.CairoRenderer``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._layered_for = None  # The moving mobject list the layers belong to
+        self._runs = []  # [(moving mobjects, static layer or None, bbox)]
+        self.cached_layers = 0  # Static layers rasterised (once per animation)
+
+    def _split_runs(self, scene):
+        from manim.utils.family import extract_mobject_family_members
+        from manim.utils.iterables import list_update
+
+        use_z_index = self.camera.use_z_index
+        moving = {
+            id(member)
+            for animation in scene.animations
+            for member in animation.mobject.get_family()
+        }
+        for mobject in scene.get_mobject_family_members():
+            if mobject.get_family_updaters() or mobject in scene.foreground_mobjects:
+                moving.update(id(member) for member in mobject.get_family())
+
+        drawn = extract_mobject_family_members(
+            list_update(scene.mobjects, scene.foreground_mobjects),
+            use_z_index=use_z_index,
+            only_those_with_points=True,
+        )
+        runs = []  # [is_moving, [mobjects]]
+        for mobject in drawn:
+            is_moving = id(mobject) in moving
+            if runs and runs[-1][0] == is_moving:
+                runs[-1][1].append(mobject)
+            else:
+                runs.append([is_moving, [mobject]])
+        return runs
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self._layered_for = None
+        if self.skip_animations or not scene.animations:
+            return super().save_static_frame_data(scene, static_mobjects)
+
+        runs = self._split_runs(scene)
+        background = []
+        if runs and not runs[0][0]:
+            background = runs.pop(0)[1]
+        self.static_image = None
+        if background:
+            self.camera.reset()
+            self.camera.capture_mobjects(background, include_submobjects=False)
+            self.static_image = self.get_frame()
+
+        self._runs = []
+        for is_moving, mobjects in runs:
+            if is_moving:
+                self._runs.append((mobjects, None, None))
+                continue
+            self.camera.set_pixel_array(np.zeros_like(self.camera.pixel_array))
+            self.camera.capture_mobjects(mobjects, include_submobjects=False)
+            layer = self.get_frame()
+            bbox = alpha_bbox(layer)
+            if bbox is not None:
+                self._runs.append(([], layer, bbox))
+                self.cached_layers += 1
+        self._layered_for = scene.moving_mobjects
+        return self.static_image
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        if mobjects is None or mobjects is not self._layered_for:
+            return super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        if self.skip_animations and not ignore_skipping:
+            return
+        if self.static_image is not None:
+            self.camera.set_frame_to_background(self.static_image)
+        else:
+            self.camera.reset()
+        for moving, layer, bbox in self._runs:
+            if layer is None:
+                self.camera.capture_mobjects(moving, include_submobjects=False, **kwargs)
+            else:
+                composite_over(self.camera.pixel_array, layer, bbox)
@@ -0,0 +1,158 @@
+"""
+Record the end state of every step of a scene as vector stills.
+
+:class:`StillRenderer` is the null renderer (see :mod:`tools.null_renderer`)
+that, after every ``play()`` call, draws the shapes on screen into a cairo
+recording surface: the drawing operations are kept, not pixels. The stills
+are then replayed onto PDF or SVG surfaces, which keep them as vector
+paths, for the handouts written by :mod:`tools.handouts`.
+
+The shapes are drawn as manim's Cairo camera draws them (the same paths,
+background stroke, fill and stroke, line widths, joints and caps), except
+for the colours: the camera swaps red and blue to match the byte order of
+its pixel array, which a vector surface does not have.
+"""
+
+from __future__ import annotations
+
+import itertools as it
+from pathlib import Path
+
+import cairo
+from manim import VMobject, Wait, config
+from manim.camera.camera import CAP_STYLE_MAP, LINE_JOIN_MAP
+
+from .null_renderer import NullRenderer
+
+PAGE_WIDTH = 842.0  # Points; the width of an A4 page in landscape
+STILL_FORMATS = ("pdf", "svg")
+STILL_EVERY = ("play", "section")
+
+
+# ========== DRAWING ==========
+def set_source(ctx, camera, vmobject, rgbas):
+    """Colour ``ctx`` with ``rgbas``, as a gradient along the sheen direction if there are several."""
+    if len(rgbas) == 1:
+        ctx.set_source_rgba(*rgbas[0])
+        return
+    points = camera.transform_points_pre_display(vmobject, vmobject.get_gradient_start_and_end_points())
+    pattern = cairo.LinearGradient(*it.chain(*(point[:2] for point in points)))
+    for rgba, offset in zip(rgbas, [i / (len(rgbas) - 1) for i in range(len(rgbas))]):
+        pattern.add_color_stop_rgba(offset, *rgba)
+    ctx.set_source(pattern)
+
+
+def stroke(ctx, camera, vmobject, background=False):
+    width = vmobject.get_stroke_width(background)
+    if width == 0:
+        return
+    set_source(ctx, camera, vmobject, vmobject.get_stroke_rgbas(background))
+    ctx.set_line_width(width * camera.cairo_line_width_multiple)
+    if LINE_JOIN_MAP.get(vmobject.joint_type) is not None:
+        ctx.set_line_join(LINE_JOIN_MAP[vmobject.joint_type])
+    if CAP_STYLE_MAP.get(vmobject.cap_style) is not None:
+        ctx.set_line_cap(CAP_STYLE_MAP[vmobject.cap_style])
+    ctx.stroke_preserve()
+
+
+def draw_vmobject(ctx, camera, vmobject):
+    """Draw ``vmobject`` like ``Camera.display_vectorized``."""
+    if len(vmobject.points) == 0:
+        return
+    camera.set_cairo_context_path(ctx, vmobject)
+    stroke(ctx, camera, vmobject, background=True)
+    set_source(ctx, camera, vmobject, vmobject.get_fill_rgbas())
+    ctx.fill_preserve()
+    stroke(ctx, camera, vmobject)
+    ctx.new_path()
+
+
+def page_size():
+    """Width and height in points of a still, with the aspect ratio of the frame."""
+    return PAGE_WIDTH, PAGE_WIDTH * config.frame_height / config.frame_width
+
+
+# ========== RENDERER ==========
+class StillRenderer(NullRenderer):
+    """
+    The null renderer, also recording the end state of every ``play()``
+    call (waits are skipped: they change nothing) as a vector still.
+    """
+
+    def __init__(self, every="play", **kwargs):
+        if every not in STILL_EVERY:
+            raise ValueError(f"Stills are taken at the end of every {' or '.join(STILL_EVERY)}, not {every!r}")
+        super().__init__(**kwargs)
+        self.every = every
+        self.recorded = []  # (call index, section, recording surface)
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        if all(isinstance(animation, Wait) for animation in scene.animations or []):
+            return
+        call = self.timeline[-1]
+        self.recorded.append((call["index"], call["section"], self.record(scene)))
+
+    def record(self, scene):
+        """A recording surface with the shapes on screen, drawn on the background."""
+        width, height = page_size()
+        surface = cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, cairo.Rectangle(0, 0, width, height))
+        ctx = cairo.Context(surface)
+        ctx.set_source_rgb(*config.background_color.to_rgb())
+        ctx.paint()
+        scale = width / config.frame_width
+        center = self.camera.frame_center
+        ctx.set_matrix(cairo.Matrix(
+            scale, 0, 0, -scale, width / 2 - center[0] * scale, height / 2 + center[1] * scale,
+        ))
+        for mobject in self.camera.get_mobjects_to_display(scene.mobjects):
+            if isinstance(mobject, VMobject):
+                draw_vmobject(ctx, self.camera, mobject)
+        surface.flush()
+        return surface
+
+    def stills(self):
+        """``(call index, section, surface)`` of the stills: every call, or the last one of each section."""
+        if self.every == "play":
+            return list(self.recorded)
+        last = {}
+        for still in self.recorded:
+            last[still[1]] = still  # Sections follow each other, so the order is kept
+        return list(last.values())
+
+    # ========== OUTPUT ==========
+    def write(self, output_dir, scene_name, format="pdf"):
+        """
+        Write the stills of the scene to ``output_dir``: ``<Scene>.pdf``
+        with one page per still, or ``<Scene>/<call>_<section>.svg``.
+        Returns the paths written.
+        """
+        if format not in STILL_FORMATS:
+            raise ValueError(f"Stills are written as {' or '.join(STILL_FORMATS)}, not {format!r}")
+        output_dir = Path(output_dir)
+        width, height = page_size()
+        stills = self.stills()
+        if format == "pdf":
+            output_dir.mkdir(parents=True, exist_ok=True)
+            path = output_dir / f"{scene_name}.pdf"
+            document = cairo.PDFSurface(str(path), width, height)
+            ctx = cairo.Context(document)
+            for _, _, surface in stills:
+                ctx.set_source_surface(surface, 0, 0)
+                ctx.paint()
+                ctx.show_page()
+            document.finish()
+            return [str(path)]
+        scene_dir = output_dir / scene_name
+        scene_dir.mkdir(parents=True, exist_ok=True)
+        width_digits = len(str(self.num_plays))
+        paths = []
+        for index, section, surface in stills:
+            path = scene_dir / f"{index:0{width_digits}}_{section or 'scene'}.svg"
+            document = cairo.SVGSurface(str(path), width, height)
+            ctx = cairo.Context(document)
+            ctx.set_source_surface(surface, 0, 0)
+            ctx.paint()
+            document.finish()
+            paths.append(str(path))
+        return paths
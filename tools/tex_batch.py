@@ -0,0 +1,293 @@
+"""
+Compile all the TeX of a scene in a single LaTeX run.
+
+Before a scene is rendered, its source is scanned for ``Tex``/``MathTex``
+calls (and ``Brace.get_tex``/``Brace.get_text``) whose arguments are string
+literals. Every fragment manim will compile for them (the joined string
+and, for multi-part objects, each part) is typeset as one page of a single
+``standalone`` document, converted with one ``dvisvgm`` call, and the pages
+are stored where manim will look for them: the shared TeX cache
+(:mod:`tools.tex_cache`) or, without it, manim's own ``Tex`` folder.
+
+Fragments built at run time (f-strings, variables) are not collected; they
+are compiled by manim as usual when the scene creates them. If the batch
+document fails to compile, nothing is stored and every fragment falls back
+to manim's normal compilation, which reports the error.
+
+Usage::
+
+    python -m tools.tex_batch                  # prewarm every scene
+    python -m tools.tex_batch PythagoreanTheorem
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .scenes import MEDIA_DIR, discover_scenes, select_scenes
+
+# Page environment of the batch document, one page per fragment
+PAGE_ENVIRONMENT = "manimfragment"
+
+# Calls that create TeX mobjects: name -> (arg_separator, tex_environment)
+TEX_CALLS = {
+    "MathTex": (" ", "align*"),
+    "Tex": ("", "center"),
+}
+# Brace helpers: method name -> class they instantiate
+BRACE_METHODS = {"get_tex": "MathTex", "get_text": "Tex"}
+
+
+# ========== STATIC COLLECTION ==========
+def _string_list(node):
+    """Strings of a literal list/tuple of strings, or None."""
+    if isinstance(node, (ast.List, ast.Tuple)) and all(
+        isinstance(e, ast.Constant) and isinstance(e.value, str) for e in node.elts
+    ):
+        return [e.value for e in node.elts]
+    return None
+
+
+def _tex_call(node):
+    """Describe a TeX-creating call as a dict, or None if it cannot be resolved statically."""
+    if not isinstance(node, ast.Call):
+        return None
+    if isinstance(node.func, ast.Name) and node.func.id in TEX_CALLS:
+        kind = node.func.id
+    elif isinstance(node.func, ast.Attribute) and node.func.attr in BRACE_METHODS:
+        kind = BRACE_METHODS[node.func.attr]
+    else:
+        return None
+    if not node.args or not all(
+        isinstance(arg, ast.Constant) and isinstance(arg.value, str) for arg in node.args
+    ):
+        return None
+
+    arg_separator, environment = TEX_CALLS[kind]
+    call = {
+        "kind": kind,
+        "strings": [arg.value for arg in node.args],
+        "arg_separator": arg_separator,
+        "environment": environment,
+        "isolate": [],
+    }
+    for keyword in node.keywords:
+        if keyword.arg == "tex_template" or keyword.arg is None:
+            return None  # Custom template or **kwargs: unknown statically
+        if keyword.arg in ("arg_separator", "tex_environment"):
+            if not isinstance(keyword.value, ast.Constant):
+                return None
+            key = "arg_separator" if keyword.arg == "arg_separator" else "environment"
+            call[key] = keyword.value.value
+        elif keyword.arg == "substrings_to_isolate":
+            strings = _string_list(keyword.value)
+            if strings is None:
+                return None
+            call["isolate"].extend(strings)
+        elif keyword.arg == "tex_to_color_map":
+            if not isinstance(keyword.value, ast.Dict):
+                return None
+            strings = _string_list(ast.List(elts=keyword.value.keys))
+            if strings is None:
+                return None
+            call["isolate"].extend(strings)
+    return call
+
+
+def collect_tex_calls(file, scene_name):
+    """
+    Statically resolvable TeX calls in the class ``scene_name`` of ``file``
+    and in the classes of the same file it derives from.
+    """
+    tree = ast.parse(Path(file).read_text(encoding="utf-8"), filename=str(file))
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    calls = []
+    pending, seen = [scene_name], set()
+    while pending:
+        name = pending.pop(0)
+        if name in seen or name not in classes:
+            continue
+        seen.add(name)
+        for child in ast.walk(classes[name]):
+            call = _tex_call(child)
+            if call is not None:
+                calls.append(call)
+        pending.extend(base.id for base in classes[name].bases if isinstance(base, ast.Name))
+    return calls
+
+
+def expand_fragments(calls):
+    """
+    The ``(expression, environment)`` pairs manim compiles for ``calls``.
+
+    manim's own string handling is reused, so the fragments are exactly the
+    ones ``MathTex.__init__`` passes to ``tex_to_svg_file``.
+    """
+    from manim import MathTex
+
+    fragments = []
+    seen = set()
+    for call in calls:
+        helper = MathTex.__new__(MathTex)
+        helper.substrings_to_isolate = call["isolate"]
+        helper.tex_to_color_map = {}
+        parts = helper._break_up_tex_strings(call["strings"])
+        joined = call["arg_separator"].join(parts)
+        for tex_string in [joined, *parts]:
+            fragment = (helper._get_modified_expression(tex_string), call["environment"])
+            if fragment not in seen:
+                seen.add(fragment)
+                fragments.append(fragment)
+    return fragments
+
+
+# ========== BATCH COMPILATION ==========
+def batch_document(fragments, tex_template):
+    """A multi-page ``standalone`` document with one page per fragment."""
+    from manim.utils.tex import _texcode_for_environment
+
+    pages = []
+    for expression, environment in fragments:
+        begin, end = _texcode_for_environment(environment)
+        pages.append("\n".join([
+            rf"\begin{{{PAGE_ENVIRONMENT}}}", begin, expression, end, rf"\end{{{PAGE_ENVIRONMENT}}}",
+        ]))
+    documentclass = tex_template.documentclass.replace(
+        r"\documentclass[preview]", rf"\documentclass[preview,multi={PAGE_ENVIRONMENT}]", 1
+    )
+    return "\n".join(filter(None, [
+        documentclass,
+        tex_template.preamble,
+        rf"\newenvironment{{{PAGE_ENVIRONMENT}}}{{}}{{}}",
+        r"\begin{document}",
+        tex_template.post_doc_commands,
+        "\n\n".join(pages),
+        r"\end{document}",
+    ]))
+
+
+def supports_batching(tex_template):
+    """Only templates based on ``standalone`` in preview mode can be split into pages."""
+    return not tex_template._body and tex_template.documentclass.startswith(
+        r"\documentclass[preview]{standalone}"
+    )
+
+
+def compile_batch(fragments, tex_template, work_dir):
+    """
+    Compile ``fragments`` with one latex and one dvisvgm call.
+
+    Returns the SVG of each fragment in order, or None if compilation failed
+    or did not produce one page per fragment.
+    """
+    from manim.utils.tex_file_writing import make_tex_compilation_command
+
+    work_dir = Path(work_dir)
+    tex_file = work_dir / "batch.tex"
+    tex_file.write_text(batch_document(fragments, tex_template), encoding="utf-8")
+    command = make_tex_compilation_command(
+        tex_template.tex_compiler, tex_template.output_format, tex_file, work_dir
+    )
+    if subprocess.run(command, stdout=subprocess.DEVNULL, cwd=work_dir).returncode != 0:
+        return None
+
+    dvi_file = tex_file.with_suffix(tex_template.output_format)
+    command = [
+        "dvisvgm",
+        *(["--pdf"] if tex_template.output_format == ".pdf" else []),
+        "--page=1-",
+        "--no-fonts",
+        "--verbosity=0",
+        f"--output={(work_dir / 'page-%p.svg').as_posix()}",
+        dvi_file.as_posix(),
+    ]
+    subprocess.run(command, stdout=subprocess.DEVNULL, cwd=work_dir)
+
+    pages = {}
+    for svg in work_dir.glob("page-*.svg"):
+        match = re.fullmatch(r"page-(\d+)\.svg", svg.name)
+        if match:
+            pages[int(match.group(1))] = svg
+    if sorted(pages) != list(range(1, len(fragments) + 1)):
+        return None
+    return [pages[number] for number in range(1, len(fragments) + 1)]
+
+
+def prewarm_scene(file, scene_name, tex_cache=None):
+    """
+    Compile every statically known fragment of a scene that is not stored yet.
+
+    SVGs go to ``tex_cache`` if given, otherwise to manim's ``Tex`` folder
+    under the name manim itself would use. Returns a dict of statistics.
+    """
+    from manim import config
+    from manim.utils.tex_file_writing import generate_tex_file
+
+    from .tex_cache import tex_cache_key
+
+    start = time.perf_counter()
+    tex_template = config["tex_template"]
+    fragments = expand_fragments(collect_tex_calls(file, scene_name))
+
+    def target_path(expression, environment):
+        if tex_cache is not None:
+            return tex_cache.path_for(tex_cache_key(expression, environment, tex_template))
+        return generate_tex_file(expression, environment, tex_template).with_suffix(".svg")
+
+    missing = [f for f in fragments if not target_path(*f).exists()]
+    stats = {"fragments": len(fragments), "compiled": 0, "batched": False, "seconds": 0.0}
+    if missing and supports_batching(tex_template):
+        with tempfile.TemporaryDirectory(prefix="manim_tex_batch_") as work_dir:
+            svgs = compile_batch(missing, tex_template, work_dir)
+            if svgs is not None:
+                for fragment, svg in zip(missing, svgs):
+                    if tex_cache is not None:
+                        tex_cache.put(tex_cache_key(*fragment, tex_template), svg)
+                    else:
+                        shutil.move(str(svg), str(target_path(*fragment)))
+                stats["compiled"] = len(missing)
+                stats["batched"] = True
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+# ========== ENTRY POINT ==========
+def main(argv=None):
+    from .tex_cache import DEFAULT_MAX_MB, TexCache
+
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.tex_batch",
+        description="Compile the TeX of scenes in one LaTeX run per scene.",
+    )
+    parser.add_argument("scenes", nargs="*", metavar="NAME", help="Scenes to prewarm (default: all)")
+    parser.add_argument(
+        "--tex-cache", default=str(MEDIA_DIR / "tex_cache"), metavar="DIR",
+        help="TeX cache to fill (default: media/tex_cache/)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        scenes = select_scenes(discover_scenes(), args.scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    cache = TexCache(args.tex_cache, max_bytes=DEFAULT_MAX_MB * 1024 * 1024)
+    for scene in scenes:
+        stats = prewarm_scene(scene.file, scene.name, cache)
+        print(
+            f"{scene.key:<40} {stats['fragments']:>3} fragments, "
+            f"{stats['compiled']:>3} compiled in {stats['seconds']:.2f} s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
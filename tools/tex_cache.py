@@ -0,0 +1,170 @@
+"""
+Persistent, content-addressed cache of compiled TeX fragments.
+
+manim compiles every ``Tex``/``MathTex`` string (and, for multi-part
+strings, every part) with latex + dvisvgm and keeps the result in the
+``Tex`` folder of the media directory of the current run. Fragments like
+``a``, ``b^2`` or ``a+b`` are shared by several scenes, so this cache keeps
+the SVGs in one directory shared by every scene and every worker process:
+
+- the key is a hash of the complete ``.tex`` source (expression, tex
+  environment and template) plus the compiler and output format; the font
+  size is not part of it because manim scales the SVG after compiling;
+- files are written to a temporary name and renamed into place, so a
+  concurrent reader never sees a partial SVG;
+- the total size is capped and the least recently used SVGs are evicted.
+
+Usage from a render worker::
+
+    cache = TexCache(media_dir / "tex_cache")
+    cache.install()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+DEFAULT_MAX_MB = 64
+# Evict down to this fraction of the cap, so eviction does not run on every write
+LOW_WATERMARK = 0.9
+
+
+def tex_cache_key(expression, environment, tex_template):
+    """Hash of everything that determines the compiled SVG."""
+    if environment is not None:
+        tex_code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+    else:
+        tex_code = tex_template.get_texcode_for_expression(expression)
+    hasher = hashlib.sha256()
+    for part in (tex_code, tex_template.tex_compiler, tex_template.output_format):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+class TexCache:
+    """
+    Directory of ``<key>.svg`` files with LRU eviction.
+
+    The modification time of a file is its last use: lookups touch it, and
+    eviction removes the oldest files first.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._original = None
+        # Estimate of the directory size; other processes also write to it,
+        # so it is re-measured before evicting
+        self._size = self._measure()[1]
+
+    # ========== LOOKUP AND STORAGE ==========
+    def path_for(self, key):
+        return self.directory / f"{key}.svg"
+
+    def get(self, key):
+        """Return the cached SVG for ``key`` (marking it as used), or None."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, key, svg_file):
+        """Copy ``svg_file`` into the cache atomically and return the cached path."""
+        path = self.path_for(key)
+        fd, temp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as temp_file, open(svg_file, "rb") as source:
+                shutil.copyfileobj(source, temp_file)
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        self._size += path.stat().st_size
+        if self._size > self.max_bytes:
+            self.evict()
+        return path
+
+    # ========== EVICTION ==========
+    def _measure(self):
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.svg"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # Evicted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        return entries, total
+
+    def evict(self):
+        """Remove least recently used SVGs until the cache is below its cap."""
+        entries, total = self._measure()
+        target = self.max_bytes * LOW_WATERMARK
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.evictions += 1
+        self._size = total
+
+    def clear(self):
+        for path in self.directory.glob("*.svg"):
+            path.unlink(missing_ok=True)
+        self._size = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "size_mb": self._size / (1024 * 1024),
+        }
+
+    # ========== MANIM INTEGRATION ==========
+    def tex_to_svg_file(self, expression, environment=None, tex_template=None):
+        """Drop-in replacement for ``manim.utils.tex_file_writing.tex_to_svg_file``."""
+        from manim import config
+
+        if tex_template is None:
+            tex_template = config["tex_template"]
+        key = tex_cache_key(expression, environment, tex_template)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        svg_file = self._original(expression, environment, tex_template)
+        return self.put(key, svg_file)
+
+    def install(self):
+        """Route every TeX compilation of this process through the cache."""
+        import manim.mobject.text.tex_mobject as tex_mobject
+        import manim.utils.tex_file_writing as tex_file_writing
+
+        if self._original is None:
+            self._original = tex_file_writing.tex_to_svg_file
+        tex_mobject.tex_to_svg_file = self.tex_to_svg_file
+        tex_file_writing.tex_to_svg_file = self.tex_to_svg_file
+
+    def uninstall(self):
+        import manim.mobject.text.tex_mobject as tex_mobject
+        import manim.utils.tex_file_writing as tex_file_writing
+
+        if self._original is not None:
+            tex_mobject.tex_to_svg_file = self._original
+            tex_file_writing.tex_to_svg_file = self._original
@@ -0,0 +1,168 @@
+"""
+Export when every step of a scene happens in its video, without rendering it.
+
+Chapter markers and synced captions on the companion website need the
+start and duration of every step: each derivation line, each ``Indicate``,
+each section. This tool runs ``construct`` with the null renderer (see
+:mod:`tools.null_renderer`, the same pass as :mod:`tools.dry_run`) and
+writes one JSON manifest per scene::
+
+    {
+        "scene": "PythagoreanTheorem",
+        "file": "src/pythagorean_theorem.py",
+        "quality": "h",
+        "frame_rate": 60,
+        "duration": 58.3,
+        "sections": [{"name": "preface", "start": 0.0, "duration": 12.5}, ...],
+        "steps": [
+            {
+                "index": 0, "section": "preface", "start": 0.0, "duration": 1.0,
+                "animations": [{"type": "Write", "text": "Mathematical Context of the Pythagorean Theorem"}]
+            },
+            ...
+        ]
+    }
+
+Each step is one ``play()``/``wait()`` call. Its animations give the type
+and the TeX or text of the mobjects they animate (and, for a transform,
+of the mobject it turns them into); a ``wait()`` has a ``Wait`` without
+text. Times are those of the video at the chosen quality: manim writes a
+whole number of frames per call, so they are counted in frames and then
+converted, and do not drift from the video over a long scene.
+
+Usage::
+
+    python -m tools.timeline                              # every scene, media/timelines/
+    python -m tools.timeline --scenes SumSquare -q l --output-dir site/timelines
+    python -m tools.timeline --no-latex
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from .batch_render import TEX_CACHE_DIR_NAME, run_batch
+from .quality_ladder import QUALITY_FORMATS
+from .render import RenderJob
+from .scenes import MEDIA_DIR, REPO_ROOT, discover_scenes, select_scenes
+
+TIMELINE_DIR_NAME = "timelines"
+# Decimals kept for times in seconds; a frame at 60 fps is 0.0167 s
+TIME_DECIMALS = 4
+
+
+# ========== MANIFEST ==========
+def build_manifest(result, quality):
+    """The timeline manifest of a dry-run :class:`~tools.render.RenderResult`."""
+    frame_rate = QUALITY_FORMATS[quality][2]
+    steps = []
+    sections = []
+    frame = 0
+    for call in result.timeline:
+        start = round(frame / frame_rate, TIME_DECIMALS)
+        duration = round(call["frames"] / frame_rate, TIME_DECIMALS)
+        steps.append({
+            "index": call["index"],
+            "section": call["section"],
+            "start": start,
+            "duration": duration,
+            "animations": call["targets"],
+        })
+        if not sections or sections[-1]["name"] != call["section"]:
+            sections.append({"name": call["section"], "start": start, "start_frame": frame})
+        frame += call["frames"]
+        sections[-1]["end_frame"] = frame
+    for section in sections:
+        section["duration"] = round((section.pop("end_frame") - section.pop("start_frame")) / frame_rate, TIME_DECIMALS)
+
+    file = Path(result.file)
+    return {
+        "scene": result.scene,
+        "file": str(file.relative_to(REPO_ROOT)) if file.is_relative_to(REPO_ROOT) else str(file),
+        "quality": quality,
+        "frame_rate": frame_rate,
+        "duration": round(frame / frame_rate, TIME_DECIMALS),
+        "sections": sections,
+        "steps": steps,
+    }
+
+
+# ========== ENTRY POINT ==========
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.timeline",
+        description="Write the timeline of every scene as JSON, without rendering it.",
+    )
+    parser.add_argument(
+        "--scenes", nargs="+", metavar="NAME",
+        help="Only these scenes (class name or file:Class)",
+    )
+    parser.add_argument(
+        "-q", "--quality", choices=sorted(QUALITY_FORMATS), default="h",
+        help="Quality of the video the times refer to, as in manim -q (default: h)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--no-latex", action="store_true",
+        help="Replace LaTeX by placeholder glyphs (no TeX distribution needed; the texts are kept)",
+    )
+    parser.add_argument(
+        "--output-dir", metavar="PATH", default=str(MEDIA_DIR / TIMELINE_DIR_NAME),
+        help="Folder of the manifests, one <Scene>.json per scene (default: media/timelines/)",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        scenes = select_scenes(discover_scenes(), args.scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    jobs = [
+        RenderJob(
+            file=str(scene.file),
+            scene=scene.name,
+            quality=args.quality,  # Sets the frame rate the frames are counted at
+            dry_run=True,
+            placeholder_tex=args.no_latex,
+            tex_cache_dir=None if args.no_latex else str(MEDIA_DIR / TEX_CACHE_DIR_NAME),
+        )
+        for scene in scenes
+    ]
+    workers = max(1, min(args.jobs, len(jobs)))
+    start = time.perf_counter()
+    results = run_batch(jobs, workers)
+    total_wall_time = time.perf_counter() - start
+
+    order = {(str(s.file), s.name): i for i, s in enumerate(scenes)}
+    results.sort(key=lambda r: order[(r.file, r.scene)])
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for result in results:
+        if result.error is not None:
+            print(f"{Path(result.file).stem}:{result.scene} failed:\n{result.error}", file=sys.stderr)
+            continue
+        manifest = build_manifest(result, args.quality)
+        path = output_dir / f"{result.scene}.json"
+        path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(
+            f"{result.scene:<32} {len(manifest['steps']):>4} steps {len(manifest['sections']):>3} sections "
+            f"{manifest['duration']:>7.1f} s  -> {path}"
+        )
+    print(f"\n{len(results)} timelines computed in {total_wall_time:.1f} s")
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Render many variants of a scene, each with other values of its parameters.
+
+A scene exposes its parameters as upper-case class attributes read with
+``self.<NAME>`` (``PythagoreanTheorem.LEGS``, the leg lengths of each
+configuration shown). A variant replaces some of them; it is rendered as a
+subclass named ``<Scene>_<variant>``, so every variant gets its own video
+next to the original one. The variants are rendered on the batch worker
+pool with the batch options. The sections that do not read the parameters
+are rendered once for all of them (see :mod:`tools.section_cache`): with
+the section cache on, the first variant of each scene is rendered before
+the others start, so that they find its sections in the cache.
+
+Variants are given on the command line, one ``--variant`` per video, with
+``NAME=VALUE`` pairs whose values are JSON, or in a JSON file holding a
+list of objects with the parameters and an optional ``name``::
+
+    [
+        {"name": "3-4-5", "LEGS": [[3, 4]]},
+        {"LEGS": [[1, 1], [1, 2], [1, 3]]}
+    ]
+
+Variants without a name are numbered in order.
+
+Usage::
+
+    python -m tools.variants --scenes PythagoreanTheorem --variant 'LEGS=[[3, 4], [5, 12]]'
+    python -m tools.variants --scenes PythagoreanTheorem --variants-file exercises.json -q l -j 8
+    python -m tools.variants --scenes QuadraticFormula --variant "COEFFICIENTS=[2, 6, -8]"
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import re
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from .batch_render import build_parser, format_summary, make_jobs, run_batch
+from .scenes import discover_scenes, select_scenes
+
+
+# ========== VARIANT SPECIFICATIONS ==========
+def parse_assignments(assignments):
+    """Parameters of one ``--variant``, from ``NAME=VALUE`` strings with JSON values."""
+    parameters = {}
+    for assignment in assignments:
+        name, separator, value = assignment.partition("=")
+        if not separator or not name.isidentifier():
+            raise ValueError(f"Expected NAME=VALUE, got {assignment!r}")
+        try:
+            parameters[name] = json.loads(value)
+        except ValueError:
+            raise ValueError(f"The value of {name} is not valid JSON: {value!r}") from None
+    return parameters
+
+
+def read_variants(path):
+    """``(name, parameters)`` of the variants in a JSON file; the name may be None."""
+    try:
+        entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as error:
+        raise ValueError(f"Cannot read the variants in {path}: {error}") from None
+    if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+        raise ValueError(f"{path} must hold a JSON list of objects")
+    return [(entry.pop("name", None), entry) for entry in entries]
+
+
+def name_variants(variants):
+    """Give every variant a name that can be part of a class and file name."""
+    width = len(str(len(variants)))
+    named = []
+    for index, (name, parameters) in enumerate(variants, start=1):
+        name = re.sub(r"\W+", "_", str(name)) if name is not None else f"{index:0{width}}"
+        if any(name == other for other, _ in named):
+            raise ValueError(f"Two variants are named {name}")
+        named.append((name, parameters))
+    return named
+
+
+def scene_parameters(scene):
+    """Upper-case class attributes of a scene, including those of its bases in the same file."""
+    tree = ast.parse(scene.file.read_text(encoding="utf-8"), filename=str(scene.file))
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    names = set()
+    pending = [scene.name]
+    while pending:
+        node = classes.get(pending.pop())
+        if node is None:
+            continue
+        for item in node.body:
+            targets = item.targets if isinstance(item, ast.Assign) else [getattr(item, "target", None)]
+            names.update(t.id for t in targets if isinstance(t, ast.Name) and t.id.isupper())
+        pending.extend(base.id for base in node.bases if isinstance(base, ast.Name))
+    return names
+
+
+def variant_jobs(jobs, variants):
+    """One job per scene job and variant."""
+    return [
+        replace(job, variant=name, parameters=parameters)
+        for job in jobs
+        for name, parameters in variants
+    ]
+
+
+# ========== ENTRY POINT ==========
+def main(argv=None):
+    parser = build_parser()
+    parser.prog = "python -m tools.variants"
+    parser.description = "Render variants of scenes with other values of their parameters."
+    for action in parser._actions:
+        if action.dest == "scenes":
+            action.help = "Scenes to render the variants of (class name or file:Class)"
+    parser.add_argument(
+        "--variant", nargs="+", action="append", default=[], dest="variants", metavar="NAME=VALUE",
+        help="One variant, as parameter assignments with JSON values (repeat for more variants)",
+    )
+    parser.add_argument(
+        "--variants-file", metavar="PATH",
+        help='JSON list of variants: objects with the parameters and an optional "name"',
+    )
+    args = parser.parse_args(argv)
+    try:
+        if not args.scenes:
+            raise ValueError("Choose the scenes to render variants of with --scenes")
+        scenes = select_scenes(discover_scenes(), args.scenes)
+        variants = read_variants(args.variants_file) if args.variants_file else []
+        variants += [(None, parse_assignments(assignments)) for assignments in args.variants]
+        if not variants:
+            raise ValueError("No variants: use --variant or --variants-file")
+        variants = name_variants(variants)
+        for scene in scenes:
+            known = scene_parameters(scene)
+            for name, parameters in variants:
+                unknown = sorted(set(parameters) - known)
+                if unknown:
+                    raise ValueError(f"{scene.name} has no parameter {', '.join(unknown)} (variant {name})")
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    jobs = variant_jobs(make_jobs(scenes, args), variants)
+    workers = max(1, min(args.jobs, len(jobs)))
+    print(f"Rendering {len(variants)} variants of {len(scenes)} scenes at -q{args.quality} on {workers} workers")
+    # Variants rendered at the same time would all render the shared sections
+    batches = [jobs]
+    if len(variants) > 1 and jobs[0].section_cache_dir is not None:
+        first_name = variants[0][0]
+        batches = [
+            [job for job in jobs if job.variant == first_name],
+            [job for job in jobs if job.variant != first_name],
+        ]
+        print(f"Variant {first_name} first: the others reuse the sections it shares with them")
+
+    def report(result):
+        status = "done" if result.error is None else "FAILED"
+        print(f"[{status}] {result.scene}_{result.variant} in {result.wall_time:.1f} s", flush=True)
+
+    start = time.perf_counter()
+    results = []
+    for batch in batches:
+        results += run_batch(batch, min(workers, len(batch)), on_result=report)
+    total_wall_time = time.perf_counter() - start
+
+    # Keep the summary in submission order
+    order = {(job.file, job.scene, job.variant): i for i, job in enumerate(jobs)}
+    results.sort(key=lambda r: order[(r.file, r.scene, r.variant)])
+    for result in results:
+        if result.error is not None:
+            print(f"\n{result.scene}_{result.variant} failed:\n{result.error}", file=sys.stderr)
+    print()
+    print(format_summary(results, total_wall_time, workers))
+
+    if args.json:
+        summary = {
+            "quality": args.quality,
+            "workers": workers,
+            "wall_time": total_wall_time,
+            "variants": [r.to_dict() for r in results],
+        }
+        Path(args.json).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Record a scene as a keyframed vector animation while running it.
+
+:class:`VectorAnimationRenderer` is the null renderer (see
+:mod:`tools.null_renderer`) that also records every shape on screen and
+every call, as described in :mod:`tools.vector_export`.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+from manim import Create, DrawBorderThenFill, Transform, VMobject, Wait, config
+from manim.utils import rate_functions
+
+from .null_renderer import NullRenderer
+
+QUANTUM = 1000  # Coordinates are stored in thousandths of a scene unit
+SAMPLE_RATE = 10  # Samples per second of the calls that cannot be described
+RATE_SAMPLES = 33  # Values stored for rate functions the player does not know
+TIME_DECIMALS = 4
+
+
+# ========== SHAPE STATES ==========
+class PathTable:
+    """Paths stored once each, relative to their first point."""
+
+    def __init__(self):
+        self.paths = []  # Coordinate differences between consecutive points
+        self.sizes = []  # Number of points of each path
+        self._index = {}
+
+    def add(self, points):
+        """``[index, x, y]`` of the path through ``points``, ``(x, y)`` being its first point."""
+        if len(points) == 0:
+            return None
+        quantized = np.rint(points[:, :2] * QUANTUM).astype(np.int64)
+        deltas = np.diff(quantized, axis=0).ravel()
+        key = deltas.tobytes()
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self.paths)
+            self.paths.append(deltas.tolist())
+            self.sizes.append(len(quantized))
+        return [index, int(quantized[0, 0]), int(quantized[0, 1])]
+
+
+def color(rgbas):
+    """``[r, g, b, alpha]``, 0-255 and 0-1, of the first colour of ``rgbas``."""
+    r, g, b, alpha = rgbas[0]
+    return [int(round(r * 255)), int(round(g * 255)), int(round(b * 255)), round(float(alpha), 3)]
+
+
+def shape_state(mobject, paths):
+    return {
+        "path": paths.add(mobject.points),
+        "fill": color(mobject.get_fill_rgbas()),
+        "stroke": color(mobject.get_stroke_rgbas()),
+        "width": round(float(mobject.get_stroke_width()), 3),
+    }
+
+
+def rate_data(animation):
+    """The rate function of ``animation``: a name the player knows, or its values on [0, 1]."""
+    reverse = getattr(animation, "reverse_rate_function", False)
+    if not reverse:
+        for name in ("linear", "smooth"):
+            if animation.rate_func is getattr(rate_functions, name):
+                return name
+    alphas = np.linspace(0, 1, RATE_SAMPLES)
+    return [round(float(animation.rate_func(1 - alpha if reverse else alpha)), 4) for alpha in alphas]
+
+
+def state_changes(shown, states):
+    """The properties that change from the ``shown`` states to ``states``, per shape."""
+    changes = {}
+    for number, state in states.items():
+        before = shown.get(number)
+        if before is None:
+            changes[number] = state
+        else:
+            changed = {key: value for key, value in state.items() if before[key] != value}
+            if changed:
+                changes[number] = changed
+    return changes
+
+
+# ========== RENDERER ==========
+class VectorAnimationRenderer(NullRenderer):
+    """
+    The null renderer, also recording every call as a step of a vector
+    animation (see the module documentation).
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.paths = PathTable()
+        self.steps = []
+        self._numbers = {}  # id() -> (number, mobject); keeps ids from being reused
+        self._shown = {}  # Number -> state, as the player shows it between steps
+        self._order = []  # Numbers in drawing order, as the player draws them
+        self._frame = 0
+        self._call = None
+
+    def _number(self, mobject):
+        entry = self._numbers.get(id(mobject))
+        if entry is None:
+            entry = self._numbers[id(mobject)] = (len(self._numbers), mobject)
+        return entry[0]
+
+    def snapshot(self, scene):
+        """Drawing order and state of every shape on screen."""
+        shapes = [
+            mobject for mobject in self.camera.get_mobjects_to_display(scene.mobjects)
+            if isinstance(mobject, VMobject)
+        ]
+        order = [self._number(shape) for shape in shapes]
+        return order, {number: shape_state(shape, self.paths) for number, shape in zip(order, shapes)}
+
+    def _describe(self, scene):
+        """
+        How each animation of the call moves its shapes, and the states
+        to start from; None if the call must be sampled.
+        """
+        if any(mobject.updaters for mobject in scene.get_mobject_family_members()):
+            return None
+        tweens = []
+        starts = {}
+        for animation in scene.animations or []:
+            if isinstance(animation, Wait):
+                continue
+            shapes = animation.mobject.family_members_with_points()
+            if not all(isinstance(shape, VMobject) for shape in shapes):
+                return None
+            tween = {"shapes": [self._number(shape) for shape in shapes], "rate": rate_data(animation)}
+            if animation.lag_ratio and len(shapes) > 1:
+                tween["lag"] = animation.lag_ratio
+            if isinstance(animation, (Create, DrawBorderThenFill)):
+                # Drawn from the complete shapes, copied before the animation began
+                complete = animation.starting_mobject.family_members_with_points()
+                starts.update(
+                    (number, shape_state(shape, self.paths)) for number, shape in zip(tween["shapes"], complete)
+                )
+                tween["kind"] = "create"
+                if isinstance(animation, DrawBorderThenFill):  # Write
+                    tween["kind"] = "write"
+                    tween["outline"] = [
+                        color(shape.get_stroke_rgbas()) + [round(float(shape.get_stroke_width()), 3)]
+                        for shape in animation.outline.family_members_with_points()
+                    ]
+            elif isinstance(animation, Transform) and animation.path_arc == 0:
+                # begin() aligned the shapes with those of the target
+                targets = animation.target_copy.family_members_with_points()
+                if len(targets) != len(shapes):
+                    return None
+                tween["kind"] = "lerp"
+                tween["to"] = [shape_state(shape, self.paths) for shape in targets]
+            else:
+                return None
+            tweens.append(tween)
+        return tweens, starts
+
+    def _change(self, order, states):
+        """Changes bringing the player from what it shows to ``states``."""
+        change = {}
+        changes = state_changes(self._shown, states)
+        if changes:
+            change["set"] = {str(number): state for number, state in changes.items()}
+        removed = [number for number in self._shown if number not in states]
+        if removed:
+            change["remove"] = removed
+        if order != self._order:
+            change["order"] = order
+        self._shown, self._order = dict(states), list(order)
+        return change
+
+    def _add_step(self, start, duration, order, states, tweens, end_order, end_states):
+        step = {"t": round(start, TIME_DECIMALS), "d": round(duration, TIME_DECIMALS)}
+        step.update(self._change(order, states))
+        if tweens:
+            step["tweens"] = tweens
+        end = self._change(end_order, end_states)
+        if end:
+            step["end"] = end
+        if len(step) > 2:
+            self.steps.append(step)
+
+    # ========== HOOKS ==========
+    def save_static_frame_data(self, scene, static_mobjects):
+        # Called once the animations of the call have begun
+        result = super().save_static_frame_data(scene, static_mobjects)
+        order, states = self.snapshot(scene)
+        description = self._describe(scene)
+        if description is not None:
+            tweens, starts = description
+            states.update((number, state) for number, state in starts.items() if number in states)
+            self._call = ("described", [(0.0, order, states, tweens)])
+        else:
+            samples = [(0.0, order, states, None)]
+            for index in range(1, math.ceil(scene.duration * SAMPLE_RATE)):
+                scene.update_to_time(index / SAMPLE_RATE)
+                samples.append((index / SAMPLE_RATE, *self.snapshot(scene), None))
+            self._call = ("sampled", samples)
+        return result
+
+    def play(self, scene, *args, **kwargs):
+        self._call = None
+        super().play(scene, *args, **kwargs)
+        frames = self.timeline[-1]["frames"]
+        start, duration = self._frame / config.frame_rate, frames / config.frame_rate
+        self._frame += frames
+        if self._call is None:
+            return
+        end_order, end_states = self.snapshot(scene)
+        kind, samples = self._call
+        ends = [sample[:3] for sample in samples[1:]] + [(duration, end_order, end_states)]
+        for (offset, order, states, tweens), (end_offset, next_order, next_states) in zip(samples, ends):
+            if kind == "sampled":
+                tweens = self._sample_tweens(states, next_states)
+            self._add_step(
+                start + offset, end_offset - offset, order, states, tweens, next_order, next_states
+            )
+        self._call = None
+
+    def _sample_tweens(self, states, next_states):
+        """Linear tweens between two samples, for the shapes whose path can be interpolated."""
+        numbers = [
+            number for number, state in states.items()
+            if number in next_states and next_states[number] != state
+            and self._comparable(state["path"], next_states[number]["path"])
+        ]
+        if not numbers:
+            return []
+        return [{
+            "shapes": numbers, "rate": "linear", "kind": "lerp",
+            "to": [next_states[number] for number in numbers],
+        }]
+
+    def _comparable(self, path, other):
+        if path is None or other is None:
+            return path is other
+        return self.paths.sizes[path[0]] == self.paths.sizes[other[0]]
+
+    def animation_data(self, scene_name):
+        return {
+            "version": 1,
+            "scene": scene_name,
+            "frame": [config.frame_width, config.frame_height],
+            "pixels": [config.pixel_width, config.pixel_height],
+            "background": config.background_color.to_hex(),
+            "quantum": QUANTUM,
+            "duration": round(self._frame / config.frame_rate, TIME_DECIMALS),
+            "paths": self.paths.paths,
+            "steps": self.steps,
+        }
+
+    def write(self, path, scene_name):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.animation_data(scene_name), separators=(",", ":")), encoding="utf-8")
+        return str(path)
@@ -0,0 +1,150 @@
+"""
+Export scenes as small keyframed vector animations for the website.
+
+The scenes are flat-coloured polygons and TeX glyphs, yet the website
+serves them as videos of several megabytes. This exporter runs a scene
+without rasterising it (see :mod:`tools.null_renderer`) and writes what
+happens in it as JSON, played back in the browser by ``vector_player.js``:
+
+- every shape drawn (every mobject with points) gets a number, and its
+  state is its path, fill colour, stroke colour and stroke width. Paths
+  are stored once in a table, in thousandths of a scene unit and relative
+  to their first point, so that a glyph repeated across formulas, or a
+  shape that only changes colour or position, is stored only once;
+- every ``play()`` call is one step: the states that change when it starts
+  (shapes added, moved between calls, reset by the animation), how each
+  animated shape moves during the call, and the states at its end;
+- the animations are described, not sampled: ``Create``/``Uncreate``
+  draw the path progressively, ``Write`` draws the outline and then fills
+  it, and every ``Transform`` (``FadeIn``, ``FadeOut``, ``Indicate``,
+  ``.animate``...) interpolates from the start state to the target state,
+  with the rate function and lag ratio of the animation, like manim does;
+- calls that cannot be described that way (updaters, ``ValueTracker``
+  animations, animation groups, transforms along arcs) are sampled
+  ``SAMPLE_RATE`` times per second, and the player interpolates between
+  the samples;
+- static waits add nothing but time.
+
+A scene like ``SumSquare`` fits in a few tens of kilobytes, before the web
+server compresses it. Each scene is written as ``<Scene>.json`` in the
+output folder, with ``vector_player.js`` and a ``<Scene>.html`` page that
+plays it.
+
+Usage::
+
+    python -m tools.vector_export --scenes SumSquare TriangleAreaRectangle
+    python -m tools.vector_export --output-dir site/animations -j 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from .batch_render import TEX_CACHE_DIR_NAME, run_batch
+from .render import QUALITY_FLAGS, RenderJob
+from .scenes import MEDIA_DIR, discover_scenes, select_scenes
+
+VECTOR_DIR_NAME = "vector"
+PLAYER_FILE = Path(__file__).with_name("vector_player.js")
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{scene}</title>
+<style>body {{ margin: 0; background: #111; }} canvas {{ display: block; width: 100%; max-width: 960px; margin: auto; }}</style>
+</head>
+<body>
+<canvas id="animation" width="{width}" height="{height}"></canvas>
+<script src="vector_player.js"></script>
+<script>VectorPlayer.load("{scene}.json", document.getElementById("animation")).then((player) => player.play());</script>
+</body>
+</html>
+"""
+
+
+# ========== PAGES ==========
+def write_page(output_dir, scene, pixels):
+    """Copy the player next to the animations and write a page playing ``scene``."""
+    output_dir = Path(output_dir)
+    shutil.copyfile(PLAYER_FILE, output_dir / PLAYER_FILE.name)
+    page = output_dir / f"{scene}.html"
+    page.write_text(PAGE_TEMPLATE.format(scene=scene, width=pixels[0], height=pixels[1]), encoding="utf-8")
+    return page
+
+
+# ========== ENTRY POINT ==========
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.vector_export",
+        description="Export scenes as keyframed vector animations played in the browser.",
+    )
+    parser.add_argument(
+        "--scenes", nargs="+", metavar="NAME",
+        help="Only these scenes (class name or file:Class)",
+    )
+    parser.add_argument(
+        "-q", "--quality", choices=sorted(QUALITY_FLAGS), default="l",
+        help="Quality whose frame rate times the calls, and size of the page (default: l)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--output-dir", metavar="PATH", default=str(MEDIA_DIR / VECTOR_DIR_NAME),
+        help="Folder of the animations, the player and the pages (default: media/vector/)",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        scenes = select_scenes(discover_scenes(), args.scenes)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    output_dir = Path(args.output_dir)
+    jobs = [
+        RenderJob(
+            file=str(scene.file),
+            scene=scene.name,
+            quality=args.quality,
+            dry_run=True,
+            tex_cache_dir=str(MEDIA_DIR / TEX_CACHE_DIR_NAME),
+            vector_animation=str(output_dir / f"{scene.name}.json"),
+        )
+        for scene in scenes
+    ]
+    workers = max(1, min(args.jobs, len(jobs)))
+    start = time.perf_counter()
+    results = run_batch(jobs, workers)
+    total_wall_time = time.perf_counter() - start
+
+    order = {(str(s.file), s.name): i for i, s in enumerate(scenes)}
+    results.sort(key=lambda r: order[(r.file, r.scene)])
+    for result in results:
+        if result.error is not None:
+            print(f"{Path(result.file).stem}:{result.scene} failed:\n{result.error}", file=sys.stderr)
+            continue
+        path = output_dir / f"{result.scene}.json"
+        animation = json.loads(path.read_text(encoding="utf-8"))
+        page = write_page(output_dir, result.scene, animation["pixels"])
+        print(
+            f"{result.scene:<32} {len(animation['steps']):>4} steps {len(animation['paths']):>5} paths "
+            f"{path.stat().st_size / 1024:>8.1f} KiB  -> {page}"
+        )
+    print(f"\n{len(results)} animations exported in {total_wall_time:.1f} s")
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
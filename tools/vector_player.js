@@ -0,0 +1,328 @@
+/*
+ * Player of the vector animations written by tools.vector_export.
+ *
+ * Draws the shapes of a scene on a <canvas>, following the steps of the
+ * animation: the changes at the start of each step, the shapes it animates
+ * (drawn progressively, written, or interpolated towards a target state)
+ * and the changes at its end. The geometry follows manim's Cairo camera:
+ * cubic Bézier paths, filled with the nonzero rule and then stroked, with
+ * stroke widths in hundredths of a scene unit.
+ *
+ * Usage:
+ *
+ *     VectorPlayer.load("SumSquare.json", canvas).then((player) => player.play());
+ *
+ * A click on the canvas pauses and resumes; player.seek(seconds) jumps.
+ */
+(function (global) {
+  "use strict";
+
+  const LINE_WIDTH_MULTIPLE = 0.01; // manim's cairo_line_width_multiple
+  const SMOOTH_INFLECTION = 10;
+  const EPSILON = 1e-6;
+
+  // ========== RATE FUNCTIONS ==========
+  function sigmoid(x) {
+    return 1 / (1 + Math.exp(-x));
+  }
+
+  const RATES = {
+    linear: (t) => t,
+    smooth: (t) => {
+      const error = sigmoid(-SMOOTH_INFLECTION / 2);
+      return Math.min(Math.max((sigmoid(SMOOTH_INFLECTION * (t - 0.5)) - error) / (1 - 2 * error), 0), 1);
+    },
+  };
+
+  function rateFunction(rate) {
+    if (typeof rate === "string") {
+      return RATES[rate] || RATES.smooth;
+    }
+    // Values at evenly spaced points of [0, 1]
+    const last = rate.length - 1;
+    return (t) => {
+      const x = Math.min(Math.max(t, 0), 1) * last;
+      const index = Math.min(Math.floor(x), last - 1);
+      return rate[index] + (rate[index + 1] - rate[index]) * (x - index);
+    };
+  }
+
+  // ========== GEOMETRY ==========
+  function lerp(a, b, t) {
+    return a + (b - a) * t;
+  }
+
+  function lerpArray(a, b, t) {
+    return a.map((value, i) => lerp(value, b[i], t));
+  }
+
+  // Left part, up to t, of the cubic Bézier starting at offset i of points
+  function partialCurve(points, i, t) {
+    const [x0, y0, x1, y1, x2, y2, x3, y3] = points.slice(i, i + 8);
+    const ax = lerp(x0, x1, t), ay = lerp(y0, y1, t);
+    const bx = lerp(x1, x2, t), by = lerp(y1, y2, t);
+    const cx = lerp(x2, x3, t), cy = lerp(y2, y3, t);
+    const dx = lerp(ax, bx, t), dy = lerp(ay, by, t);
+    const ex = lerp(bx, cx, t), ey = lerp(by, cy, t);
+    return [x0, y0, ax, ay, dx, dy, lerp(dx, ex, t), lerp(dy, ey, t)];
+  }
+
+  // The first fraction b of the curves, as VMobject.pointwise_become_partial(0, b)
+  function partialPoints(points, b) {
+    const curves = points.length / 8;
+    if (b >= 1 || curves === 0) {
+      return points;
+    }
+    const value = Math.max(b, 0) * curves;
+    const index = Math.min(Math.floor(value), curves - 1);
+    return points.slice(0, index * 8).concat(partialCurve(points, index * 8, value - index));
+  }
+
+  function cssColor([r, g, b, alpha]) {
+    return `rgba(${Math.round(r)}, ${Math.round(g)}, ${Math.round(b)}, ${alpha})`;
+  }
+
+  // ========== PLAYER ==========
+  class VectorPlayer {
+    constructor(canvas, data) {
+      this.canvas = canvas;
+      this.context = canvas.getContext("2d");
+      this.data = data;
+      this.duration = data.duration;
+      // Points of every path relative to its first point, in scene units
+      this.paths = data.paths.map((deltas) => {
+        const points = [0, 0];
+        for (let i = 0; i < deltas.length; i += 2) {
+          points.push(points[i] + deltas[i], points[i + 1] + deltas[i + 1]);
+        }
+        return points.map((value) => value / data.quantum);
+      });
+      for (const step of data.steps) {
+        for (const tween of step.tweens || []) {
+          tween.rateFunction = rateFunction(tween.rate);
+        }
+      }
+      this.time = 0;
+      this.playing = false;
+      this.reset();
+      canvas.addEventListener("click", () => (this.playing ? this.pause() : this.play()));
+      this.draw();
+    }
+
+    static load(url, canvas) {
+      return fetch(url)
+        .then((response) => response.json())
+        .then((data) => new VectorPlayer(canvas, data));
+    }
+
+    reset() {
+      this.shapes = new Map(); // Number -> state
+      this.order = [];
+      this.next = 0; // Index of the first step not started
+      this.active = null; // Step started and not finished
+      this.advancedTo = 0;
+    }
+
+    apply(change) {
+      if (!change) {
+        return;
+      }
+      for (const [number, state] of Object.entries(change.set || {})) {
+        this.shapes.set(Number(number), Object.assign({}, this.shapes.get(Number(number)), state));
+      }
+      for (const number of change.remove || []) {
+        this.shapes.delete(number);
+      }
+      if (change.order) {
+        this.order = change.order;
+      }
+    }
+
+    // Bring the shapes to their state at this.time
+    advance() {
+      if (this.time < this.advancedTo) {
+        this.reset(); // Steps only go forwards: replay them from the start
+      }
+      this.advancedTo = this.time;
+      for (;;) {
+        if (this.active) {
+          if (this.time < this.active.t + this.active.d) {
+            return;
+          }
+          this.apply(this.active.end);
+          this.active = null;
+        }
+        const step = this.data.steps[this.next];
+        if (!step || this.time < step.t) {
+          return;
+        }
+        this.apply(step);
+        this.active = step;
+        this.next += 1;
+      }
+    }
+
+    points(state) {
+      if (!state.path) {
+        return [];
+      }
+      const [index, x, y] = state.path;
+      const offsetX = x / this.data.quantum, offsetY = y / this.data.quantum;
+      return this.paths[index].map((value, i) => value + (i % 2 === 0 ? offsetX : offsetY));
+    }
+
+    // Shapes of the active step as they are drawn at this.time
+    animatedShapes() {
+      const animated = new Map();
+      const step = this.active;
+      if (!step || !step.tweens) {
+        return animated;
+      }
+      const alpha = step.d > 0 ? (this.time - step.t) / step.d : 1;
+      for (const tween of step.tweens) {
+        const count = tween.shapes.length;
+        const lag = tween.lag || 0;
+        const fullLength = (count - 1) * lag + 1;
+        tween.shapes.forEach((number, i) => {
+          const state = this.shapes.get(number);
+          if (!state) {
+            return;
+          }
+          const sub = tween.rateFunction(Math.min(Math.max(alpha * fullLength - i * lag, 0), 1));
+          animated.set(number, this.tweened(tween, i, state, sub));
+        });
+      }
+      return animated;
+    }
+
+    tweened(tween, i, state, sub) {
+      const shape = { points: this.points(state), fill: state.fill, stroke: state.stroke, width: state.width };
+      if (tween.kind === "create") {
+        shape.points = partialPoints(shape.points, sub);
+        return shape;
+      }
+      if (tween.kind === "write") {
+        // Draw the outline during the first half, then fill it
+        const [r, g, b, alpha, width] = tween.outline[i];
+        const outline = {
+          points: shape.points, fill: state.fill.slice(0, 3).concat([0]), stroke: [r, g, b, alpha], width: width,
+        };
+        if (sub < 0.5) {
+          outline.points = partialPoints(shape.points, 2 * sub);
+          return outline;
+        }
+        return this.interpolated(outline, shape, 2 * sub - 1);
+      }
+      const target = tween.to[i];
+      return this.interpolated(shape, {
+        points: this.points(target), fill: target.fill, stroke: target.stroke, width: target.width,
+      }, sub);
+    }
+
+    interpolated(from, to, t) {
+      return {
+        points: from.points.length === to.points.length ? lerpArray(from.points, to.points, t) : (t < 1 ? from : to).points,
+        fill: lerpArray(from.fill, to.fill, t),
+        stroke: lerpArray(from.stroke, to.stroke, t),
+        width: lerp(from.width, to.width, t),
+      };
+    }
+
+    // ========== DRAWING ==========
+    draw() {
+      const { canvas, context, data } = this;
+      const [frameWidth, frameHeight] = data.frame;
+      context.setTransform(1, 0, 0, 1, 0, 0);
+      context.fillStyle = data.background;
+      context.fillRect(0, 0, canvas.width, canvas.height);
+      const scale = Math.min(canvas.width / frameWidth, canvas.height / frameHeight);
+      context.setTransform(scale, 0, 0, -scale, canvas.width / 2, canvas.height / 2);
+      const animated = this.animatedShapes();
+      for (const number of this.order) {
+        const state = this.shapes.get(number);
+        if (!state) {
+          continue;
+        }
+        const shape = animated.get(number) || {
+          points: this.points(state), fill: state.fill, stroke: state.stroke, width: state.width,
+        };
+        this.drawShape(shape);
+      }
+    }
+
+    drawShape({ points, fill, stroke, width }) {
+      if (points.length < 8) {
+        return;
+      }
+      const { context } = this;
+      context.beginPath();
+      let startX = 0, startY = 0;
+      for (let i = 0; i < points.length; i += 8) {
+        const continues = i > 0 && Math.abs(points[i] - points[i - 2]) < EPSILON && Math.abs(points[i + 1] - points[i - 1]) < EPSILON;
+        if (!continues) {
+          if (i > 0 && Math.abs(points[i - 2] - startX) < EPSILON && Math.abs(points[i - 1] - startY) < EPSILON) {
+            context.closePath();
+          }
+          startX = points[i];
+          startY = points[i + 1];
+          context.moveTo(startX, startY);
+        }
+        context.bezierCurveTo(points[i + 2], points[i + 3], points[i + 4], points[i + 5], points[i + 6], points[i + 7]);
+      }
+      const last = points.length;
+      if (Math.abs(points[last - 2] - startX) < EPSILON && Math.abs(points[last - 1] - startY) < EPSILON) {
+        context.closePath();
+      }
+      if (fill[3] > 0) {
+        context.fillStyle = cssColor(fill);
+        context.fill("nonzero");
+      }
+      if (width > 0 && stroke[3] > 0) {
+        context.strokeStyle = cssColor(stroke);
+        context.lineWidth = width * LINE_WIDTH_MULTIPLE;
+        context.stroke();
+      }
+    }
+
+    // ========== CONTROLS ==========
+    play() {
+      if (this.playing) {
+        return;
+      }
+      if (this.time >= this.duration) {
+        this.seek(0);
+      }
+      this.playing = true;
+      let previous = null;
+      const frame = (now) => {
+        if (!this.playing) {
+          return;
+        }
+        if (previous !== null) {
+          this.time = Math.min(this.time + (now - previous) / 1000, this.duration);
+        }
+        previous = now;
+        this.advance();
+        this.draw();
+        if (this.time >= this.duration) {
+          this.playing = false;
+          return;
+        }
+        requestAnimationFrame(frame);
+      };
+      requestAnimationFrame(frame);
+    }
+
+    pause() {
+      this.playing = false;
+    }
+
+    seek(time) {
+      this.time = Math.min(Math.max(time, 0), this.duration);
+      this.advance();
+      this.draw();
+    }
+  }
+
+  global.VectorPlayer = VectorPlayer;
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,317 @@
+"""
+Check numerically that the pieces of every construction fit together.
+
+The proofs rely on geometric facts that the scenes never check while
+drawing: the four triangles and the tilted square of
+``PythagoreanTheorem`` fill the outer square, the four pieces of
+``SumSquare`` fill the (a + b)² square, and the (p/2)² square of
+``QuadraticFormula`` closes the L made by the x² square and the two halves
+of the p·x rectangle. This tool builds the constructions with the same
+geometry functions the scenes use (``pythagorean_geometry``,
+``sum_square_geometry``, ``completing_square_geometry``), whose corners
+and boxes the scenes draw their pieces through, for thousands of random
+parameter sets at once plus the class parameters the scenes render by
+default, and checks for each of them:
+
+- the shape of the pieces (right angles, side lengths, aligned edges);
+- that the areas of the pieces add up to the area of the big square;
+- that every piece lies inside the big square;
+- that random points of the big square are covered by exactly one piece,
+  so that the pieces neither overlap nor leave gaps.
+
+Every check is a NumPy operation over all the parameter sets, and nothing
+is rendered: 10 000 sets per construction take about two seconds in all
+once manim is imported. The exit status is 1 if any check fails, so it can
+run on every commit.
+
+Usage::
+
+    python -m tools.verify_geometry
+    python -m tools.verify_geometry -n 100000 --seed 7 --json geometry.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .scenes import SRC_DIR, load_module
+
+DEFAULT_SAMPLES = 10_000
+POINTS_PER_SAMPLE = 64  # Points of the big square tested for coverage
+# Parameter sets tested for coverage at a time: the test takes memory
+# proportional to sets x points x pieces x corners
+COVERAGE_CHUNK = 1000
+# Lengths are drawn log-uniformly in this range, far beyond what fits on screen
+LENGTH_RANGE = (0.05, 20.0)
+CONSTANT_RANGE = (-50.0, 50.0)  # c of the quadratic equation
+TOLERANCE = 1e-9  # Relative to the size of the construction
+
+
+# ========== POLYGONS ==========
+def polygon_areas(vertices):
+    """Signed areas (positive counterclockwise) of the polygons in (..., k, 2|3) ``vertices``."""
+    x, y = vertices[..., 0], vertices[..., 1]
+    return (np.sum(x * np.roll(y, -1, axis=-1) - np.roll(x, -1, axis=-1) * y, axis=-1)) / 2
+
+
+def box_polygons(boxes):
+    """Counterclockwise corners (..., 4, 2) of the boxes (..., 2, 2) given by two opposite corners."""
+    (x_min, y_min), (x_max, y_max) = np.moveaxis(boxes, (-2, -1), (0, 1))
+    return np.stack([
+        np.stack([x_min, y_min], axis=-1), np.stack([x_max, y_min], axis=-1),
+        np.stack([x_max, y_max], axis=-1), np.stack([x_min, y_max], axis=-1),
+    ], axis=-2)
+
+
+def side_lengths(vertices):
+    """Length of every side of the polygons in ``vertices``, side i going from vertex i to i + 1."""
+    return np.linalg.norm(np.roll(vertices, -1, axis=-2) - vertices, axis=-1)
+
+
+def inside_convex(points, polygons):
+    """
+    Whether each of the (n, m, 2) ``points`` lies inside each of the
+    (n, P, k, 2|3) convex ``polygons`` of its parameter set: (n, m, P).
+    Computed ``COVERAGE_CHUNK`` parameter sets at a time.
+    """
+    polygons = polygons[..., :2]
+    inside = np.empty(points.shape[:2] + polygons.shape[1:2], dtype=bool)
+    for start in range(0, len(points), COVERAGE_CHUNK):
+        chunk = slice(start, start + COVERAGE_CHUNK)
+        corners = polygons[chunk]
+        edges = np.roll(corners, -1, axis=-2) - corners  # (n, P, k, 2)
+        offsets = points[chunk, :, None, None, :] - corners[:, None]  # (n, m, P, k, 2)
+        cross = edges[:, None, ..., 0] * offsets[..., 1] - edges[:, None, ..., 1] * offsets[..., 0]
+        orientation = np.sign(polygon_areas(corners))[:, None, :, None]
+        inside[chunk] = np.all(cross * orientation >= 0, axis=-1)
+    return inside
+
+
+def coverage(points, *groups):
+    """How many pieces, over all the groups of polygons, cover each point: (n, m)."""
+    return sum(inside_convex(points, polygons).sum(axis=-1) for polygons in groups)
+
+
+def contained(polygons, outer_boxes, tolerance):
+    """Whether all vertices of the (n, P, k, 2|3) ``polygons`` lie in the (n, 2, 2) boxes: (n,)."""
+    xy = polygons[..., :2]
+    low = outer_boxes[:, None, None, 0] - tolerance[:, None, None, None]
+    high = outer_boxes[:, None, None, 1] + tolerance[:, None, None, None]
+    return np.all((xy >= low) & (xy <= high), axis=(1, 2, 3))
+
+
+def points_in_boxes(rng, boxes, count):
+    """``count`` uniform random points in each of the (n, 2, 2) boxes: (n, count, 2)."""
+    fractions = rng.random((len(boxes), count, 2))
+    return boxes[:, None, 0] + fractions * (boxes[:, None, 1] - boxes[:, None, 0])
+
+
+def close(values, expected, tolerance):
+    """Elementwise ``|values - expected| <= tolerance``, reduced over all but the first axis."""
+    difference = np.abs(np.asarray(values) - np.asarray(expected))
+    tolerance = np.reshape(tolerance, (-1,) + (1,) * (difference.ndim - 1))
+    return np.all(difference <= tolerance, axis=tuple(range(1, difference.ndim)))
+
+
+# ========== PARAMETERS ==========
+def random_lengths(rng, shape):
+    low, high = np.log(LENGTH_RANGE)
+    return np.exp(rng.uniform(low, high, shape))
+
+
+def scene_default(module, scene_name, attribute):
+    """A parameter of a scene as it is rendered by default."""
+    return np.asarray(getattr(getattr(module, scene_name), attribute), dtype=float)
+
+
+# ========== CONSTRUCTIONS ==========
+def check_pythagorean(module, rng, samples):
+    legs = np.concatenate([
+        scene_default(module, "PythagoreanTheorem", "LEGS").reshape(-1, 2),
+        random_lengths(rng, (samples, 2)),
+    ])
+    geometry = module.pythagorean_geometry(legs)
+    a, b = legs[:, 0], legs[:, 1]
+    side, c = geometry["outer_side"], geometry["hypotenuse"]
+    tolerance = TOLERANCE * side
+    # The scene draws the squares through these corners
+    triangles, central, outer_square = geometry["triangles"], geometry["central_square"], geometry["outer_square"]
+    outer = np.stack([-side / 2, -side / 2, side / 2, side / 2], axis=1).reshape(-1, 2, 2)
+
+    # Right angle first, then the ends of the legs
+    legs_from_right_angle = triangles[:, :, 1:] - triangles[:, :, :1]
+    dot = np.sum(legs_from_right_angle[:, :, 0] * legs_from_right_angle[:, :, 1], axis=-1)
+    triangle_sides = np.sort(side_lengths(triangles), axis=-1)
+    expected_sides = np.sort(np.stack([a, b, c], axis=1), axis=1)[:, None, :]
+    central_sides = side_lengths(central)
+    diagonals = np.linalg.norm(central[:, 2] - central[:, 0], axis=-1), np.linalg.norm(central[:, 3] - central[:, 1], axis=-1)
+    areas = np.abs(polygon_areas(triangles)).sum(axis=1) + np.abs(polygon_areas(central))
+    points = points_in_boxes(rng, outer, POINTS_PER_SAMPLE)
+    return legs, {
+        "outer square (a + b)² centred": close(outer_square[..., :2], box_polygons(outer), tolerance),
+        "right angles": close(dot, 0, tolerance * side),
+        "triangle sides a, b, c": close(triangle_sides, expected_sides, tolerance),
+        "central square side c": close(central_sides, c[:, None], tolerance),
+        "central square diagonals": close(diagonals[0] - diagonals[1], 0, tolerance),
+        "areas add up to (a + b)²": close(areas, side ** 2, tolerance * side),
+        "pieces inside the square": contained(triangles, outer, tolerance) & contained(central[:, None], outer, tolerance),
+        "pieces tile the square": np.all(coverage(points, triangles, central[:, None]) == 1, axis=1)
+        & np.all(coverage(points, outer_square[:, None]) == 1, axis=1),
+    }
+
+
+def check_sum_square(module, rng, samples):
+    lengths = np.concatenate([
+        scene_default(module, "SumSquare", "LENGTHS").reshape(1, 2),
+        random_lengths(rng, (samples, 2)),
+    ])
+    geometry = module.sum_square_geometry(lengths)
+    a, b = lengths[:, 0], lengths[:, 1]
+    side, outer, boxes = geometry["side"], geometry["outer"], geometry["boxes"]
+    tolerance = TOLERANCE * side
+    expected_sizes = np.stack([
+        np.stack([a, a], axis=1), np.stack([b, b], axis=1),
+        np.stack([b, a], axis=1), np.stack([a, b], axis=1),
+    ], axis=1)
+    pieces = box_polygons(boxes)
+    areas = np.abs(polygon_areas(pieces)).sum(axis=1)
+    points = points_in_boxes(rng, outer, POINTS_PER_SAMPLE)
+    return lengths, {
+        "pieces a², b², ab, ab": close(boxes[:, :, 1] - boxes[:, :, 0], expected_sizes, tolerance),
+        "centres match the pieces": close(geometry["centers"][..., :2], boxes.mean(axis=2), tolerance),
+        "areas add up to (a + b)²": close(areas, side ** 2, tolerance * side),
+        "pieces inside the square": contained(pieces, outer, tolerance),
+        "pieces tile the square": np.all(coverage(points, pieces) == 1, axis=1),
+    }
+
+
+def check_completing_square(module, rng, samples):
+    default = scene_default(module, "QuadraticFormula", "COEFFICIENTS").reshape(1, 3)
+    random = np.column_stack([
+        random_lengths(rng, samples), random_lengths(rng, samples), rng.uniform(*CONSTANT_RANGE, samples),
+    ])
+    coefficients = np.concatenate([default, random])
+    geometry = module.completing_square_geometry(*coefficients.T)
+    boxes = geometry["boxes"]
+    unit, half = geometry["unit"], geometry["half_width"]
+    completed = boxes["completed_square"]
+    side = unit + half
+    tolerance = TOLERANCE * side
+
+    def edges(name):
+        return boxes[name].reshape(-1, 4)  # x_min, y_min, x_max, y_max
+
+    x_squared, right, moved, top, completing, px = (
+        edges(name) for name in
+        ("x_squared", "right_half", "moved_half", "top_half", "completing_square", "px_rectangle")
+    )
+    pieces = box_polygons(np.stack([boxes[name] for name in
+                                    ("x_squared", "right_half", "top_half", "completing_square")], axis=1))
+    areas = np.abs(polygon_areas(pieces)).sum(axis=1)
+    points = points_in_boxes(rng, completed, POINTS_PER_SAMPLE)
+    frame = module.MAX_FIGURE_WIDTH, module.MAX_FIGURE_HEIGHT
+    return coefficients, {
+        "halves split p·x": close(np.stack([right[:, 0], right[:, 2], moved[:, 2]], axis=1),
+                                  np.stack([px[:, 0], moved[:, 0], px[:, 2]], axis=1), tolerance)
+        & close(right[:, 2] - right[:, 0], moved[:, 2] - moved[:, 0], tolerance),
+        "moved half on top of x²": close(np.stack([top[:, 0], top[:, 1], top[:, 2], top[:, 3] - top[:, 1]], axis=1),
+                                         np.stack([x_squared[:, 0], x_squared[:, 3], x_squared[:, 2], half], axis=1),
+                                         tolerance),
+        "(p/2)² square aligned": close(np.stack([completing[:, 0], completing[:, 2], completing[:, 1], completing[:, 3]], axis=1),
+                                       np.stack([right[:, 0], right[:, 2], top[:, 1], top[:, 3]], axis=1), tolerance),
+        "areas add up to (x + p/2)²": close(areas, side ** 2, tolerance * side),
+        "pieces tile the square": np.all(coverage(points, pieces) == 1, axis=1),
+        "construction fits its frame": (completed[:, 1, 0] <= frame[0] + tolerance)
+        & (px[:, 2] <= frame[0] + tolerance) & (completed[:, 1, 1] <= frame[1] + tolerance),
+    }
+
+
+# Construction name, scene file and check
+CONSTRUCTIONS = [
+    ("PythagoreanTheorem", "pythagorean_theorem.py", check_pythagorean),
+    ("SumSquare", "algebraic_identities.py", check_sum_square),
+    ("QuadraticFormula", "quadratic_equation.py", check_completing_square),
+]
+
+
+# ========== ENTRY POINT ==========
+def verify(samples, seed, src_dir=SRC_DIR):
+    """Run every check; returns one record per construction and check."""
+    rng = np.random.default_rng(seed)
+    records = []
+    for name, file_name, check in CONSTRUCTIONS:
+        module = load_module(Path(src_dir) / file_name)
+        start = time.perf_counter()
+        parameters, results = check(module, rng, samples)
+        elapsed = time.perf_counter() - start
+        for check_name, passed in results.items():
+            failed = np.flatnonzero(~passed)
+            records.append({
+                "construction": name,
+                "check": check_name,
+                "parameter_sets": len(passed),
+                "failed": len(failed),
+                "first_failure": parameters[failed[0]].tolist() if len(failed) else None,
+                "time": elapsed,
+            })
+    return records
+
+
+def format_report(records):
+    header = f"{'Construction':<20} {'Check':<30} {'Failed':>16} {'Time (s)':>9}"
+    lines = [header, "-" * len(header)]
+    for record in records:
+        failed = f"{record['failed']} / {record['parameter_sets']}"
+        lines.append(f"{record['construction']:<20} {record['check']:<30} {failed:>16} {record['time']:>9.3f}")
+        if record["first_failure"] is not None:
+            lines.append(f"    first failure: {record['first_failure']}")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.verify_geometry",
+        description="Check numerically that the pieces of every construction fit together.",
+    )
+    parser.add_argument(
+        "-n", "--samples", type=int, default=DEFAULT_SAMPLES,
+        help=f"Random parameter sets per construction (default: {DEFAULT_SAMPLES})",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="Seed of the random parameters (default: 0)",
+    )
+    parser.add_argument(
+        "--json", metavar="PATH",
+        help="Also write the report to this JSON file",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.samples < 1:
+        print("--samples must be at least 1", file=sys.stderr)
+        return 2
+    start = time.perf_counter()
+    records = verify(args.samples, args.seed)
+    total_time = time.perf_counter() - start
+    print(format_report(records))
+    failed = sum(record["failed"] > 0 for record in records)
+    print(f"\n{len(records) - failed} of {len(records)} checks passed in {total_time:.1f} s")
+
+    if args.json:
+        report = {"samples": args.samples, "seed": args.seed, "checks": records}
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())